@@ -1,4 +1,5 @@
 from django.apps import AppConfig as DjangoApponfig
+from django.conf import settings
 from edc_odk.apps import AppConfig as BaseEdcOdkAppConfig
 from edc_senaite_interface.apps import AppConfig as BaseEdcSenaiteInterfaceAppConfig
 from edc_visit_tracking.apps import AppConfig as BaseEdcVisitTrackingAppConfig
@@ -8,6 +9,20 @@ class AppConfig(DjangoApponfig):
     name = 'flourish_form_validations'
     verbose_name = 'Flourish Form Validations'
 
+    def ready(self):
+        from .form_validators.child_dataset_index import child_dataset_index
+        from .form_validators.maternal_hiv_status import maternal_hiv_status
+        from .form_validators.offstudy_status import offstudy_status
+        maternal_hiv_status.watch_models()
+        offstudy_status.watch_models()
+        child_dataset_index.watch_models()
+        if getattr(settings, 'FORM_VALIDATOR_PROFILING', False):
+            from .profiling import install
+            install()
+        if getattr(settings, 'FORM_VALIDATOR_WARMUP', False):
+            from .warmup import warmup
+            warmup()
+
 
 class EdcVisitTrackingAppConfig(BaseEdcVisitTrackingAppConfig):
     visit_models = {
@@ -0,0 +1,6 @@
+"""Benchmarks for the form validators, run against the test models.
+
+    python -m flourish_form_validations.benchmarks --output results.json
+    python -m flourish_form_validations.benchmarks --compare base.json head.json
+    python -m flourish_form_validations.benchmarks --import-time --runs 5
+"""
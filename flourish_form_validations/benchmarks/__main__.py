@@ -0,0 +1,64 @@
+import argparse
+import os
+import sys
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog='python -m flourish_form_validations.benchmarks',
+        description='Times validate() for each form validator.')
+    parser.add_argument('validators', nargs='*',
+                        help='validator class names, defaults to all')
+    parser.add_argument('--runs', type=int, default=50)
+    parser.add_argument('--warmup', type=int, default=5)
+    parser.add_argument('--output', help='write the results as JSON')
+    parser.add_argument('--compare', nargs=2, metavar=('BASE', 'HEAD'),
+                        help='compare two JSON result files')
+    parser.add_argument('--import-time', action='store_true',
+                        help='measure the cold import of the validators '
+                             'instead of validate()')
+    options = parser.parse_args(argv)
+
+    if options.import_time:
+        from . import import_time
+
+        results = import_time.run(names=options.validators, runs=options.runs)
+        sys.stdout.write(import_time.format_table(results) + '\n')
+        return
+
+    os.environ.setdefault(
+        'DJANGO_SETTINGS_MODULE', 'flourish_form_validations.settings')
+
+    import django
+    django.setup()
+
+    from . import runner
+
+    if options.compare:
+        for row in runner.compare(*options.compare):
+            sys.stdout.write(
+                f'{row["validator"]:<45} {row["payload"]:<8} '
+                f'{row["median_ms"][0]:>9.3f} -> {row["median_ms"][1]:>9.3f} ms '
+                f'({row["median_change"] or 0:+.1%})  '
+                f'queries {row["queries"][0]} -> {row["queries"][1]}\n')
+        return
+
+    from django.db import connection
+
+    old_name = connection.settings_dict['NAME']
+    connection.creation.create_test_db(
+        verbosity=0, autoclobber=True, serialize=False)
+    try:
+        results = runner.run(
+            names=options.validators, runs=options.runs, warmup=options.warmup)
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0)
+
+    sys.stdout.write(runner.format_table(results) + '\n')
+    if options.output:
+        with open(options.output, 'w') as f:
+            f.write(runner.to_json(results))
+
+
+if __name__ == '__main__':
+    main()
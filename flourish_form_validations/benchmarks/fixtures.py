@@ -0,0 +1,122 @@
+from collections import namedtuple
+
+from dateutil.relativedelta import relativedelta
+from edc_base.utils import get_utcnow
+from edc_constants.constants import YES, NO, NEG, NOT_APPLICABLE
+
+from ..tests.models import (
+    AntenatalEnrollment, Appointment, ArvsPrePregnancy, CaregiverLocator,
+    ChildDataset, FlourishConsentVersion, ListModel, MaternalArv,
+    MaternalArvDuringPreg, MaternalDataset, MaternalVisit, SubjectConsent,
+    UltraSound)
+
+Fixtures = namedtuple(
+    'Fixtures',
+    ['now', 'subject_identifier', 'screening_identifier', 'subject_consent',
+     'maternal_visit', 'antenatal_enrollment', 'ultrasound',
+     'arvs_pre_pregnancy', 'maternal_arv', 'child_dataset', 'list_models'])
+
+SUBJECT_IDENTIFIER = 'B142-040990001-2'
+SCREENING_IDENTIFIER = 'S9WXY4D2'
+
+LIST_MODEL_SHORT_NAMES = [
+    'mhist_na', 'mhist_other', 'mmed_na', 'mmed_none', 'mmed_other',
+    'who_na', 'mdiag_na', 'prior_arv_na', 'prior_arv_specify',
+    'delivery_comp_none', 'delivery_comp_other', 'refer_other',
+    'c19m_iso_nosympt', 'c19m_14d_nosympt', 'OTHER']
+
+
+def build_fixtures(visit_count=None):
+    """Creates a consented caregiver with a visit history, antenatal
+    enrollment, ultrasound, ARV rows, datasets and list model choices,
+    and returns them as Fixtures.
+    """
+    now = get_utcnow()
+    visit_count = visit_count or 5
+
+    FlourishConsentVersion.objects.create(
+        screening_identifier=SCREENING_IDENTIFIER, version='2',
+        report_datetime=now - relativedelta(months=6))
+
+    for version, months in [('1', 6), ('2', 3)]:
+        subject_consent = SubjectConsent.objects.create(
+            subject_identifier=SUBJECT_IDENTIFIER,
+            screening_identifier=SCREENING_IDENTIFIER,
+            gender='F', dob=(now - relativedelta(years=28)).date(),
+            consent_datetime=now - relativedelta(months=months),
+            version=version)
+
+    for index in range(visit_count):
+        appointment = Appointment.objects.create(
+            subject_identifier=SUBJECT_IDENTIFIER,
+            appt_datetime=now - relativedelta(weeks=visit_count - index),
+            visit_code=f'{1000 + index}M')
+        maternal_visit = MaternalVisit.objects.create(
+            appointment=appointment,
+            subject_identifier=SUBJECT_IDENTIFIER,
+            report_datetime=now - relativedelta(weeks=visit_count - index))
+
+    # attributes read by validators that the test model does not define
+    maternal_visit.schedule_name = 'a_birth1_schedule1'
+    maternal_visit.require_crfs = YES
+
+    antenatal_enrollment = AntenatalEnrollment.objects.create(
+        subject_identifier=SUBJECT_IDENTIFIER,
+        report_datetime=now - relativedelta(months=3),
+        last_period_date=(now - relativedelta(weeks=20)).date(),
+        current_hiv_status=NEG, week32_test=YES,
+        week32_test_date=(now - relativedelta(months=4)).date(),
+        week32_result=NEG, enrollment_hiv_status=NEG,
+        rapid_test_done=NOT_APPLICABLE)
+
+    ultrasound = UltraSound.objects.create(
+        maternal_visit=maternal_visit, ga_confirmed=20)
+
+    arv_during_preg = MaternalArvDuringPreg.objects.create(
+        took_arv=YES, maternal_visit=maternal_visit,
+        art_start_date=(now - relativedelta(months=2)).date())
+    maternal_arv = MaternalArv.objects.create(
+        maternal_arv_durg_preg=arv_during_preg, arv_code='Tenoforvir',
+        start_date=(now - relativedelta(months=2)).date())
+
+    arvs_pre_pregnancy = ArvsPrePregnancy.objects.create(
+        maternal_visit=maternal_visit, preg_on_art=NO)
+
+    CaregiverLocator.objects.create(
+        subject_identifier=SUBJECT_IDENTIFIER,
+        screening_identifier=SCREENING_IDENTIFIER,
+        report_datetime=now - relativedelta(months=3),
+        may_call=YES, may_visit_home=YES)
+
+    MaternalDataset.objects.create(
+        screening_identifier=SCREENING_IDENTIFIER,
+        study_child_identifier='066-1234-5',
+        study_maternal_identifier='066-1234-0',
+        delivdt=(now - relativedelta(years=8)).date())
+
+    child_dataset = ChildDataset.objects.create(
+        study_child_identifier='066-1234-5',
+        dob=(now - relativedelta(years=8)).date(),
+        infant_sex='Female')
+
+    list_models = {
+        short_name: ListModel.objects.create(
+            name=short_name, short_name=short_name)
+        for short_name in LIST_MODEL_SHORT_NAMES}
+
+    return Fixtures(
+        now=now,
+        subject_identifier=SUBJECT_IDENTIFIER,
+        screening_identifier=SCREENING_IDENTIFIER,
+        subject_consent=subject_consent,
+        maternal_visit=maternal_visit,
+        antenatal_enrollment=antenatal_enrollment,
+        ultrasound=ultrasound,
+        arvs_pre_pregnancy=arvs_pre_pregnancy,
+        maternal_arv=maternal_arv,
+        child_dataset=child_dataset,
+        list_models=list_models)
+
+
+def list_choices(*short_names):
+    return ListModel.objects.filter(short_name__in=short_names)
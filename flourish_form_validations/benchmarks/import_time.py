@@ -0,0 +1,83 @@
+"""Measures the cold start cost of importing validators: the wall time
+and resident memory added by the import, each in a fresh interpreter
+after django.setup(), and whether the modules that are only needed
+for off study checks were loaded.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+from collections import namedtuple
+
+ImportResult = namedtuple(
+    'ImportResult',
+    ['label', 'runs', 'median_ms', 'rss_kb', 'modules', 'deferred_loaded'])
+
+# loaded on the first off study status lookup, not on import
+DEFERRED_MODULES = [
+    'edc_action_item.site_action_items',
+    'flourish_prn.action_items',
+]
+
+PROBE = """
+import json, resource, sys, time
+import django
+django.setup()
+names, deferred = json.loads(sys.argv[1]), json.loads(sys.argv[2])
+modules = len(sys.modules)
+rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+start = time.perf_counter()
+from flourish_form_validations import form_validators
+for name in (names or form_validators.__all__):
+    getattr(form_validators, name)
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    'ms': elapsed * 1000,
+    'rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss,
+    'modules': len(sys.modules) - modules,
+    'deferred_loaded': len([m for m in deferred if m in sys.modules])}))
+"""
+
+
+def probe(names):
+    env = dict(os.environ)
+    env.setdefault('DJANGO_SETTINGS_MODULE', 'flourish_form_validations.settings')
+    output = subprocess.run(
+        [sys.executable, '-c', PROBE, json.dumps(names),
+         json.dumps(DEFERRED_MODULES)],
+        env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def measure(label, names, runs=5):
+    """Returns an ImportResult for importing `names` (all exported
+    validators if empty), the median over `runs` fresh interpreters.
+    """
+    samples = [probe(names) for _ in range(runs)]
+    return ImportResult(
+        label=label, runs=runs,
+        median_ms=statistics.median(s['ms'] for s in samples),
+        rss_kb=statistics.median(s['rss_kb'] for s in samples),
+        modules=statistics.median(s['modules'] for s in samples),
+        deferred_loaded=max(s['deferred_loaded'] for s in samples))
+
+
+def run(names=None, runs=5):
+    """Compares importing the given validators with importing all of
+    them, which is what every import cost before loading was lazy.
+    """
+    names = names or ['UltrasoundFormValidator']
+    return [measure(', '.join(names), names, runs=runs),
+            measure('all validators', [], runs=runs)]
+
+
+def format_table(results):
+    lines = [f'{"import":<45} {"median ms":>10} {"rss kB":>8} {"modules":>8} '
+             f'{"deferred loaded":>16}']
+    for result in results:
+        lines.append(
+            f'{result.label:<45} {result.median_ms:>10.1f} '
+            f'{result.rss_kb:>8.0f} {result.modules:>8.0f} '
+            f'{f"{result.deferred_loaded}/{len(DEFERRED_MODULES)}":>16}')
+    return '\n'.join(lines)
@@ -0,0 +1,301 @@
+"""A valid and an invalid cleaned_data for each exported validator.
+
+Most CRF rules follow a trigger -> dependent field shape, so the
+payloads for those validators come from TRIGGERS: the valid payload
+answers the trigger with a non-triggering value, the invalid payload
+answers it with the triggering value and leaves the dependent field
+empty. Validators that need more context are listed in BUILDERS.
+"""
+from dateutil.relativedelta import relativedelta
+from edc_constants.constants import (
+    YES, NO, NOT_APPLICABLE, OTHER, NEG, FEMALE)
+
+from .fixtures import list_choices
+
+# validator name: (trigger field, triggering value, non-triggering
+# value, dependent field)
+TRIGGERS = {
+    'AntenatalEnrollmentFormValidator': (
+        'knows_lmp', YES, NO, 'last_period_date'),
+    'BreastFeedingQuestionnaireFormValidator': (
+        'six_months_feeding', YES, NO, 'infant_feeding_reasons'),
+    'CaregiverContactFormValidator': (
+        'call_rescheduled', YES, NO, 'reason_rescheduled'),
+    'CaregiverReferralFormValidator': (
+        'referred_to', OTHER, 'hospital', 'referred_to_other'),
+    'FoodSecurityQuestionnaireFormValidator': (
+        'cut_meals', YES, NO, 'how_often'),
+    'HIVDisclosureStatusFormValidator': (
+        'reason_not_disclosed', OTHER, 'fear', 'reason_not_disclosed_other'),
+    'HIVRapidTestCounselingFormValidator': (
+        'rapid_test_done', YES, NO, 'result_date'),
+    'HivViralLoadCd4FormValidator': (
+        'last_vl_known', YES, NO, 'last_vl_date'),
+    'InPersonContactAttemptFormValidator': (
+        'phy_addr_unsuc', OTHER, 'no_one_home', 'phy_addr_unsuc_other'),
+    'MaternalArvDuringPregFormValidator': (
+        'is_interrupt', YES, NO, 'interrupt'),
+    'MaternalHivInterimHxFormValidator': (
+        'has_vl', YES, NO, 'vl_date'),
+    'MaternalIterimIdccFormValidator': (
+        'info_since_lastvisit', YES, NO, 'recent_cd4'),
+    'ScreeningPriorBhpParticipantsFormValidator': (
+        'flourish_participation', NO, 'interested', 'reason_not_to_participate'),
+    'SubstanceUseDuringPregFormValidator': (
+        'smoked_during_preg', YES, NO, 'smoking_during_preg_freq'),
+    'SubstanceUsePriorFormValidator': (
+        'smoked_prior_to_preg', YES, NO, 'smoking_prior_preg_freq'),
+    'TbHistoryPregFormValidator': (
+        'history_of_tbt', YES, NO, 'tbt_completed'),
+    'TbPresenceHouseholdMembersFormValidator': (
+        'tb_diagnosed', YES, NO, 'tb_ind_rel'),
+    'TbReferralFormValidator': (
+        'referral_clinic', OTHER, 'clinic', 'referral_clinic_other'),
+    'TbRoutineHealthScreenFormValidator': (
+        'screen_location', OTHER, 'clinic', 'screen_location_other'),
+    'TbScreenPregFormValidator': (
+        'tb_screened', YES, NO, 'where_screened'),
+    'TbStudyEligibilityFormValidator': (
+        'tb_participation', NO, YES, 'reasons_not_participating'),
+    'TbVisitScreeningWomenFormValidator': (
+        'have_cough', YES, NO, 'cough_duration'),
+    'Covid19FormValidator': (
+        'test_for_covid', YES, NO, 'date_of_test'),
+}
+
+# validators whose payloads carry subject_identifier rather than a visit
+NON_CRF = [
+    'CaregiverContactFormValidator',
+    'InPersonContactAttemptFormValidator',
+    'ScreeningPriorBhpParticipantsFormValidator',
+    'TbStudyEligibilityFormValidator',
+    'Covid19FormValidator',
+]
+
+
+def crf_base(fixtures):
+    return {
+        'maternal_visit': fixtures.maternal_visit,
+        'report_datetime': fixtures.now,
+    }
+
+
+def non_crf_base(fixtures):
+    return {
+        'subject_identifier': fixtures.subject_identifier,
+        'screening_identifier': fixtures.screening_identifier,
+        'report_datetime': fixtures.now,
+    }
+
+
+def trigger_payloads(name, fixtures):
+    field, triggering, non_triggering, dependent = TRIGGERS[name]
+    base = non_crf_base(fixtures) if name in NON_CRF else crf_base(fixtures)
+    valid = dict(base, **{field: non_triggering, dependent: None})
+    invalid = dict(base, **{field: triggering, dependent: None})
+    return valid, invalid
+
+
+def arvs_pre_pregnancy(fixtures):
+    base = crf_base(fixtures)
+    valid = dict(base, preg_on_art=NO, art_start_date=None,
+                 prior_arv=list_choices('prior_arv_na'))
+    invalid = dict(base, preg_on_art=YES, art_start_date=None,
+                   prior_arv=list_choices('prior_arv_na'))
+    return valid, invalid
+
+
+def caregiver_child_consent(fixtures):
+    base = {
+        'subject_identifier': f'{fixtures.subject_identifier}-10',
+        'study_child_identifier': fixtures.child_dataset.study_child_identifier,
+        'child_dob': fixtures.child_dataset.dob,
+        'gender': FEMALE,
+        'first_name': 'TEST ONE',
+        'last_name': 'TEST',
+        'identity': '234513187',
+        'identity_type': 'birth_cert',
+        'confirm_identity': '234513187',
+        'child_test': NO,
+        'child_remain_in_study': YES,
+        'child_preg_test': NOT_APPLICABLE,
+        'child_knows_status': NOT_APPLICABLE,
+        'consent_datetime': fixtures.now,
+    }
+    invalid = dict(base, confirm_identity='234513188')
+    return base, invalid
+
+
+def caregiver_clinical_measurements(fixtures):
+    base = dict(crf_base(fixtures), height=164.0, weight_kg=65.0,
+                waist_circ=NOT_APPLICABLE, hip_circ=NOT_APPLICABLE,
+                all_measurements=YES, confirm_values=YES)
+    valid = dict(base, systolic_bp=120, diastolic_bp=80)
+    invalid = dict(base, systolic_bp=70, diastolic_bp=80)
+    return valid, invalid
+
+
+def caregiver_locator(fixtures):
+    base = non_crf_base(fixtures)
+    valid = dict(base, may_visit_home=NO, physical_address=None,
+                 may_call=NO, may_call_work=NO)
+    invalid = dict(base, may_visit_home=YES, physical_address=None,
+                   may_call=NO, may_call_work=NO)
+    return valid, invalid
+
+
+def caregiver_prev_enrolled(fixtures):
+    base = dict(crf_base(fixtures),
+                subject_identifier=fixtures.subject_identifier,
+                relation_to_child='biological_mother')
+    valid = dict(base, maternal_prev_enroll=YES, current_hiv_status=NEG)
+    invalid = dict(base, relation_to_child=OTHER, relation_to_child_other=None,
+                   maternal_prev_enroll=YES, current_hiv_status=NEG)
+    return valid, invalid
+
+
+def caregiver_social_work_referral(fixtures):
+    base = crf_base(fixtures)
+    valid = dict(base, referral_reason=list_choices('OTHER'),
+                 reason_other='transport')
+    invalid = dict(base, referral_reason=list_choices('refer_other'),
+                   reason_other=None)
+    return valid, invalid
+
+
+def locator_log_entry(fixtures):
+    base = {'report_datetime': fixtures.now}
+    valid = dict(base, log_status='exists', comment=None)
+    invalid = dict(base, log_status='exists', comment='not needed')
+    return valid, invalid
+
+
+def maternal_delivery(fixtures):
+    base = dict(crf_base(fixtures),
+                subject_identifier=fixtures.subject_identifier,
+                delivery_datetime=fixtures.now - relativedelta(days=1),
+                arv_initiation_date=fixtures.maternal_arv.start_date,
+                valid_regiment_duration=YES,
+                mode_delivery='spontaneous vaginal',
+                delivery_complications=list_choices('delivery_comp_none'),
+                live_infants_to_register=1)
+    valid = dict(base, csection_indication=NOT_APPLICABLE)
+    invalid = dict(base, arv_initiation_date=None)
+    return valid, invalid
+
+
+def maternal_diagnoses(fixtures):
+    base = crf_base(fixtures)
+    valid = dict(base, new_diagnoses=NO, diagnoses=list_choices('mdiag_na'),
+                 has_who_dx=NOT_APPLICABLE, who=list_choices('who_na'))
+    invalid = dict(base, new_diagnoses=YES, diagnoses=list_choices('mdiag_na'),
+                   has_who_dx=NOT_APPLICABLE, who=list_choices('who_na'))
+    return valid, invalid
+
+
+def medical_history(fixtures):
+    base = crf_base(fixtures)
+    valid = dict(base, chronic_since=NO,
+                 caregiver_chronic=list_choices('mhist_na'),
+                 caregiver_medications=list_choices('mmed_none'),
+                 who=list_choices('who_na'))
+    invalid = dict(base, chronic_since=YES,
+                   caregiver_chronic=list_choices('mhist_na'),
+                   caregiver_medications=list_choices('mmed_none'),
+                   who=list_choices('who_na'))
+    return valid, invalid
+
+
+def obsterical_history(fixtures):
+    base = dict(crf_base(fixtures), prev_pregnancies=1, pregs_24wks_or_more=0,
+                lost_before_24wks=0, lost_after_24wks=0,
+                live_children=0, children_died_b4_5yrs=0,
+                children_deliv_before_37wks=0, children_deliv_aftr_37wks=0)
+    valid = dict(base)
+    invalid = dict(base, prev_pregnancies=0, pregs_24wks_or_more=1)
+    return valid, invalid
+
+
+def socio_demographic_data(fixtures):
+    base = dict(crf_base(fixtures), marital_status='single',
+                ethnicity='black_african', current_occupation='housewife',
+                provides_money='partner', money_earned='none',
+                toilet_facility='indoor_toilet', stay_with_child=YES,
+                number_of_household_members=3)
+    invalid = dict(base, marital_status=OTHER, marital_status_other=None)
+    return base, invalid
+
+
+def subject_consent(fixtures):
+    consent = fixtures.subject_consent
+    base = {
+        'subject_identifier': consent.subject_identifier,
+        'screening_identifier': consent.screening_identifier,
+        'consent_datetime': fixtures.now,
+        'dob': consent.dob,
+        'first_name': 'TEST ONE',
+        'last_name': 'TEST',
+        'initials': 'TOT',
+        'gender': consent.gender,
+        'identity': '123425678',
+        'identity_type': 'OMANG',
+        'confirm_identity': '123425678',
+        'recruit_source': 'bhp_prior',
+        'recruitment_clinic': 'PHH',
+        'is_literate': YES,
+        'remain_in_study': YES,
+        'hiv_testing': YES,
+        'breastfeed_intent': YES,
+        'consent_reviewed': YES,
+        'study_questions': YES,
+        'assessment_score': YES,
+        'consent_signature': YES,
+        'consent_copy': YES,
+        'child_consent': NO,
+        'citizen': YES,
+        'version': consent.version,
+    }
+    invalid = dict(base, is_literate=NO, witness_name=None)
+    return base, invalid
+
+
+def ultrasound(fixtures):
+    base = crf_base(fixtures)
+    valid = dict(base, ga_by_ultrasound_wks=35, ga_by_ultrasound_days=2,
+                 est_edd_ultrasound=fixtures.now.date() + relativedelta(days=50))
+    invalid = dict(base, ga_by_ultrasound_wks=45, ga_by_ultrasound_days=9,
+                   est_edd_ultrasound=fixtures.now.date() + relativedelta(weeks=60))
+    return valid, invalid
+
+
+BUILDERS = {
+    'ArvsPrePregnancyFormValidator': arvs_pre_pregnancy,
+    'CaregiverChildConsentFormValidator': caregiver_child_consent,
+    'CaregiverClinicalMeasurementsFormValidator': caregiver_clinical_measurements,
+    'CaregiverLocatorFormValidator': caregiver_locator,
+    'CaregiverPrevEnrolledFormValidator': caregiver_prev_enrolled,
+    'CaregiverSocialWorkReferralFormValidator': caregiver_social_work_referral,
+    'LocatorLogEntryFormValidator': locator_log_entry,
+    'MaternalDeliveryFormValidator': maternal_delivery,
+    'MaternalDiagnosesFormValidator': maternal_diagnoses,
+    'MedicalHistoryFormValidator': medical_history,
+    'ObstericalHistoryFormValidator': obsterical_history,
+    'SocioDemographicDataFormValidator': socio_demographic_data,
+    'SubjectConsentFormValidator': subject_consent,
+    'UltrasoundFormValidator': ultrasound,
+}
+
+
+def payloads_for(name, fixtures):
+    """Returns a dict of {'valid': cleaned_data, 'invalid': cleaned_data}
+    for the named validator.
+    """
+    if name in BUILDERS:
+        valid, invalid = BUILDERS[name](fixtures)
+    else:
+        valid, invalid = trigger_payloads(name, fixtures)
+    return {'valid': valid, 'invalid': invalid}
+
+
+def validator_names():
+    return sorted(list(TRIGGERS) + list(BUILDERS))
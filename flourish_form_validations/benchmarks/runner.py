@@ -0,0 +1,146 @@
+import json
+import statistics
+import time
+from collections import namedtuple
+
+from django.core.exceptions import ValidationError
+from django.db import connection, transaction
+
+from .. import form_validators
+from ..profiling.profiler import QueryCounter
+from ..tests.test_model_mixin import TestModeMixin
+from .fixtures import build_fixtures
+from .payloads import payloads_for, validator_names
+
+BenchmarkResult = namedtuple(
+    'BenchmarkResult',
+    ['validator', 'payload', 'runs', 'median_ms', 'p95_ms', 'queries',
+     'duplicate_queries', 'raised'])
+
+
+# test model labels for *_model attributes TestModeMixin does not set
+# or points at a model the tests app does not define
+MODEL_OVERRIDES = {
+    'prior_screening_model':
+        'flourish_form_validations.screeningpriorbhpparticipants',
+    'bhp_prior_screening_model':
+        'flourish_form_validations.screeningpriorbhpparticipants',
+    'preg_women_screening_model':
+        'flourish_form_validations.screeningpregwomen',
+}
+
+
+class Rollback(Exception):
+    pass
+
+
+def percentile(values, percent):
+    ordered = sorted(values)
+    index = max(0, int(round(percent / 100 * len(ordered))) - 1)
+    return ordered[index]
+
+
+def time_validate(validator_cls, cleaned_data, runs=None):
+    """Runs validate() `runs` times on a fresh validator instance and
+    returns (timings, query counter of the last run, raised).
+
+    `raised` is the ValidationError class name, any other exception
+    class name or None.
+    """
+    timings = []
+    for _ in range(runs):
+        query_counter = QueryCounter()
+        form_validator = validator_cls(cleaned_data=dict(cleaned_data))
+        raised = None
+        start = time.perf_counter()
+        with connection.execute_wrapper(query_counter):
+            try:
+                form_validator.validate()
+            except ValidationError:
+                raised = ValidationError.__name__
+            except Exception as e:
+                raised = e.__class__.__name__
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings, query_counter, raised
+
+
+def run_validator(name, runs=None, warmup=None):
+    """Benchmarks the named validator against its valid and invalid
+    payloads inside a transaction that is rolled back afterwards.
+    """
+    validator_cls = getattr(form_validators, name)
+    TestModeMixin(validator_cls)
+    for attr, label in MODEL_OVERRIDES.items():
+        setattr(validator_cls, attr, label)
+    results = []
+    try:
+        with transaction.atomic():
+            fixtures = build_fixtures()
+            for payload, cleaned_data in payloads_for(name, fixtures).items():
+                time_validate(validator_cls, cleaned_data, runs=warmup)
+                timings, query_counter, raised = time_validate(
+                    validator_cls, cleaned_data, runs=runs)
+                results.append(BenchmarkResult(
+                    validator=name,
+                    payload=payload,
+                    runs=runs,
+                    median_ms=round(statistics.median(timings), 4),
+                    p95_ms=round(percentile(timings, 95), 4),
+                    queries=len(query_counter.queries),
+                    duplicate_queries=query_counter.duplicate_queries,
+                    raised=raised))
+            raise Rollback
+    except Rollback:
+        pass
+    return results
+
+
+def run(names=None, runs=None, warmup=None):
+    runs = runs or 50
+    warmup = 5 if warmup is None else warmup
+    results = []
+    for name in names or validator_names():
+        results.extend(run_validator(name, runs=runs, warmup=warmup))
+    return results
+
+
+def to_json(results):
+    return json.dumps(
+        {'results': [result._asdict() for result in results]}, indent=2)
+
+
+def load(path):
+    with open(path) as f:
+        return {(r['validator'], r['payload']): r
+                for r in json.load(f)['results']}
+
+
+def compare(base_path, head_path):
+    """Returns a row per (validator, payload) found in both files with
+    the change in median latency and query count.
+    """
+    base, head = load(base_path), load(head_path)
+    rows = []
+    for key in sorted(set(base) & set(head)):
+        before, after = base[key], head[key]
+        rows.append({
+            'validator': key[0],
+            'payload': key[1],
+            'median_ms': (before['median_ms'], after['median_ms']),
+            'median_change': (
+                round(after['median_ms'] / before['median_ms'] - 1, 4)
+                if before['median_ms'] else None),
+            'queries': (before['queries'], after['queries']),
+        })
+    return rows
+
+
+def format_table(results):
+    lines = [f'{"validator":<45} {"payload":<8} {"median ms":>10} '
+             f'{"p95 ms":>10} {"queries":>8} {"dups":>5}  raised']
+    for r in results:
+        lines.append(
+            f'{r.validator:<45} {r.payload:<8} {r.median_ms:>10.3f} '
+            f'{r.p95_ms:>10.3f} {r.queries:>8} {r.duplicate_queries:>5}  '
+            f'{r.raised or ""}')
+    return '\n'.join(lines)
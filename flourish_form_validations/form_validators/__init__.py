@@ -1,57 +1,67 @@
-from .antenatal_enrollment_form_validation import \
-    AntenatalEnrollmentFormValidator
-from .arvs_pre_pregnancy_form_validation import ArvsPrePregnancyFormValidator
-from .breastfeeding_questionnaire_form_validator import \
-    BreastFeedingQuestionnaireFormValidator
-# from .caregiver_appointment_form_validator import CaregiverAppointmentFormValidator
-from .caregiver_child_consent_form_validator import \
-    CaregiverChildConsentFormValidator
-from .caregiver_clinical_measurements_form_validator import \
-    CaregiverClinicalMeasurementsFormValidator
-from .caregiver_contact_form_validator import CaregiverContactFormValidator
-from .caregiver_locator_form_validator import CaregiverLocatorFormValidator
-from .caregiver_prev_enrolled_form_validator import \
-    CaregiverPrevEnrolledFormValidator
-from .caregiver_referral_form_validator import CaregiverReferralFormValidator
-from .caregiver_social_work_referral_form import CaregiverSocialWorkReferralFormValidator
-from .covid19_form_validation import Covid19FormValidator
-from .crf_form_validator import FormValidatorMixin
-from .food_security_questionnaire_form_validator import \
-    FoodSecurityQuestionnaireFormValidator
-from .hiv_disclosure_status_form_validator import \
-    HIVDisclosureStatusFormValidator
-from .hiv_rapid_test_counseling_form_validator import \
-    HIVRapidTestCounselingFormValidator
-from .hiv_viralload_cd4_form_validator import HivViralLoadCd4FormValidator
-from .in_person_contact_attempt_form_validator import \
-    InPersonContactAttemptFormValidator
-from .locator_logs_validator import LocatorLogEntryFormValidator
-from .maternal_arv_during_preg_form_validation import \
-    MaternalArvDuringPregFormValidator
-from .maternal_delivery_form_validation import MaternalDeliveryFormValidator
-from .maternal_delivery_form_validation import MaternalDeliveryFormValidator
-from .maternal_diagnoses_form_validation import MaternalDiagnosesFormValidator
-from .maternal_hiv_interim_hx_form_validation import \
-    MaternalHivInterimHxFormValidator
-from .maternal_interim_idcc_form_validation import \
-    MaternalIterimIdccFormValidator
-from .medical_history_form_validation import MedicalHistoryFormValidator
-from .obsterical_history_form_validation import ObstericalHistoryFormValidator
-from .screening_prior_bhp_participants_form_validator import \
-    ScreeningPriorBhpParticipantsFormValidator
-from .socio_demographic_data_form_validator import \
-    SocioDemographicDataFormValidator
-from .subject_consent_form_validation import SubjectConsentFormValidator
-from .substance_use_during_form_validator import \
-    SubstanceUseDuringPregFormValidator
-from .substance_use_prior_form_validator import SubstanceUsePriorFormValidator
-from .tb_history_preg_form_validator import TbHistoryPregFormValidator
-from .tb_presence_household_members_form_validator import \
-    TbPresenceHouseholdMembersFormValidator
-from .tb_referral_form_validator import TbReferralFormValidator
-from .tb_routine_health_screen_form_validator import \
-    TbRoutineHealthScreenFormValidator
-from .tb_screen_preg_form_validator import TbScreenPregFormValidator
-from .tb_study_eligibility_form_validator import TbStudyEligibilityFormValidator
-from .tb_visit_screening_women_form_validator import TbVisitScreeningWomenFormValidator
-from .ultrasound_form_validator import UltrasoundFormValidator
+"""Validator classes are imported on first access so that importing
+one validator does not import all of them and their dependencies.
+
+    from flourish_form_validations.form_validators import UltrasoundFormValidator
+"""
+from importlib import import_module
+
+# public name: submodule defining it
+_exports = {
+    'AntenatalEnrollmentFormValidator': 'antenatal_enrollment_form_validation',
+    'ArvsPrePregnancyFormValidator': 'arvs_pre_pregnancy_form_validation',
+    'validate_many': 'batch_validation',
+    'BreastFeedingQuestionnaireFormValidator': 'breastfeeding_questionnaire_form_validator',
+    # 'CaregiverAppointmentFormValidator': 'caregiver_appointment_form_validator',
+    'CaregiverChildConsentFormValidator': 'caregiver_child_consent_form_validator',
+    'CaregiverClinicalMeasurementsFormValidator': 'caregiver_clinical_measurements_form_validator',
+    'CaregiverContactFormValidator': 'caregiver_contact_form_validator',
+    'CaregiverLocatorFormValidator': 'caregiver_locator_form_validator',
+    'CaregiverPrevEnrolledFormValidator': 'caregiver_prev_enrolled_form_validator',
+    'CaregiverReferralFormValidator': 'caregiver_referral_form_validator',
+    'CaregiverSocialWorkReferralFormValidator': 'caregiver_social_work_referral_form',
+    'Covid19FormValidator': 'covid19_form_validation',
+    'FormValidatorMixin': 'crf_form_validator',
+    'FoodSecurityQuestionnaireFormValidator': 'food_security_questionnaire_form_validator',
+    'HIVDisclosureStatusFormValidator': 'hiv_disclosure_status_form_validator',
+    'HIVRapidTestCounselingFormValidator': 'hiv_rapid_test_counseling_form_validator',
+    'HivViralLoadCd4FormValidator': 'hiv_viralload_cd4_form_validator',
+    'InPersonContactAttemptFormValidator': 'in_person_contact_attempt_form_validator',
+    'LocatorLogEntryFormValidator': 'locator_logs_validator',
+    'MaternalArvDuringPregFormValidator': 'maternal_arv_during_preg_form_validation',
+    'MaternalDeliveryFormValidator': 'maternal_delivery_form_validation',
+    'MaternalDiagnosesFormValidator': 'maternal_diagnoses_form_validation',
+    'MaternalHivInterimHxFormValidator': 'maternal_hiv_interim_hx_form_validation',
+    'MaternalIterimIdccFormValidator': 'maternal_interim_idcc_form_validation',
+    'MedicalHistoryFormValidator': 'medical_history_form_validation',
+    'ObstericalHistoryFormValidator': 'obsterical_history_form_validation',
+    'ScreeningPriorBhpParticipantsFormValidator': 'screening_prior_bhp_participants_form_validator',
+    'SocioDemographicDataFormValidator': 'socio_demographic_data_form_validator',
+    'SubjectConsentFormValidator': 'subject_consent_form_validation',
+    'SubstanceUseDuringPregFormValidator': 'substance_use_during_form_validator',
+    'SubstanceUsePriorFormValidator': 'substance_use_prior_form_validator',
+    'TbHistoryPregFormValidator': 'tb_history_preg_form_validator',
+    'TbPresenceHouseholdMembersFormValidator': 'tb_presence_household_members_form_validator',
+    'TbReferralFormValidator': 'tb_referral_form_validator',
+    'TbRoutineHealthScreenFormValidator': 'tb_routine_health_screen_form_validator',
+    'TbScreenPregFormValidator': 'tb_screen_preg_form_validator',
+    'TbStudyEligibilityFormValidator': 'tb_study_eligibility_form_validator',
+    'TbVisitScreeningWomenFormValidator': 'tb_visit_screening_women_form_validator',
+    'UltrasoundFormValidator': 'ultrasound_form_validator',
+}
+
+__all__ = list(_exports)
+
+
+def __getattr__(name):
+    try:
+        module_name = _exports[name]
+    except KeyError:
+        raise AttributeError(
+            f'module {__name__!r} has no attribute {name!r}') from None
+    value = getattr(import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_exports))
@@ -1,11 +1,11 @@
 from django import forms
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_constants.constants import YES, POS, NEG, IND, NO, DWTA
 from edc_form_validators import FormValidator
 from flourish_caregiver.helper_classes import EnrollmentHelper
 
 from .crf_form_validator import FormValidatorMixin
+from .model_cls_resolver import model_cls_resolver
 
 
 class AntenatalEnrollmentFormValidator(FormValidatorMixin,
@@ -17,11 +17,11 @@ class AntenatalEnrollmentFormValidator(FormValidatorMixin,
 
     @property
     def antenatal_enrollment_cls(self):
-        return django_apps.get_model(self.antenatal_enrollment_model)
+        return model_cls_resolver.get_model(self, self.antenatal_enrollment_model)
 
     @property
     def child_consent_cls(self):
-        return django_apps.get_model(self.child_consent_model)
+        return model_cls_resolver.get_model(self, self.child_consent_model)
 
     def clean(self):
 
@@ -1,34 +1,37 @@
 from django import forms
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_constants.constants import YES, NO, RESTARTED, CONTINUOUS, STOPPED, NOT_APPLICABLE
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import FormValidatorMixin
+from .list_model_cache import M2MSelectionsMixin
+from .model_cls_resolver import model_cls_resolver
 
 
-class ArvsPrePregnancyFormValidator(FormValidatorMixin, FormValidator):
+class ArvsPrePregnancyFormValidator(M2MSelectionsMixin, FormValidatorMixin,
+                                    FormValidator):
     caregiver_consent_model = 'flourish_caregiver.subjectconsent'
     antenatal_enrollment_model = 'flourish_caregiver.antenatalenrollment'
 
     @property
     def antenatal_enrollment_cls(self):
-        return django_apps.get_model(self.antenatal_enrollment_model)
+        return model_cls_resolver.get_model(self, self.antenatal_enrollment_model)
 
     @property
     def caregiver_consent_model_cls(self):
-        return django_apps.get_model(self.caregiver_consent_model)
+        return model_cls_resolver.get_model(self, self.caregiver_consent_model)
 
     def clean(self):
         self.subject_identifier = self.cleaned_data.get(
             'maternal_visit').subject_identifier
-        super().clean()
 
-        self.validate_prev_preg_art(cleaned_data=self.cleaned_data)
-        self.validate_prior_preg(cleaned_data=self.cleaned_data)
-        self.validate_maternal_consent(cleaned_data=self.cleaned_data)
-        self.validate_hiv_test_date_antenatal_enrollment()
-        self.validate_other_mother()
+        self.run_rules(
+            super().clean,
+            lambda: self.validate_prev_preg_art(cleaned_data=self.cleaned_data),
+            lambda: self.validate_prior_preg(cleaned_data=self.cleaned_data),
+            lambda: self.validate_maternal_consent(cleaned_data=self.cleaned_data),
+            self.validate_hiv_test_date_antenatal_enrollment,
+            self.validate_other_mother)
 
     def validate_prev_preg_art(self, cleaned_data={}):
         art_start_date = cleaned_data.get('art_start_date')
@@ -53,9 +56,8 @@ class ArvsPrePregnancyFormValidator(FormValidatorMixin, FormValidator):
             self._errors.update(msg)
             raise ValidationError(msg)
 
-        qs = self.cleaned_data.get('prior_arv')
-        if qs and qs.count() >= 1:
-            selected = {obj.short_name: obj.name for obj in qs}
+        selected = self.m2m_selected('prior_arv')
+        if selected:
             if (self.cleaned_data.get('prior_preg') != NOT_APPLICABLE and
                     'prior_arv_na' in selected):
                 message = {
@@ -0,0 +1,155 @@
+from django.core.exceptions import ValidationError
+from django.db import models
+
+from .model_cls_resolver import model_cls_resolver
+from .offstudy_status import offstudy_status
+from .subject_context import SubjectContext
+
+
+class SubjectContextPrefetcher:
+    """Resolves the SubjectContext lookups for a batch of payloads with
+    a few set-based queries and hands out a seeded context per record.
+    """
+
+    default_maternal_visit_model = 'flourish_caregiver.maternalvisit'
+
+    def __init__(self, validator_cls=None, with_offstudy_status=False):
+        self.validator = validator_cls(cleaned_data={})
+        self.with_offstudy_status = with_offstudy_status
+        self.consents = {}
+        self.consent_versions = {}
+        self.offstudy_statuses = {}
+
+    @property
+    def maternal_visit_cls(self):
+        return model_cls_resolver.get_model(
+            self.validator,
+            getattr(self.validator, 'maternal_visit_model',
+                    self.default_maternal_visit_model))
+
+    def resolve_visits(self, cleaned_data_list):
+        """Replaces maternal visit primary keys in the payloads with
+        instances, fetched in one query.
+        """
+        visit_pks = {
+            cleaned_data.get('maternal_visit') for cleaned_data in cleaned_data_list
+            if cleaned_data.get('maternal_visit') is not None
+            and not isinstance(cleaned_data.get('maternal_visit'), models.Model)}
+        if visit_pks:
+            visits = self.maternal_visit_cls.objects.in_bulk(visit_pks)
+            for cleaned_data in cleaned_data_list:
+                visit_pk = cleaned_data.get('maternal_visit')
+                if visit_pk in visits:
+                    cleaned_data['maternal_visit'] = visits[visit_pk]
+        return cleaned_data_list
+
+    def subject_identifier(self, cleaned_data):
+        maternal_visit = cleaned_data.get('maternal_visit')
+        if maternal_visit is not None:
+            return maternal_visit.subject_identifier
+        return cleaned_data.get('subject_identifier')
+
+    def prefetch(self, subject_identifiers):
+        subject_identifiers = set(subject_identifiers) - {None}
+        if not subject_identifiers:
+            return
+
+        consents = self.validator.subject_consent_cls.objects.filter(
+            subject_identifier__in=subject_identifiers).only(
+                *SubjectContext.consent_fields).order_by(
+                    'subject_identifier', '-consent_datetime')
+        for consent in consents:
+            self.consents.setdefault(consent.subject_identifier, consent)
+
+        screening_identifiers = {
+            consent.screening_identifier for consent in self.consents.values()}
+        if screening_identifiers:
+            for consent_version in self.validator.consent_version_cls.objects.filter(
+                    screening_identifier__in=screening_identifiers):
+                self.consent_versions.setdefault(
+                    consent_version.screening_identifier, consent_version)
+
+        if self.with_offstudy_status:
+            self.offstudy_statuses.update(offstudy_status.statuses(
+                caregiver_offstudy_cls=self.validator.caregiver_offstudy_cls,
+                subject_identifiers=subject_identifiers))
+
+    def subject_context(self, form_validator, subject_identifier):
+        subject_context = SubjectContext(
+            validator=form_validator, subject_identifier=subject_identifier)
+        latest_consent = self.consents.get(subject_identifier)
+        subject_context.seed(
+            latest_consent=latest_consent,
+            consent_version=(
+                self.consent_versions.get(latest_consent.screening_identifier)
+                if latest_consent else None))
+        if subject_identifier in self.offstudy_statuses:
+            subject_context.seed(
+                offstudy_status=self.offstudy_statuses[subject_identifier])
+        return subject_context
+
+
+def validate_many(validator_cls, cleaned_data_list, with_offstudy_status=False):
+    """Validates each payload in `cleaned_data_list` with `validator_cls`
+    and returns a list of error dicts in the same order, empty for a
+    valid payload. Each error dict maps a field, or `__all__` for a
+    non field error, to a list of messages.
+
+    For validators using FormValidatorMixin, the consents, consent
+    versions and visits for the whole batch are fetched up front
+    instead of once per record. Pass `with_offstudy_status=True` to
+    prefetch the off study status too, for validators that call
+    `validate_offstudy_model`.
+    """
+    cleaned_data_list = [dict(cleaned_data) for cleaned_data in cleaned_data_list]
+    prefetcher = None
+    if hasattr(validator_cls, 'subject_context'):
+        prefetcher = SubjectContextPrefetcher(
+            validator_cls=validator_cls,
+            with_offstudy_status=with_offstudy_status)
+        prefetcher.resolve_visits(cleaned_data_list)
+        prefetcher.prefetch(
+            prefetcher.subject_identifier(cleaned_data)
+            for cleaned_data in cleaned_data_list)
+
+    results = []
+    for cleaned_data in cleaned_data_list:
+        form_validator = validator_cls(cleaned_data=cleaned_data)
+        if prefetcher:
+            form_validator._subject_context = prefetcher.subject_context(
+                form_validator, prefetcher.subject_identifier(cleaned_data))
+        try:
+            form_validator.validate()
+        except ValidationError as e:
+            results.append(errors_for(form_validator, e))
+        else:
+            results.append({})
+    return results
+
+
+def errors_for(form_validator, validation_error):
+    """Returns the validator's collected errors merged with those of the
+    raised ValidationError, as {field: [message, ...]}.
+    """
+    errors = {field: messages_for(message)
+              for field, message in form_validator._errors.items()}
+    for field, messages in error_dict(validation_error).items():
+        errors.setdefault(field, [])
+        errors[field].extend(
+            message for message in messages if message not in errors[field])
+    return errors
+
+
+def messages_for(message):
+    if isinstance(message, ValidationError):
+        return [str(m) for m in message.messages]
+    if isinstance(message, (list, tuple)):
+        return [str(m) for m in message]
+    return [str(message)]
+
+
+def error_dict(validation_error):
+    if hasattr(validation_error, 'error_dict'):
+        return {field: [str(message) for message in messages]
+                for field, messages in validation_error.message_dict.items()}
+    return {'__all__': validation_error.messages}
@@ -3,37 +3,31 @@ from edc_constants.constants import OTHER, YES, POS, NEG
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import FormValidatorMixin
+from .rule_tables import M2MOtherSpecify, RuleTableMixin
 
 
-class BreastFeedingQuestionnaireFormValidator(FormValidatorMixin, FormValidator):
+class BreastFeedingQuestionnaireFormValidator(RuleTableMixin, FormValidatorMixin,
+                                              FormValidator):
 
-    def clean(self):
-        self.validate_during_preg_influencers()
-        self.validate_after_delivery_influencers()
-        self.validate_infant_feeding_reasons()
-        self.validate_influenced_during_preg_required()
-        self.validate_influenced_after_delivery_required()
-        self.validate_feeding_hiv_status()
-        self.validate_infant_feeding_reasons_required()
-        self.validate_hiv_status_during_preg_not_req()
-        self.validate_hiv_status_during_preg_applicable()
-        self.validate_six_months_feeding_req()
-        self.validate_hiv_status_neg()
-
-    def validate_during_preg_influencers(self):
-        self.m2m_other_specify(OTHER,
-                               m2m_field='during_preg_influencers',
-                               field_other='during_preg_influencers_other')
+    rules = [
+        M2MOtherSpecify(OTHER, m2m_field='during_preg_influencers',
+                        field_other='during_preg_influencers_other'),
+        M2MOtherSpecify(OTHER, m2m_field='after_delivery_influencers',
+                        field_other='after_delivery_influencers_other'),
+        M2MOtherSpecify(OTHER, m2m_field='infant_feeding_reasons',
+                        field_other='infant_feeding_other'),
+    ]
 
-    def validate_after_delivery_influencers(self):
-        self.m2m_other_specify(OTHER,
-                               m2m_field='after_delivery_influencers',
-                               field_other='after_delivery_influencers_other')
-
-    def validate_infant_feeding_reasons(self):
-        self.m2m_other_specify(OTHER,
-                               m2m_field='infant_feeding_reasons',
-                               field_other='infant_feeding_other')
+    def clean(self):
+        self.run_rules(
+            self.validate_rule_table,
+            self.validate_influenced_during_preg_required,
+            self.validate_influenced_after_delivery_required,
+            self.validate_feeding_hiv_status,
+            self.validate_infant_feeding_reasons_required,
+            self.validate_hiv_status_during_preg_not_req,
+            self.validate_hiv_status_during_preg_applicable,
+            self.validate_hiv_status_neg)
 
     def validate_hiv_status_during_preg_not_req(self):
         hiv_status = self.cleaned_data.get('hiv_status_during_preg')
@@ -91,8 +85,3 @@ class BreastFeedingQuestionnaireFormValidator(FormValidatorMixin, FormValidator)
             self.required_if_true(status in ['No', 'rather_not_answer'],
                                   field='feeding_hiv_status',
                                   field_required=field)
-
-    def validate_six_months_feeding_req(self):
-        self.required_if(YES,
-                         field='six_months_feeding',
-                         field_required='infant_feeding_reasons')
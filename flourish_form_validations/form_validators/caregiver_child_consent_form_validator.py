@@ -1,13 +1,15 @@
 import datetime
-import re
 
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_base.utils import age, get_utcnow
 from edc_constants.choices import FEMALE, MALE, YES, NO, NOT_APPLICABLE
 from edc_form_validators import FormValidator
 from edc_form_validators.base_form_validator import NOT_APPLICABLE_ERROR
 
+from .child_dataset_index import child_dataset_index
+from .model_cls_resolver import model_cls_resolver
+from .patterns import FIRST_NAME_PATTERN, IDENTITY_PATTERN, LAST_NAME_PATTERN
+
 
 class CaregiverChildConsentFormValidator(FormValidator):
 
@@ -19,15 +21,15 @@ class CaregiverChildConsentFormValidator(FormValidator):
 
     @property
     def child_dataset_cls(self):
-        return django_apps.get_model(self.child_dataset_model)
+        return model_cls_resolver.get_model(self, self.child_dataset_model)
 
     @property
     def preg_screening_cls(self):
-        return django_apps.get_model(self.preg_women_screening_model)
+        return model_cls_resolver.get_model(self, self.preg_women_screening_model)
 
     @property
     def delivery_model_cls(self):
-        return django_apps.get_model(self.delivery_model)
+        return model_cls_resolver.get_model(self, self.delivery_model)
 
     def clean(self):
 
@@ -71,21 +73,19 @@ class CaregiverChildConsentFormValidator(FormValidator):
             gender = gender_dict.get(cleaned_data.get('gender'))
 
             if gender and cleaned_data.get('child_dob'):
-                try:
-                    self.child_dataset_cls.objects.get(
-                        study_child_identifier=cleaned_data.get('study_child_identifier'),
+                if not child_dataset_index.exists(
+                        self.child_dataset_cls,
+                        cleaned_data.get('study_child_identifier'),
                         infant_sex=gender,
-                        dob=cleaned_data.get('child_dob'))
-                except self.child_dataset_cls.DoesNotExist:
+                        dob=cleaned_data.get('child_dob')):
                     message = {'study_child_identifier': 'No child dataset exists for the '
                                'specified child identifier, gender and dob.'}
                     self._errors.update(message)
                     raise ValidationError(message)
             else:
-                try:
-                    self.child_dataset_cls.objects.get(
-                        study_child_identifier=cleaned_data.get('study_child_identifier'))
-                except self.child_dataset_cls.DoesNotExist:
+                if not child_dataset_index.exists(
+                        self.child_dataset_cls,
+                        cleaned_data.get('study_child_identifier')):
                     message = {'study_child_identifier': 'No child dataset exists for the '
                                'specified child identifier'}
                     self._errors.update(message)
@@ -97,7 +97,7 @@ class CaregiverChildConsentFormValidator(FormValidator):
         last_name = cleaned_data.get("last_name")
 
         if first_name:
-            if not re.match(r'^[A-Z]+$|^([A-Z]+[ ][A-Z]+)$', first_name):
+            if not FIRST_NAME_PATTERN.match(first_name):
                 message = {'first_name': 'Ensure first name is letters (A-Z) in '
                            'upper case, no special characters, except spaces. Maximum 2 first '
                            'names allowed.'}
@@ -105,7 +105,7 @@ class CaregiverChildConsentFormValidator(FormValidator):
                 raise ValidationError(message)
 
         if last_name:
-            if not re.match(r'^[A-Z-]+$', last_name):
+            if not LAST_NAME_PATTERN.match(last_name):
                 message = {'last_name': 'Ensure last name is letters (A-Z) in '
                            'upper case, no special characters, except hyphens.'}
                 self._errors.update(message)
@@ -129,7 +129,7 @@ class CaregiverChildConsentFormValidator(FormValidator):
                 identity is not None and identity != '',
                 field_required=required)
         if identity:
-            if not re.match('[0-9]+$', identity):
+            if not IDENTITY_PATTERN.match(identity):
                 message = {'identity': 'Identity number must be digits.'}
                 self._errors.update(message)
                 raise ValidationError(message)
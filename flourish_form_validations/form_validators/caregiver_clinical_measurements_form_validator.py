@@ -3,6 +3,7 @@ from edc_constants.constants import YES, NO
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import FormValidatorMixin
+from .rules import pure_rule
 
 
 class CaregiverClinicalMeasurementsFormValidator(FormValidatorMixin,
@@ -13,13 +14,18 @@ class CaregiverClinicalMeasurementsFormValidator(FormValidatorMixin,
         cleaned_data = self.cleaned_data
         self.subject_identifier = cleaned_data.get(
             'maternal_visit').subject_identifier
-        super().clean()
 
-        self.check_bp()
-        self.check_all_cm_valid()
-        self.check_all_cm_tb_valid()
-        self.check_all_cm_valid_2000D()
-        
+        self.run_rules(
+            super().clean,
+            self.check_bp,
+            self.check_all_cm_valid,
+            self.check_all_cm_tb_valid,
+            self.check_all_cm_valid_2000D,
+            self.validate_bp_values)
+
+    @pure_rule
+    def validate_bp_values(self):
+        cleaned_data = self.cleaned_data
         if (cleaned_data.get('systolic_bp') and
             cleaned_data.get('diastolic_bp')):
             if cleaned_data.get('systolic_bp') < \
@@ -37,8 +43,9 @@ class CaregiverClinicalMeasurementsFormValidator(FormValidatorMixin,
                     'Systolic blood pressure cannot be lower than the'
                     'diastolic blood pressure. Please correct.'}
                 self._errors.update(msg)
-                raise ValidationError(msg)       
+                raise ValidationError(msg)
 
+    @pure_rule
     def check_bp(self):
         if self.cleaned_data.get('all_measurements') == YES and self.check_bp_measurements == False:
             message = {'systolic_bp':
@@ -85,6 +92,7 @@ class CaregiverClinicalMeasurementsFormValidator(FormValidatorMixin,
 
         return not any(item is None for item in cm_all_tb)
     
+    @pure_rule
     def check_all_cm_tb_valid(self):
         obtained_all_cm = self.cleaned_data.get('all_measurements')
         confirm_values = self.cleaned_data.get('confirm_values')
@@ -110,6 +118,7 @@ class CaregiverClinicalMeasurementsFormValidator(FormValidatorMixin,
                     raise ValidationError(message)
     
 
+    @pure_rule
     def check_all_cm_valid(self):
         obtained_all_cm = self.cleaned_data.get('all_measurements')
         confirm_values = self.cleaned_data.get('confirm_values')
@@ -135,6 +144,7 @@ class CaregiverClinicalMeasurementsFormValidator(FormValidatorMixin,
                     self._errors.update(message)
                     raise ValidationError(message)    
                 
+    @pure_rule
     def check_all_cm_valid_2000D(self):
         obtained_all_cm = self.cleaned_data.get('all_measurements')
         confirm_values = self.cleaned_data.get('confirm_values')
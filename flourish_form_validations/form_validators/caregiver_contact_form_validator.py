@@ -1,9 +1,9 @@
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_constants.constants import YES, NO
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import FormValidatorMixin
+from .model_cls_resolver import model_cls_resolver
 
 
 class CaregiverContactFormValidator(FormValidatorMixin, FormValidator):
@@ -11,7 +11,7 @@ class CaregiverContactFormValidator(FormValidatorMixin, FormValidator):
 
     @property
     def caregiver_locator_cls(self):
-        return django_apps.get_model(self.caregiver_locator_model)
+        return model_cls_resolver.get_model(self, self.caregiver_locator_model)
 
     def clean(self):
         cleaned_data = self.cleaned_data
@@ -1,8 +1,9 @@
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 from edc_constants.constants import YES, NO, NOT_APPLICABLE
 from edc_form_validators.form_validator import FormValidator
 
+from .model_cls_resolver import model_cls_resolver
+
 
 class CaregiverLocatorFormValidator(FormValidator):
 
@@ -10,11 +11,11 @@ class CaregiverLocatorFormValidator(FormValidator):
 
     @property
     def maternal_dataset_model_cls(self):
-        return django_apps.get_model(self.maternal_dataset_model)
+        return model_cls_resolver.get_model(self, self.maternal_dataset_model)
 
     @property
     def caregiver_child_consent_model_cls(self):
-        return django_apps.get_model(self.caregiver_child_consent_model)
+        return model_cls_resolver.get_model(self, self.caregiver_child_consent_model)
 
     def clean(self):
         self.required_if(
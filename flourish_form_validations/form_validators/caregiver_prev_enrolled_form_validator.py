@@ -1,10 +1,12 @@
 from dateutil.relativedelta import relativedelta
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
+from django.db.models import Q
 
 from edc_constants.constants import YES, NO, NEG, IND, POS, UNK
 from edc_form_validators.form_validator import FormValidator
 
+from .model_cls_resolver import model_cls_resolver
+
 
 class CaregiverPrevEnrolledFormValidator(FormValidator):
     maternal_dataset_model = 'flourish_caregiver.maternaldataset'
@@ -17,19 +19,19 @@ class CaregiverPrevEnrolledFormValidator(FormValidator):
 
     @property
     def maternal_dataset_model_cls(self):
-        return django_apps.get_model(self.maternal_dataset_model)
+        return model_cls_resolver.get_model(self, self.maternal_dataset_model)
 
     @property
     def child_assent_cls(self):
-        return django_apps.get_model(self.child_assent_model)
+        return model_cls_resolver.get_model(self, self.child_assent_model)
 
     @property
     def subject_consent_model_cls(self):
-        return django_apps.get_model(self.subject_consent_model)
+        return model_cls_resolver.get_model(self, self.subject_consent_model)
 
     @property
     def bhp_prior_screening_model_cls(self):
-        return django_apps.get_model(self.bhp_prior_screening_model)
+        return model_cls_resolver.get_model(self, self.bhp_prior_screening_model)
 
     def clean(self):
 
@@ -155,23 +157,23 @@ class CaregiverPrevEnrolledFormValidator(FormValidator):
 
     def check_child_assent(self, subject_identifier):
 
-        child_assents_exists = []
+        if self.missing_child_assents(subject_identifier).exists():
+            raise ValidationError('Please fill the child assent(s) form(s) first')
+
+    def missing_child_assents(self, subject_identifier):
+        """Returns the subject identifiers of eligible children aged 7 to
+        17 at enrollment who do not have a child assent, as a single
+        set based query. A child without a subject identifier cannot
+        have an assent and is always included.
+        """
+        child_assents = self.child_assent_cls.objects.filter(
+            subject_identifier__isnull=False).values('subject_identifier')
 
-        child_consents = self.subject_consent_model_cls.objects.get(
+        return self.subject_consent_model_cls.objects.get(
             subject_identifier=subject_identifier).caregiverchildconsent_set \
-            .only('child_age_at_enrollment', 'is_eligible') \
             .filter(is_eligible=True,
                     child_age_at_enrollment__gte=7,
-                    child_age_at_enrollment__lt=18)
-
-        if child_consents.exists():
-
-            for child_consent in child_consents:
-                exists = self.child_assent_cls.objects.filter(
-                    subject_identifier=child_consent.subject_identifier).exists()
-                child_assents_exists.append(exists)
-
-            child_assents_exists = all(child_assents_exists)
-
-            if not child_assents_exists:
-                raise ValidationError('Please fill the child assent(s) form(s) first')
+                    child_age_at_enrollment__lt=18) \
+            .filter(Q(subject_identifier__isnull=True)
+                    | ~Q(subject_identifier__in=child_assents)) \
+            .values_list('subject_identifier', flat=True)
@@ -0,0 +1,132 @@
+from collections import namedtuple
+
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+
+from .subject_status_cache import LOCAL_CACHE_BACKENDS
+
+Index = namedtuple('Index', ['version', 'children', 'identifiers'])
+
+
+class ChildDatasetIndex:
+    """An in-process index of the child dataset, keyed by
+    (study_child_identifier, infant_sex, dob) and by
+    study_child_identifier alone.
+
+    The dataset is an imported legacy dataset that only changes during
+    data loads, so the index is built on the first lookup and kept
+    until the dataset changes. A save or delete, or `rebuild()`, bumps
+    a version in the Django cache so that every process sharing the
+    cache rebuilds on its next lookup. The receivers for
+    `watched_models` are connected by `watch_models()`, called from
+    AppConfig.ready(), so that a process that changes the dataset bumps
+    the version even if it has never looked a child up. A key missing
+    from the index is confirmed against the database before it is
+    reported missing, so an index built before a load in another
+    process never rejects a child that exists.
+
+    Set CHILD_DATASET_INDEX to False to look every child up in the
+    database. If it is not set, the index is only used when the
+    default cache backend is shared between processes; with a per
+    process cache a version bump cannot reach the other processes.
+    """
+
+    version_key = 'flourish_form_validations.child_dataset_index.version'
+    enabled_setting = 'CHILD_DATASET_INDEX'
+    watched_models = ['flourish_child.childdataset']
+
+    def __init__(self):
+        self.indexes = {}
+        self.watched = set()
+
+    @property
+    def enabled(self):
+        try:
+            return getattr(settings, self.enabled_setting)
+        except AttributeError:
+            backend = settings.CACHES.get('default', {}).get('BACKEND')
+            return backend not in LOCAL_CACHE_BACKENDS
+
+    @property
+    def version(self):
+        return cache.get(self.version_key, 0)
+
+    def index(self, model_cls):
+        label = model_cls._meta.label_lower
+        version = self.version
+        index = self.indexes.get(label)
+        if not index or index.version != version:
+            index = self.indexes[label] = self.build(model_cls, version)
+        return index
+
+    def build(self, model_cls, version):
+        children, identifiers = set(), set()
+        for row in model_cls.objects.values_list(
+                'study_child_identifier', 'infant_sex', 'dob').iterator():
+            children.add(row)
+            identifiers.add(row[0])
+        return Index(version=version, children=frozenset(children),
+                     identifiers=frozenset(identifiers))
+
+    def exists(self, model_cls, study_child_identifier, infant_sex=None,
+               dob=None):
+        """Returns True if the dataset has the child, matched on the
+        identifier alone if neither `infant_sex` nor `dob` is given.
+        """
+        options = {'study_child_identifier': study_child_identifier}
+        if infant_sex is not None or dob is not None:
+            options.update(infant_sex=infant_sex, dob=dob)
+        if not self.enabled:
+            return model_cls.objects.filter(**options).exists()
+        index = self.index(model_cls)
+        if infant_sex is None and dob is None:
+            found = study_child_identifier in index.identifiers
+        else:
+            found = (study_child_identifier, infant_sex, dob) in index.children
+        if not found and model_cls.objects.filter(**options).exists():
+            self.invalidate()
+            found = True
+        return found
+
+    def invalidate(self, *args, **kwargs):
+        try:
+            cache.incr(self.version_key)
+        except ValueError:
+            cache.set(self.version_key, self.version + 1, None)
+
+    def rebuild(self, model_cls):
+        """Drops the index in every process and rebuilds it in this one,
+        e.g. after a dataset import.
+        """
+        self.invalidate()
+        return self.index(model_cls)
+
+    def clear(self):
+        """Drops the indexes built in this process.
+        """
+        self.indexes = {}
+
+    def watch_models(self):
+        """Watches each installed model in `watched_models`.
+        """
+        for label in self.watched_models:
+            try:
+                model_cls = django_apps.get_model(label)
+            except LookupError:
+                continue
+            self.watch(model_cls)
+
+    def watch(self, model_cls):
+        label = model_cls._meta.label_lower
+        if label in self.watched:
+            return
+        for signal in [post_save, post_delete]:
+            signal.connect(
+                self.invalidate, sender=model_cls, weak=False,
+                dispatch_uid=f'{self.version_key}.{label}.{id(signal)}')
+        self.watched.add(label)
+
+
+child_dataset_index = ChildDatasetIndex()
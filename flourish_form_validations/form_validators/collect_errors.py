@@ -0,0 +1,62 @@
+from django.conf import settings
+from django.core.exceptions import ValidationError
+
+from .rules import schedule
+
+
+class CollectErrorsMixin:
+    """Adds an opt-in mode that collects field level errors from a
+    sequence of rules instead of raising on the first one.
+
+    Enable it per instance with `collect_errors=True`, per class with
+    the `collect_errors` attribute or project wide with the
+    FORM_VALIDATOR_COLLECT_ERRORS setting.
+    """
+
+    collect_errors = None
+
+    def __init__(self, *args, collect_errors=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if collect_errors is not None:
+            self.collect_errors = collect_errors
+
+    @property
+    def collecting_errors(self):
+        if self.collect_errors is None:
+            return getattr(settings, 'FORM_VALIDATOR_COLLECT_ERRORS', False)
+        return self.collect_errors
+
+    def run_rules(self, *rules):
+        """Calls each rule, prerequisite rules first, then pure rules and
+        then the I/O bound rules, each group in the given order. See
+        `rules.prerequisite_rule` and `rules.pure_rule`.
+
+        When collecting errors, a ValidationError raised for a field is
+        kept and the next rule runs; the collected errors are raised
+        together after the last rule. Errors without a field, such as
+        the "complete X form first" prerequisites, are raised at once
+        and drop the field errors collected before them.
+        """
+        collected = {}
+        try:
+            for rule in schedule(rules):
+                self.collect(collected, rule)
+        except ValidationError:
+            # a prerequisite error replaces the field errors collected so far
+            for field in collected:
+                self._errors.pop(field, None)
+            raise
+        if collected:
+            raise ValidationError(collected)
+
+    def collect(self, collected, rule, *args, **kwargs):
+        """Calls `rule` with the given arguments, adding its field errors
+        to `collected` when collecting errors, otherwise re-raising.
+        """
+        try:
+            rule(*args, **kwargs)
+        except ValidationError as e:
+            if not self.collecting_errors or not hasattr(e, 'error_dict'):
+                raise
+            for field, errors in e.error_dict.items():
+                collected.setdefault(field, errors)
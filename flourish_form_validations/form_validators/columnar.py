@@ -0,0 +1,245 @@
+from collections import namedtuple
+
+from edc_constants.constants import DWTA, NOT_APPLICABLE, OTHER
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+RowError = namedtuple('RowError', 'row field message')
+
+
+class ColumnarValidatorError(Exception):
+    pass
+
+
+class ErrorMatrix:
+    """A sparse (row x field) matrix of error messages in coordinate
+    form: `rows[i]`, `cols[i]` and `messages[i]` describe one error,
+    `cols` indexing into `fields`.
+    """
+
+    def __init__(self, n_rows, fields, rows, cols, messages):
+        self.n_rows = n_rows
+        self.fields = fields
+        self.rows = rows
+        self.cols = cols
+        self.messages = messages
+
+    def __len__(self):
+        return len(self.rows)
+
+    def __iter__(self):
+        for row, col, message in zip(self.rows, self.cols, self.messages):
+            yield RowError(int(row), self.fields[col], message)
+
+    def to_dense(self):
+        """Returns an (n_rows x len(fields)) object array with the
+        message for each erroneous cell and None elsewhere.
+        """
+        dense = np.full((self.n_rows, len(self.fields)), None, dtype=object)
+        dense[self.rows, self.cols] = self.messages
+        return dense
+
+    def errors_for(self, row):
+        """Returns {field: message} for `row`, as the form validator
+        would report them when collecting errors.
+        """
+        index = np.flatnonzero(self.rows == row)
+        return {self.fields[self.cols[i]]: self.messages[i] for i in index}
+
+    @property
+    def invalid_rows(self):
+        return np.unique(self.rows)
+
+
+def isin(values, responses):
+    mask = np.zeros(len(values), dtype=bool)
+    for response in responses:
+        mask |= values == response
+    return mask
+
+
+def is_none(values):
+    return np.equal(values, None)
+
+
+def is_blank(values):
+    """Mirrors the truthiness tests in edc_form_validators.
+    """
+    return ~values.astype(bool)
+
+
+def required_if(columns, *responses, field=None, field_required=None,
+                required_msg=None, not_required_msg=None,
+                optional_if_dwta=None, optional_if_na=None, inverse=True,
+                field_required_evaluate_as_int=None, **kwargs):
+    field_value, required_value = columns[field], columns[field_required]
+    skipped = np.zeros(len(field_value), dtype=bool)
+    if DWTA in responses and optional_if_dwta:
+        skipped |= field_value == DWTA
+    if NOT_APPLICABLE in responses and optional_if_na:
+        skipped |= field_value == NOT_APPLICABLE
+    if field_required_evaluate_as_int:
+        missing = is_none(required_value)
+    else:
+        missing = is_blank(required_value)
+    missing |= required_value == NOT_APPLICABLE
+    triggered = isin(field_value, responses)
+    yield (field_required, ~skipped & triggered & missing,
+           required_msg or 'This field is required.')
+    if inverse is None or inverse:
+        yield (field_required, ~skipped & ~triggered & ~missing,
+               not_required_msg or 'This field is not required.')
+
+
+def not_required_if(columns, *responses, field=None, field_required=None,
+                    required_msg=None, not_required_msg=None,
+                    optional_if_dwta=None, inverse=True, **kwargs):
+    field_value, required_value = columns[field], columns[field_required]
+    skipped = np.zeros(len(field_value), dtype=bool)
+    if DWTA in responses and optional_if_dwta:
+        skipped |= field_value == DWTA
+    missing = is_blank(required_value) | (required_value == NOT_APPLICABLE)
+    triggered = isin(field_value, responses)
+    yield (field_required, ~skipped & triggered & ~missing,
+           not_required_msg or 'This field is not required.')
+    if inverse is None or inverse:
+        yield (field_required, ~skipped & ~triggered & missing,
+               required_msg or 'This field is required.')
+
+
+def applicable_if(columns, *responses, field=None, field_applicable=None,
+                  inverse=True, msg=None, applicable_msg=None,
+                  not_applicable_msg=None, not_applicable_value=None, **kwargs):
+    not_applicable = not_applicable_value or NOT_APPLICABLE
+    field_value, applicable_value = columns[field], columns[field_applicable]
+    triggered = isin(field_value, responses)
+    yield (field_applicable,
+           triggered & (is_none(applicable_value)
+                        | (applicable_value == not_applicable)),
+           applicable_msg or f'This field is applicable. {msg or ""}'.strip())
+    if inverse is None or inverse:
+        yield (field_applicable,
+               ~triggered & (applicable_value != not_applicable),
+               not_applicable_msg
+               or f'This field is not applicable. {msg or ""}'.strip())
+
+
+def validate_other_specify(columns, field=None, other_specify_field=None,
+                           required_msg=None, not_required_msg=None,
+                           other_stored_value=None, **kwargs):
+    other = other_stored_value or OTHER
+    other_specify_field = other_specify_field or f'{field}_other'
+    field_value = columns[field]
+    blank = is_blank(columns[other_specify_field])
+    is_other = ~is_none(field_value) & (field_value == other)
+    yield (other_specify_field, is_other & blank,
+           required_msg or 'This field is required.')
+    yield (other_specify_field, ~is_other & ~blank,
+           not_required_msg or 'This field is not required.')
+
+
+def validate_range(columns, *responses, field=None, field_range=None,
+                   min=None, max=None, exclusive_min=False,
+                   exclusive_max=False, message=None):
+    values = columns[field_range]
+    present = ~is_none(values)
+    if field:
+        present &= isin(columns[field], responses)
+    numbers = np.where(present, values, np.nan).astype(float)
+    out_of_range = np.zeros(len(values), dtype=bool)
+    with np.errstate(invalid='ignore'):
+        if min is not None:
+            out_of_range |= numbers <= min if exclusive_min else numbers < min
+        if max is not None:
+            out_of_range |= numbers >= max if exclusive_max else numbers > max
+    yield field_range, present & out_of_range, message or 'Value is out of range.'
+
+
+MASKS = {
+    'required_if': required_if,
+    'not_required_if': not_required_if,
+    'applicable_if': applicable_if,
+    'validate_other_specify': validate_other_specify,
+    'validate_range': validate_range,
+}
+
+
+class ColumnarValidator:
+    """Checks the rule table of a `RuleTableMixin` validator class
+    against columns of exported CRF data, one boolean mask per rule,
+    instead of instantiating the form validator once per row.
+
+        errors = ColumnarValidator(UltrasoundFormValidator).validate({
+            'ga_by_ultrasound_wks': [12, 41, None],
+            'ga_by_ultrasound_days': [3, 2, 9]})
+        errors.errors_for(1)
+        {'ga_by_ultrasound_wks': 'GA by ultrasound cannot be ...'}
+
+    Only the rules that read single values are checked; M2M rules
+    and rules whose fields are not all in `columns` are skipped.
+    Requires numpy, installed with the `columnar` extra.
+    """
+
+    def __init__(self, validator_cls=None):
+        if np is None:
+            raise ColumnarValidatorError(
+                'numpy is required for columnar validation. '
+                'Install flourish-form-validations[columnar] or use '
+                'validate_many().')
+        self.validator_cls = validator_cls
+
+    @property
+    def compiled_rules(self):
+        """Returns a list of (mask function, args, kwargs) for the
+        rules the columnar engine supports, in table order.
+        """
+        return [(MASKS[method], args, kwargs)
+                for rule in self.validator_cls.rules
+                for method, args, kwargs in rule.compile()
+                if method in MASKS]
+
+    def columns(self, data):
+        columns = {}
+        for field, values in data.items():
+            column = np.empty(len(values), dtype=object)
+            column[:] = list(values)
+            columns[field] = column
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ColumnarValidatorError(
+                f'Columns must have the same length. Got {sorted(lengths)}.')
+        return columns, lengths.pop() if lengths else 0
+
+    def validate(self, data):
+        """Returns an ErrorMatrix for `data`, a mapping of field name
+        to a sequence of values, one per row.
+
+        As when collecting errors on the form, the first error for a
+        field in a row is kept.
+        """
+        columns, n_rows = self.columns(data)
+        fields, rows, cols, messages = [], [], [], []
+        for mask_function, args, kwargs in self.compiled_rules:
+            try:
+                masks = list(mask_function(columns, *args, **kwargs))
+            except KeyError:
+                continue
+            for field, mask, message in masks:
+                if field not in fields:
+                    fields.append(field)
+                index = np.flatnonzero(mask)
+                rows.append(index)
+                cols.append(np.full(len(index), fields.index(field)))
+                messages.append(np.full(len(index), message, dtype=object))
+        if not rows:
+            return ErrorMatrix(n_rows, fields, np.empty(0, dtype=int),
+                               np.empty(0, dtype=int), np.empty(0, dtype=object))
+        rows, cols = np.concatenate(rows), np.concatenate(cols)
+        messages = np.concatenate(messages)
+        _, first = np.unique(rows * len(fields) + cols, return_index=True)
+        return ErrorMatrix(n_rows, fields, rows[first], cols[first],
+                           messages[first])
@@ -1,4 +1,4 @@
-from django.apps import apps as django_apps
+from .model_cls_resolver import model_cls_resolver
 
 
 class ConsentsFormValidatorMixin:
@@ -9,11 +9,11 @@ class ConsentsFormValidatorMixin:
 
     @property
     def maternal_dataset_cls(self):
-        return django_apps.get_model(self.maternal_dataset_model)
+        return model_cls_resolver.get_model(self, self.maternal_dataset_model)
 
     @property
     def child_dataset_cls(self):
-        return django_apps.get_model(self.child_dataset_model)
+        return model_cls_resolver.get_model(self, self.child_dataset_model)
 
     @property
     def maternal_dataset(self):
@@ -2,42 +2,46 @@ from django.core.exceptions import ValidationError
 from edc_constants.constants import YES, POS, NO
 from edc_form_validators import FormValidator
 
-
-class Covid19FormValidator(FormValidator):
+from .rule_tables import (
+    M2MRequiredIf, OtherSpecify, RequiredIf, RuleTableMixin)
+
+
+class Covid19FormValidator(RuleTableMixin, FormValidator):
+
+    rules = [
+        RequiredIf(YES, field='fully_vaccinated',
+                   field_required='received_booster'),
+        RequiredIf(YES, field='received_booster',
+                   field_required=['booster_vac_type', 'booster_vac_date']),
+        OtherSpecify(field='booster_vac_type',
+                     other_specify_field='other_booster_vac_type'),
+        RequiredIf(YES, field='test_for_covid',
+                   field_required=['date_of_test', 'is_test_estimated',
+                                   'reason_for_testing', 'result_of_test']),
+        M2MRequiredIf(POS, field='result_of_test',
+                      m2m_field='isolations_symptoms'),
+        RequiredIf(POS, field='result_of_test',
+                   field_required='isolation_location'),
+        OtherSpecify(field='reason_for_testing',
+                     other_specify_field='other_reason_for_testing'),
+        OtherSpecify(field='isolation_location',
+                     other_specify_field='other_isolation_location'),
+        RequiredIf(YES, field='has_tested_positive',
+                   field_required='date_of_test_member'),
+    ]
 
     def clean(self):
 
         self.validate_visit()
 
-        self.validate_booster_vac()
-
-        required_fields = [
-            'date_of_test', 'is_test_estimated', 'reason_for_testing',
-            'result_of_test'
-        ]
-
-        for field in required_fields:
-            self.required_if(YES,
-                             field='test_for_covid',
-                             field_required=field)
-
-        self.m2m_required_if(POS,
-                             field='result_of_test',
-                             m2m_field='isolations_symptoms')
-
-        self.required_if(POS,
-                         field='result_of_test',
-                         field_required='isolation_location')
+        self.run_rules(
+            self.validate_rule_table,
+            self.validate_single_selections,
+            self.validate_vaccination)
 
-        self.validate_other_specify(field='reason_for_testing',
-                                    other_specify_field='other_reason_for_testing')
-        self.validate_other_specify(field='isolation_location',
-                                    other_specify_field='other_isolation_location')
-
-        self.required_if(YES,
-                         field='has_tested_positive',
-                         field_required='date_of_test_member')
+        return super().clean()
 
+    def validate_single_selections(self):
         single_selection_fields = {}
         if 'maternal_visit' in self.cleaned_data:
             single_selection_fields = {
@@ -51,6 +55,7 @@ class Covid19FormValidator(FormValidator):
         for field, response in single_selection_fields.items():
             self.m2m_single_selection_if(response, m2m_field=field)
 
+    def validate_vaccination(self):
         if self.cleaned_data.get('fully_vaccinated') == YES:
 
             if self.cleaned_data.get(
@@ -115,29 +120,6 @@ class Covid19FormValidator(FormValidator):
                                      field='fully_vaccinated',
                                      field_required=field)
 
-        return super().clean()
-
-    def validate_booster_vac(self):
-        self.required_if(
-            YES,
-            field='fully_vaccinated',
-            field_required='received_booster'
-        )
-
-        fields = ['booster_vac_type', 'booster_vac_date']
-
-        for field in fields:
-            self.required_if(
-                YES,
-                field='received_booster',
-                field_required=field
-            )
-
-        self.validate_other_specify(
-            field='booster_vac_type',
-            other_specify_field='other_booster_vac_type'
-        )
-
     def validate_visit(self):
         if 'maternal_visit' in self.cleaned_data:
             self.subject_identifier = self.cleaned_data.get(
@@ -1,28 +1,35 @@
 from django import forms
-from django.apps import apps as django_apps
-from edc_action_item.site_action_items import site_action_items
-from edc_constants.constants import NO, NEW
-from flourish_prn.action_items import CAREGIVEROFF_STUDY_ACTION
+from edc_constants.constants import NO
 
+from .collect_errors import CollectErrorsMixin
+from .model_cls_resolver import model_cls_resolver
+from .offstudy_status import OFF_STUDY, PENDING_OFF_STUDY
+from .rules import prerequisite_rule
+from .subject_context import SubjectContext
+from .validation_context import context_property
 
-class FormValidatorMixin:
+
+class FormValidatorMixin(CollectErrorsMixin):
 
     consent_version_model = 'flourish_caregiver.flourishconsentversion'
     caregiver_offstudy_model = 'flourish_prn.caregiveroffstudy'
     subject_consent_model = 'flourish_caregiver.subjectconsent'
 
+    subject_context = context_property(SubjectContext, 'subject_identifier')
+
     @property
     def consent_version_cls(self):
-        return django_apps.get_model(self.consent_version_model)
+        return model_cls_resolver.get_model(self, self.consent_version_model)
 
     @property
     def caregiver_offstudy_cls(self):
-        return django_apps.get_model(self.caregiver_offstudy_model)
+        return model_cls_resolver.get_model(self, self.caregiver_offstudy_model)
 
     @property
     def subject_consent_cls(self):
-        return django_apps.get_model(self.subject_consent_model)
+        return model_cls_resolver.get_model(self, self.subject_consent_model)
 
+    @prerequisite_rule
     def clean(self):
         if self.cleaned_data.get('maternal_visit'):
             self.subject_identifier = self.cleaned_data.get(
@@ -39,8 +46,9 @@ class FormValidatorMixin:
         """Returns an instance of the current maternal consent or
         raises an exception if not found."""
 
-        if self.latest_consent_obj:
-            if report_datetime and report_datetime < self.latest_consent_obj.consent_datetime:
+        latest_consent = self.latest_consent_obj
+        if latest_consent:
+            if report_datetime and report_datetime < latest_consent.consent_datetime:
                 raise forms.ValidationError(
                     "Report datetime cannot be before consent datetime")
         else:
@@ -56,27 +64,14 @@ class FormValidatorMixin:
 
     def validate_offstudy_model(self):
 
-        action_cls = site_action_items.get(
-            self.caregiver_offstudy_cls.action_name)
-        action_item_model_cls = action_cls.action_item_model_cls()
-
-        try:
-            action_item_model_cls.objects.get(
-                subject_identifier=self.subject_identifier,
-                action_type__name=CAREGIVEROFF_STUDY_ACTION,
-                status=NEW)
-        except action_item_model_cls.DoesNotExist:
-            try:
-                self.caregiver_offstudy_cls.objects.get(
-                    subject_identifier=self.subject_identifier)
-            except self.caregiver_offstudy_cls.DoesNotExist:
-                pass
-            else:
-                raise forms.ValidationError(
-                    'Participant has been taken offstudy. Cannot capture any '
-                    'new data.')
-        else:
-            self.maternal_visit = self.cleaned_data.get('maternal_visit') or None
+        status = self.subject_context.offstudy_status
+
+        if status == OFF_STUDY:
+            raise forms.ValidationError(
+                'Participant has been taken offstudy. Cannot capture any '
+                'new data.')
+        elif status == PENDING_OFF_STUDY:
+            self.maternal_visit = self.subject_context.visit or None
             if not self.maternal_visit or self.maternal_visit.require_crfs == NO:
                 raise forms.ValidationError(
                     'Participant is scheduled to be taken offstudy without '
@@ -84,20 +79,11 @@ class FormValidatorMixin:
 
     def validate_consent_version_obj(self):
 
-        if self.latest_consent_obj:
-            try:
-                self.consent_version_cls.objects.get(
-                    screening_identifier=self.latest_consent_obj.screening_identifier)
-            except self.consent_version_cls.DoesNotExist:
-                raise forms.ValidationError(
-                    'Consent version form has not been completed, kindly complete it before'
-                    ' continuing.')
+        if self.latest_consent_obj and not self.subject_context.consent_version:
+            raise forms.ValidationError(
+                'Consent version form has not been completed, kindly complete it before'
+                ' continuing.')
 
     @property
     def latest_consent_obj(self):
-
-        subject_consents = self.subject_consent_cls.objects.filter(
-            subject_identifier=self.subject_identifier)
-
-        if subject_consents:
-            return subject_consents.latest('consent_datetime')
+        return self.subject_context.latest_consent
@@ -3,60 +3,55 @@ from edc_constants.choices import YES, NO
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import FormValidatorMixin
-
-
-class HivViralLoadCd4FormValidator(FormValidatorMixin, FormValidator):
+from .rule_tables import Range, RequiredIf, Rule, RuleTableMixin
+
+
+class ResultsQuantifier(Rule):
+    method = 'validate_results_quantifier'
+    reports_arg = 'field_quantifier'
+
+
+class HivViralLoadCd4FormValidator(RuleTableMixin, FormValidatorMixin,
+                                   FormValidator):
+
+    rules = [
+        RequiredIf(YES, field='last_cd4_count_known',
+                   field_required=['cd4_count', 'cd4_count_date']),
+        RequiredIf(YES, field='last_vl_known',
+                   field_required=['vl_detectable', 'recent_vl_results',
+                                   'hiv_results_quantifier', 'last_vl_date']),
+        ResultsQuantifier(field='vl_detectable',
+                          field_quantifier='hiv_results_quantifier'),
+        Range(YES, field='vl_detectable', field_range='recent_vl_results',
+              min=400, exclusive_min=True,
+              message='The viral load is detectable, the vl results '
+                      'should be more than 400'),
+        Range(NO, field='vl_detectable', field_range='recent_vl_results',
+              min=400, max=400,
+              message='The viral load is not detectable, the vl results '
+                      'should be 400'),
+    ]
 
     def clean(self):
         self.subject_identifier = self.cleaned_data.get(
             'maternal_visit').subject_identifier
 
-        required_fields = ['cd4_count', 'cd4_count_date']
-        for field in required_fields:
-            self.required_if(
-                YES,
-                field='last_cd4_count_known',
-                field_required=field)
-
-        self.required_if(
-            YES,
-            field='last_vl_known',
-            field_required='vl_detectable')
-
-        viral_load_fields = ['vl_detectable', 'recent_vl_results',
-                             'hiv_results_quantifier', 'last_vl_date']
-        for field in viral_load_fields:
-            self.required_if(
-                YES,
-                field='last_vl_known',
-                field_required=field)
-
-        vl_detectable = self.cleaned_data.get('vl_detectable')
-        results_quantifier = self.cleaned_data.get('hiv_results_quantifier')
-        recent_vl_results = self.cleaned_data.get('recent_vl_results')
+        self.run_rules(self.validate_rule_table)
+
+    def validate_results_quantifier(self, field=None, field_quantifier=None):
+        vl_detectable = self.cleaned_data.get(field)
+        results_quantifier = self.cleaned_data.get(field_quantifier)
         if vl_detectable == YES:
             if not results_quantifier == 'equal':
-                message = {'hiv_results_quantifier':
+                message = {field_quantifier:
                            'The viral load is detectable, the results quantifier '
                            'should be equal(=)'}
                 self._errors.update(message)
                 raise ValidationError(message)
-            if recent_vl_results <= 400:
-                message = {'recent_vl_results':
-                           'The viral load is detectable, the vl results '
-                           'should be more than 400'}
-                self._errors.update(message)
-                raise ValidationError(message)
         elif vl_detectable == NO:
             if not results_quantifier == 'less_than':
-                message = {'hiv_results_quantifier':
+                message = {field_quantifier:
                            'The viral load is not detectable, the results '
                            'quantifier should be less than(<)'}
                 self._errors.update(message)
                 raise ValidationError(message)
-            if recent_vl_results != 400:
-                message = {'recent_vl_results':
-                           'The viral load is not detectable, the vl results '
-                           'should be 400'}
-                self._errors.update(message)
-                raise ValidationError(message)
@@ -0,0 +1,116 @@
+from contextlib import contextmanager
+
+from django.db.models import QuerySet
+
+
+class ListModelCache:
+    """Caches the instances of each list model, by pk, for the life of
+    the process.
+
+    List model choices only change on deploy, so the rows of a list
+    model are read once and reread only if a pk that is not cached is
+    seen.
+    """
+
+    def __init__(self):
+        self.registry = {}
+
+    def instances(self, model_cls, pks=()):
+        label = model_cls._meta.label_lower
+        instances = self.registry.get(label)
+        if instances is None or not instances.keys() >= set(pks):
+            instances = {obj.pk: obj for obj in model_cls.objects.all()}
+            self.registry[label] = instances
+        return instances
+
+    def evaluated(self, value):
+        """Returns an m2m cleaned_data value with its rows loaded from
+        the cache, so that counting and iterating it runs no further
+        queries.
+
+        An unevaluated queryset costs one query for its pks and is
+        returned as an equivalent queryset with its result cache
+        filled. Any other value is returned as is.
+        """
+        if not isinstance(value, QuerySet) or value._result_cache is not None:
+            return value
+        pks = list(value.values_list('pk', flat=True))
+        instances = self.instances(value.model, pks)
+        evaluated = value.model.objects.filter(pk__in=pks)
+        evaluated._result_cache = [instances[pk] for pk in pks]
+        evaluated._prefetch_done = True
+        return evaluated
+
+    def selected(self, value):
+        """Returns {short_name: name} for the list model instances in an
+        m2m cleaned_data value, a queryset or a list of instances.
+        """
+        if value is None:
+            return {}
+        return {obj.short_name: obj.name for obj in self.evaluated(value)}
+
+    def clear(self):
+        self.registry = {}
+
+
+list_model_cache = ListModelCache()
+
+
+class M2MSelectionsMixin:
+    """Resolves each m2m field once per validation, see `m2m_value`, so
+    that the FormValidator m2m helpers and `m2m_selected` share one
+    query per field instead of re-evaluating the queryset on each call.
+
+    The helpers themselves are the FormValidator ones, with their
+    messages, error codes and defaults.
+    """
+
+    def m2m_value(self, m2m_field):
+        """Returns the cleaned_data value of `m2m_field`, evaluated once.
+        """
+        values = self.__dict__.setdefault('_m2m_values', {})
+        value = self.cleaned_data.get(m2m_field)
+        key = (m2m_field, id(value))
+        if key not in values:
+            values[key] = (value, list_model_cache.evaluated(value))
+        return values[key][1]
+
+    @contextmanager
+    def m2m_evaluated(self, m2m_field):
+        """Stands the evaluated value in for `m2m_field` in cleaned_data
+        for the duration of the block.
+        """
+        value = self.cleaned_data.get(m2m_field)
+        evaluated = self.m2m_value(m2m_field)
+        if evaluated is value:
+            yield
+            return
+        self.cleaned_data[m2m_field] = evaluated
+        try:
+            yield
+        finally:
+            self.cleaned_data[m2m_field] = value
+
+    def m2m_selections(self, m2m_field):
+        """Returns {short_name: name} selected in `m2m_field`.
+        """
+        return list_model_cache.selected(self.m2m_value(m2m_field))
+
+    def m2m_selected(self, m2m_field):
+        """Returns a frozenset of the short names selected in `m2m_field`.
+        """
+        return frozenset(self.m2m_selections(m2m_field))
+
+    def m2m_required(self, m2m_field=None, **kwargs):
+        with self.m2m_evaluated(m2m_field):
+            return super().m2m_required(m2m_field=m2m_field, **kwargs)
+
+    def m2m_single_selection_if(self, *single_selections, m2m_field=None):
+        with self.m2m_evaluated(m2m_field):
+            return super().m2m_single_selection_if(
+                *single_selections, m2m_field=m2m_field)
+
+    def m2m_other_specify(self, *responses, m2m_field=None, field_other=None):
+        with self.m2m_evaluated(m2m_field):
+            return super().m2m_other_specify(
+                *responses, m2m_field=m2m_field, field_other=field_other)
@@ -1,10 +1,11 @@
 from django import forms
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
 
 from edc_constants.constants import YES, NO
 from edc_form_validators import FormValidator
 from .crf_form_validator import FormValidatorMixin
+from .rules import pure_rule
+from .model_cls_resolver import model_cls_resolver
 
 
 class MaternalArvDuringPregFormValidator(FormValidatorMixin, FormValidator):
@@ -13,31 +14,29 @@ class MaternalArvDuringPregFormValidator(FormValidatorMixin, FormValidator):
 
     @property
     def arvs_pre_preg_cls(self):
-        return django_apps.get_model(self.arvs_pre_preg_model)
+        return model_cls_resolver.get_model(self, self.arvs_pre_preg_model)
 
     def clean(self):
         self.subject_identifier = self.cleaned_data.get(
             'maternal_visit').subject_identifier
-        super().clean()
 
-        self.applicable_if(
-            YES,
-            field='took_arv',
-            field_applicable='is_interrupt')
-
-        self.applicable_if(
-            YES,
-            field='is_interrupt',
-            field_applicable='interrupt',
-        )
-
-        self.validate_other_specify(
-            field='interrupt',
-            other_specify_field='interrupt_other',
-            required_msg='Please give reason for interruption'
-        )
-        
-        self.validate_avr_pre_pregnancy()
+        self.run_rules(
+            super().clean,
+            pure_rule(lambda: self.applicable_if(
+                YES,
+                field='took_arv',
+                field_applicable='is_interrupt')),
+            pure_rule(lambda: self.applicable_if(
+                YES,
+                field='is_interrupt',
+                field_applicable='interrupt',
+            )),
+            pure_rule(lambda: self.validate_other_specify(
+                field='interrupt',
+                other_specify_field='interrupt_other',
+                required_msg='Please give reason for interruption'
+            )),
+            self.validate_avr_pre_pregnancy)
         
     def validate_avr_pre_pregnancy(self,arvs_pre_preg=None):
         try:
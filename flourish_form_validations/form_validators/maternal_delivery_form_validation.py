@@ -1,11 +1,13 @@
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
+from django.utils.functional import cached_property
 from edc_base.utils import relativedelta
 from edc_constants.constants import POS, YES, NOT_APPLICABLE, OTHER, NONE
 from edc_form_validators import FormValidator
-from flourish_caregiver.helper_classes import MaternalStatusHelper
 
 from .crf_form_validator import FormValidatorMixin
+from .rules import pure_rule
+from .maternal_hiv_status import CachedMaternalStatusHelper
+from .model_cls_resolver import model_cls_resolver
 
 
 class MaternalDeliveryFormValidator(FormValidatorMixin,
@@ -17,26 +19,38 @@ class MaternalDeliveryFormValidator(FormValidatorMixin,
 
     @property
     def ultrasound_cls(self):
-        return django_apps.get_model(self.ultrasound_model)
+        return model_cls_resolver.get_model(self, self.ultrasound_model)
 
     @property
     def maternal_visit_cls(self):
-        return django_apps.get_model(self.maternal_visit_model)
+        return model_cls_resolver.get_model(self, self.maternal_visit_model)
 
     @property
     def maternal_arv_cls(self):
-        return django_apps.get_model(self.maternal_arv_model)
+        return model_cls_resolver.get_model(self, self.maternal_arv_model)
 
     @property
     def arvs_pre_pregnancy_cls(self):
-        return django_apps.get_model(self.arvs_pre_pregnancy)
+        return model_cls_resolver.get_model(self, self.arvs_pre_pregnancy)
 
     def clean(self):
         self.subject_identifier = self.cleaned_data.get('subject_identifier')
 
-        super().clean()
-        self.validate_against_consent_datetime(self.cleaned_data.get('report_datetime'))
-
+        self.run_rules(
+            super().clean,
+            lambda: self.validate_against_consent_datetime(
+                self.cleaned_data.get('report_datetime')),
+            self.validate_csection_reason,
+            self.validate_against_maternal_delivery,
+            lambda: self.validate_ultrasound(cleaned_data=self.cleaned_data),
+            lambda: self.validate_valid_regime_hiv_pos_only(
+                cleaned_data=self.cleaned_data),
+            pure_rule(lambda: self.validate_live_births_still_birth(
+                cleaned_data=self.cleaned_data)),
+            self.validate_other)
+
+    @pure_rule
+    def validate_csection_reason(self):
         condition = self.cleaned_data.get(
             'mode_delivery') and 'c-section' in self.cleaned_data.get('mode_delivery')
         self.required_if_true(
@@ -44,12 +58,6 @@ class MaternalDeliveryFormValidator(FormValidatorMixin,
             field_required='csection_reason'
         )
 
-        self.validate_against_maternal_delivery()
-        self.validate_ultrasound(cleaned_data=self.cleaned_data)
-        self.validate_valid_regime_hiv_pos_only(cleaned_data=self.cleaned_data)
-        self.validate_live_births_still_birth(cleaned_data=self.cleaned_data)
-        self.validate_other()
-
     def validate_ultrasound(self, cleaned_data=None):
         ultrasound = self.ultrasound_cls.objects.filter(
             maternal_visit__subject_identifier=cleaned_data.get(
@@ -148,14 +156,14 @@ class MaternalDeliveryFormValidator(FormValidatorMixin,
             m2m_field='delivery_complications',
             field_other='delivery_complications_other')
 
-    @property
+    @cached_property
     def maternal_status_helper(self):
         cleaned_data = self.cleaned_data
         latest_visit = self.maternal_visit_cls.objects.filter(
             subject_identifier=cleaned_data.get(
                 'subject_identifier')).order_by('-created').first()
         if latest_visit:
-            return MaternalStatusHelper(latest_visit)
+            return CachedMaternalStatusHelper(latest_visit)
         else:
             raise ValidationError(
                 'Please complete previous visits before filling in '
@@ -1,11 +1,15 @@
 from django.core.exceptions import ValidationError
+from django.utils.functional import cached_property
 from edc_constants.constants import YES, NOT_APPLICABLE, POS, OTHER
 from edc_form_validators.form_validator import FormValidator
-from flourish_caregiver.helper_classes import MaternalStatusHelper
+
 from .crf_form_validator import FormValidatorMixin
+from .list_model_cache import M2MSelectionsMixin
+from .maternal_hiv_status import CachedMaternalStatusHelper
 
 
-class MaternalDiagnosesFormValidator(FormValidatorMixin, FormValidator):
+class MaternalDiagnosesFormValidator(M2MSelectionsMixin, FormValidatorMixin,
+                                     FormValidator):
 
     def clean(self):
         subject_status = self.maternal_status_helper.hiv_status
@@ -49,9 +53,7 @@ class MaternalDiagnosesFormValidator(FormValidatorMixin, FormValidator):
 
     def m2m_na_validation(self, field=None, m2m_field=None, msg=None,
                           na_msg=None, na_response=None):
-        qs = self.cleaned_data.get(m2m_field).values_list(
-            'short_name', flat=True)
-        selection = list(qs.all())
+        selection = self.m2m_selected(m2m_field)
         if self.cleaned_data.get(field) == YES:
             if na_response in selection:
                 message = {m2m_field: msg}
@@ -68,9 +70,9 @@ class MaternalDiagnosesFormValidator(FormValidatorMixin, FormValidator):
                 m2m_field=m2m_field
             )
 
-    @property
+    @cached_property
     def maternal_status_helper(self):
         cleaned_data = self.cleaned_data
-        status_helper = MaternalStatusHelper(
+        status_helper = CachedMaternalStatusHelper(
             cleaned_data.get('maternal_visit'))
         return status_helper
@@ -0,0 +1,54 @@
+from django.utils.functional import cached_property
+
+from .subject_status_cache import SubjectStatusCache
+
+
+class MaternalHivStatus(SubjectStatusCache):
+    """Caches MaternalStatusHelper.hiv_status per visit so that all
+    status dependent validators share one evaluation.
+
+    A subject's statuses are invalidated when any model the helper
+    reads is saved or deleted for that subject, see `watched_models`.
+    Call `invalidate(subject_identifier)` to drop them explicitly.
+
+    The helper is imported on the first evaluation, so that importing
+    this module from AppConfig.ready() does not pull in
+    flourish_caregiver's helper classes; the models are watched by
+    label.
+    """
+
+    cache_prefix = 'flourish_form_validations.maternal_hiv_status'
+    timeout_setting = 'MATERNAL_HIV_STATUS_CACHE_TIMEOUT'
+
+    helper_cls = None
+
+    # models MaternalStatusHelper reads
+    watched_models = [
+        'flourish_caregiver.antenatalenrollment',
+        'flourish_caregiver.hivrapidtestcounseling',
+        'flourish_caregiver.maternaldataset']
+
+    def hiv_status(self, maternal_visit):
+        helper_cls = self.helper_cls
+        if helper_cls is None:
+            from flourish_caregiver.helper_classes import MaternalStatusHelper
+            helper_cls = MaternalStatusHelper
+        return self.get(
+            maternal_visit.subject_identifier, str(maternal_visit.pk),
+            lambda: helper_cls(maternal_visit).hiv_status)
+
+
+maternal_hiv_status = MaternalHivStatus()
+
+
+class CachedMaternalStatusHelper:
+    """Stands in for MaternalStatusHelper in the validators, reading
+    `hiv_status` through the shared per-visit cache.
+    """
+
+    def __init__(self, maternal_visit=None):
+        self.maternal_visit = maternal_visit
+
+    @cached_property
+    def hiv_status(self):
+        return maternal_hiv_status.hiv_status(self.maternal_visit)
@@ -0,0 +1,31 @@
+from django.apps import apps as django_apps
+
+
+class ModelClsResolver:
+    """Resolves model labels to model classes.
+
+    Resolved classes are cached per (validator class, label) once the
+    models are loaded, which includes AppConfig.ready(). The label is
+    part of the key so a `*_model` attribute that is reassigned (e.g.
+    by the tests) resolves afresh.
+    """
+
+    def __init__(self):
+        self.registry = {}
+
+    def get_model(self, validator, label):
+        validator_cls = validator if isinstance(validator, type) else type(validator)
+        key = (validator_cls, label)
+        try:
+            return self.registry[key]
+        except KeyError:
+            model_cls = django_apps.get_model(label)
+            if django_apps.models_ready:
+                self.registry[key] = model_cls
+            return model_cls
+
+    def clear(self):
+        self.registry = {}
+
+
+model_cls_resolver = ModelClsResolver()
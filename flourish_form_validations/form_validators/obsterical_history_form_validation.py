@@ -1,8 +1,13 @@
-from django.apps import apps as django_apps
+from collections import namedtuple
+
 from django.core.exceptions import ValidationError
+from django.utils.functional import cached_property
 from edc_form_validators.form_validator import FormValidator
 
 from .crf_form_validator import FormValidatorMixin
+from .model_cls_resolver import model_cls_resolver
+
+GaContext = namedtuple('GaContext', ['enrolled', 'ga_confirmed'])
 
 
 class ObstericalHistoryFormValidator(FormValidatorMixin, FormValidator):
@@ -12,53 +17,52 @@ class ObstericalHistoryFormValidator(FormValidatorMixin, FormValidator):
 
     @property
     def maternal_ultrasound_cls(self):
-        return django_apps.get_model(self.ultrasound_model)
+        return model_cls_resolver.get_model(self, self.ultrasound_model)
 
     @property
     def preg_women_screening_cls(self):
-        return django_apps.get_model(self.preg_women_screening_model)
+        return model_cls_resolver.get_model(self, self.preg_women_screening_model)
 
     @property
     def antenatal_enrollment_cls(self):
-        return django_apps.get_model(self.antenatal_enrollment_model)
+        return model_cls_resolver.get_model(self, self.antenatal_enrollment_model)
 
     def clean(self):
         super().clean()
         self.subject_identifier = self.cleaned_data.get(
             'maternal_visit').subject_identifier
-        self.validate_ultrasound(cleaned_data=self.cleaned_data)
-        self.validate_prev_pregnancies(cleaned_data=self.cleaned_data)
-        self.validate_children_delivery(cleaned_data=self.cleaned_data)
-
-    @property
-    def ultrasound_ga_confirmed(self):
-
+        self.run_rules(
+            lambda: self.validate_ultrasound(cleaned_data=self.cleaned_data),
+            lambda: self.validate_prev_pregnancies(cleaned_data=self.cleaned_data),
+            lambda: self.validate_children_delivery(cleaned_data=self.cleaned_data))
+
+    @cached_property
+    def ga_context(self):
+        """Returns the GaContext for the current pregnancy, resolved
+        once per validation.
+        """
         maternal_visit = self.cleaned_data.get('maternal_visit')
-        subject_identifier = maternal_visit.subject_identifier
+
+        enrolled = self.antenatal_enrollment_cls.objects.filter(
+            subject_identifier=self.subject_identifier).exists()
+        if not enrolled:
+            return GaContext(enrolled=False, ga_confirmed=0)
 
         try:
-            self.antenatal_enrollment_cls.objects.get(
-                subject_identifier=self.subject_identifier, )
-        except self.antenatal_enrollment_cls.DoesNotExist:
-            return 0
+            ultrasound = self.maternal_ultrasound_cls.objects.only(
+                'ga_confirmed').get(maternal_visit=maternal_visit)
+        except self.maternal_ultrasound_cls.DoesNotExist:
+            message = 'Please complete ultrasound form first.'
+            raise ValidationError(message)
         else:
-            try:
-
-                ultrasound = self.maternal_ultrasound_cls.objects.get(
-                    maternal_visit__subject_identifier=subject_identifier,
-                    maternal_visit=maternal_visit)
+            return GaContext(enrolled=True, ga_confirmed=ultrasound.ga_confirmed)
 
-            except self.maternal_ultrasound_cls.DoesNotExist:
-                message = 'Please complete ultrasound form first.'
-                raise ValidationError(message)
-            else:
-                return ultrasound.ga_confirmed
+    @property
+    def ultrasound_ga_confirmed(self):
+        return self.ga_context.ga_confirmed
 
     def validate_ultrasound(self, cleaned_data=None):
-        try:
-            self.antenatal_enrollment_cls.objects.get(
-                subject_identifier=self.subject_identifier, )
-        except self.antenatal_enrollment_cls.DoesNotExist:
+        if not self.ga_context.enrolled:
             return 0
         else:
             prev_pregnancies = cleaned_data.get('prev_pregnancies')
@@ -0,0 +1,87 @@
+from django.utils.functional import cached_property
+from edc_constants.constants import NEW
+
+from .subject_status_cache import SubjectStatusCache
+
+ON_STUDY = 'on_study'
+OFF_STUDY = 'off_study'
+PENDING_OFF_STUDY = 'pending_off_study'
+
+
+class OffstudyActionAdapter:
+    """Defers importing the edc_action_item registry and flourish_prn
+    action items until an off study status is first needed, so that
+    importing a validator does not load the action item registry.
+    """
+
+    @cached_property
+    def site_action_items(self):
+        from edc_action_item.site_action_items import site_action_items
+        return site_action_items
+
+    @cached_property
+    def action_name(self):
+        from flourish_prn.action_items import CAREGIVEROFF_STUDY_ACTION
+        return CAREGIVEROFF_STUDY_ACTION
+
+    def action_item_model_cls(self, caregiver_offstudy_cls):
+        action_cls = self.site_action_items.get(caregiver_offstudy_cls.action_name)
+        return action_cls.action_item_model_cls()
+
+
+class OffstudyStatus(SubjectStatusCache):
+    """Answers whether a caregiver is on study, off study or pending
+    off study (a NEW caregiver off study action item exists).
+
+    The status is cached per subject and invalidated when the action
+    item or caregiver off study model is saved or deleted.
+    """
+
+    cache_prefix = 'flourish_form_validations.offstudy_status'
+    timeout_setting = 'OFFSTUDY_STATUS_CACHE_TIMEOUT'
+    watched_models = [
+        'edc_action_item.actionitem',
+        'flourish_prn.caregiveroffstudy']
+
+    def __init__(self):
+        super().__init__()
+        self.actions = OffstudyActionAdapter()
+
+    def status(self, caregiver_offstudy_cls=None, subject_identifier=None):
+        return self.statuses(
+            caregiver_offstudy_cls=caregiver_offstudy_cls,
+            subject_identifiers=[subject_identifier])[subject_identifier]
+
+    def statuses(self, caregiver_offstudy_cls=None, subject_identifiers=None):
+        """Returns a dict of {subject_identifier: status}, resolving the
+        subjects that are not cached in two queries.
+        """
+        action_item_model_cls = self.actions.action_item_model_cls(
+            caregiver_offstudy_cls)
+        action_name = self.actions.action_name
+        self.watch(action_item_model_cls, caregiver_offstudy_cls)
+
+        def resolve_many(subject_identifiers):
+            pending = set(action_item_model_cls.objects.filter(
+                subject_identifier__in=subject_identifiers,
+                action_type__name=action_name,
+                status=NEW).values_list('subject_identifier', flat=True))
+            off_study = set(caregiver_offstudy_cls.objects.filter(
+                subject_identifier__in=subject_identifiers).values_list(
+                    'subject_identifier', flat=True))
+            statuses = {}
+            for subject_identifier in subject_identifiers:
+                if subject_identifier in pending:
+                    statuses[subject_identifier] = PENDING_OFF_STUDY
+                elif subject_identifier in off_study:
+                    statuses[subject_identifier] = OFF_STUDY
+                else:
+                    statuses[subject_identifier] = ON_STUDY
+            return statuses
+
+        return self.get_many(
+            subject_identifiers, caregiver_offstudy_cls._meta.label_lower,
+            resolve_many)
+
+
+offstudy_status = OffstudyStatus()
@@ -0,0 +1,6 @@
+import re
+
+# up to two upper case first names separated by a space
+FIRST_NAME_PATTERN = re.compile(r'^[A-Z]+$|^([A-Z]+[ ][A-Z]+)$')
+LAST_NAME_PATTERN = re.compile(r'^[A-Z-]+$')
+IDENTITY_PATTERN = re.compile('[0-9]+$')
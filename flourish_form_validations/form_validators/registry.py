@@ -0,0 +1,137 @@
+from importlib import import_module
+
+
+class AlreadyRegistered(Exception):
+    pass
+
+
+class NotRegistered(Exception):
+    pass
+
+
+class ValidatorRegistry:
+    """Maps a model label to the form validator class that validates
+    it.
+
+    A validator is registered either directly, with the class:
+
+        @site_validators.register('flourish_caregiver.ultrasound')
+        class UltrasoundFormValidator(...):
+            ...
+
+    or lazily, by class name, in which case its module is only imported
+    when the model is first looked up:
+
+        site_validators.register_lazy(
+            'flourish_caregiver.ultrasound', 'UltrasoundFormValidator')
+
+    A lazy name is a class exported from `form_validators` or a dotted
+    path to the class.
+    """
+
+    def __init__(self, lazy=None):
+        self.registry = {}
+        self.lazy = dict(lazy or {})
+
+    def __contains__(self, label):
+        return label in self.registry or label in self.lazy
+
+    @property
+    def labels(self):
+        return sorted(set(self.registry) | set(self.lazy))
+
+    def labels_for(self, validator_cls):
+        """Returns the model labels `validator_cls` is registered for,
+        without importing any lazily registered validator.
+        """
+        return sorted(
+            [label for label, registered in self.registry.items()
+             if registered is validator_cls]
+            + [label for label, name in self.lazy.items()
+               if name.rpartition('.')[2] == validator_cls.__name__])
+
+    def register(self, *labels):
+        def wrapper(validator_cls):
+            for label in labels:
+                if label in self:
+                    raise AlreadyRegistered(
+                        f'A validator is already registered for {label}.')
+                self.registry[label] = validator_cls
+            return validator_cls
+        return wrapper
+
+    def register_lazy(self, label, name):
+        if label in self:
+            raise AlreadyRegistered(
+                f'A validator is already registered for {label}.')
+        self.lazy[label] = name
+
+    def get(self, label):
+        """Returns the validator class for `label`, importing its module
+        on the first lookup of a lazily registered label.
+        """
+        try:
+            return self.registry[label]
+        except KeyError:
+            pass
+        try:
+            name = self.lazy.pop(label)
+        except KeyError:
+            raise NotRegistered(
+                f'No validator registered for {label}.') from None
+        self.registry[label] = self.load(name)
+        return self.registry[label]
+
+    def load(self, name):
+        module_name, _, cls_name = name.rpartition('.')
+        module = import_module(module_name or __package__)
+        return getattr(module, cls_name)
+
+
+site_validators = ValidatorRegistry(lazy={
+    'flourish_caregiver.antenatalenrollment': 'AntenatalEnrollmentFormValidator',
+    'flourish_caregiver.arvsprepregnancy': 'ArvsPrePregnancyFormValidator',
+    'flourish_caregiver.breastfeedingquestionnaire':
+        'BreastFeedingQuestionnaireFormValidator',
+    'flourish_caregiver.caregiverclinicalmeasurements':
+        'CaregiverClinicalMeasurementsFormValidator',
+    'flourish_caregiver.caregiverlocator': 'CaregiverLocatorFormValidator',
+    'flourish_caregiver.caregiverpreviouslyenrolled':
+        'CaregiverPrevEnrolledFormValidator',
+    'flourish_caregiver.caregiverreferral': 'CaregiverReferralFormValidator',
+    'flourish_caregiver.caregiversocialworkreferral':
+        'CaregiverSocialWorkReferralFormValidator',
+    'flourish_caregiver.covid19': 'Covid19FormValidator',
+    'flourish_caregiver.foodsecurityquestionnaire':
+        'FoodSecurityQuestionnaireFormValidator',
+    'flourish_caregiver.hivrapidtestcounseling':
+        'HIVRapidTestCounselingFormValidator',
+    'flourish_caregiver.hivviralloadandcd4': 'HivViralLoadCd4FormValidator',
+    'flourish_caregiver.maternalarvduringpreg':
+        'MaternalArvDuringPregFormValidator',
+    'flourish_caregiver.maternaldelivery': 'MaternalDeliveryFormValidator',
+    'flourish_caregiver.maternaldiagnoses': 'MaternalDiagnosesFormValidator',
+    'flourish_caregiver.maternalhivinterimhx':
+        'MaternalHivInterimHxFormValidator',
+    'flourish_caregiver.maternalinterimidcc': 'MaternalIterimIdccFormValidator',
+    'flourish_caregiver.medicalhistory': 'MedicalHistoryFormValidator',
+    'flourish_caregiver.obstericalhistory': 'ObstericalHistoryFormValidator',
+    'flourish_caregiver.sociodemographicdata':
+        'SocioDemographicDataFormValidator',
+    'flourish_caregiver.subjectconsent': 'SubjectConsentFormValidator',
+    'flourish_caregiver.substanceuseduringpregnancy':
+        'SubstanceUseDuringPregFormValidator',
+    'flourish_caregiver.substanceusepriorpregnancy':
+        'SubstanceUsePriorFormValidator',
+    'flourish_caregiver.tbhistorypreg': 'TbHistoryPregFormValidator',
+    'flourish_caregiver.tbpresencehouseholdmembers':
+        'TbPresenceHouseholdMembersFormValidator',
+    'flourish_caregiver.tbreferral': 'TbReferralFormValidator',
+    'flourish_caregiver.tbroutinehealthscreen':
+        'TbRoutineHealthScreenFormValidator',
+    'flourish_caregiver.tbscreenpregnancy': 'TbScreenPregFormValidator',
+    'flourish_caregiver.tbstudyeligibility': 'TbStudyEligibilityFormValidator',
+    'flourish_caregiver.tbvisitscreeningwomen':
+        'TbVisitScreeningWomenFormValidator',
+    'flourish_caregiver.ultrasound': 'UltrasoundFormValidator',
+})
@@ -0,0 +1,235 @@
+from django.core.exceptions import ValidationError
+
+from .collect_errors import CollectErrorsMixin
+from .rules import IO, PURE, rule_cost
+
+
+def fields_in(kwargs):
+    fields = []
+    for key, value in kwargs.items():
+        if key == 'field' or key.startswith(('field_', 'm2m_', 'other_')):
+            fields.extend(value if isinstance(value, (list, tuple)) else [value])
+    return fields
+
+
+class Rule:
+    """A row of a declarative rule table, dispatched to a FormValidator
+    method. `fields` lists the fields the rule reads and `reports_arg`
+    names the argument holding the field it reports errors on. `cost`
+    is IO for rows that query the database, see `rules.pure_rule`.
+    """
+
+    method = None
+    dependent_arg = None
+    reports_arg = None
+    cost = PURE
+
+    def __init__(self, *responses, **kwargs):
+        self.responses = responses
+        self.kwargs = kwargs
+
+    def __repr__(self):
+        return f'{self.__class__.__name__}(*{self.responses}, **{self.kwargs})'
+
+    def compile(self):
+        """Returns a list of (method name, args, kwargs), one per
+        dependent field.
+        """
+        dependents = self.kwargs.get(self.dependent_arg)
+        if isinstance(dependents, (list, tuple)):
+            return [(self.method, self.responses,
+                     dict(self.kwargs, **{self.dependent_arg: dependent}))
+                    for dependent in dependents]
+        return [(self.method, self.responses, self.kwargs)]
+
+    @property
+    def fields(self):
+        return fields_in(self.kwargs)
+
+    def dependencies(self):
+        """Returns a list of (fields read, field reported), one per
+        compiled rule.
+        """
+        return [(frozenset(fields_in(kwargs)), kwargs.get(self.reports_arg))
+                for _, _, kwargs in self.compile()]
+
+
+class RequiredIf(Rule):
+    method = 'required_if'
+    dependent_arg = 'field_required'
+    reports_arg = 'field_required'
+
+
+class NotRequiredIf(Rule):
+    method = 'not_required_if'
+    dependent_arg = 'field_required'
+    reports_arg = 'field_required'
+
+
+class ApplicableIf(Rule):
+    method = 'applicable_if'
+    dependent_arg = 'field_applicable'
+    reports_arg = 'field_applicable'
+
+
+class OtherSpecify(Rule):
+    method = 'validate_other_specify'
+    reports_arg = 'other_specify_field'
+
+    def dependencies(self):
+        other_specify_field = (self.kwargs.get('other_specify_field')
+                               or f'{self.kwargs.get("field")}_other')
+        return [(frozenset([self.kwargs.get('field'), other_specify_field]),
+                 other_specify_field)]
+
+
+class M2MRequiredIf(Rule):
+    cost = IO
+    method = 'm2m_required_if'
+    reports_arg = 'm2m_field'
+
+
+class M2MOtherSpecify(Rule):
+    cost = IO
+    method = 'm2m_other_specify'
+    reports_arg = 'field_other'
+
+
+class M2MSingleSelectionIf(Rule):
+    cost = IO
+    method = 'm2m_single_selection_if'
+    reports_arg = 'm2m_field'
+
+
+class Range(Rule):
+    """Value of `field_range` must lie within min and max, optionally
+    only if `field` is one of `responses`. Empty values are skipped.
+    """
+
+    method = 'validate_range'
+    reports_arg = 'field_range'
+
+
+def rule_table_validator(cost):
+    """Returns a `validate_rule_table` method tagged with `cost`.
+    """
+
+    def validate_rule_table(self):
+        collected = {}
+        for function, args, kwargs in self.compiled_rules:
+            self.collect(collected, function, self, *args, **kwargs)
+        if collected:
+            raise ValidationError(collected)
+
+    validate_rule_table.rule_cost = cost
+    return validate_rule_table
+
+
+class RuleTableMixin(CollectErrorsMixin):
+    """Validates the declarative `rules` table of a validator class.
+
+    The table is compiled once per class, when the class is created,
+    into `compiled_rules`: a flat tuple of (function, args, kwargs)
+    with the FormValidator method resolved, so validation is a single
+    pass that calls each function in turn.
+
+    `rule_dependencies` holds the (fields read, field reported) of
+    each compiled rule, in the same order, for `validate_fields`.
+
+    `validate_rule_table` is a pure rule unless a row of the table
+    queries the database, as the m2m rows do for their selections.
+
+        class SubstanceUsePriorFormValidator(RuleTableMixin, ...):
+            rules = [
+                RequiredIf(YES, field='smoked_prior_to_preg',
+                           field_required='smoking_prior_preg_freq'),
+                ...]
+    """
+
+    rules = []
+    compiled_rules = ()
+    rule_dependencies = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls.compiled_rules = tuple(
+            (getattr(cls, method), args, kwargs)
+            for rule in cls.rules
+            for method, args, kwargs in rule.compile())
+        cls.rule_dependencies = tuple(
+            dependency for rule in cls.rules
+            for dependency in rule.dependencies())
+        cost = IO if any(rule.cost == IO for rule in cls.rules) else PURE
+        if ('validate_rule_table' not in vars(cls)
+                and rule_cost(cls.validate_rule_table) != cost):
+            cls.validate_rule_table = rule_table_validator(cost)
+
+    @classmethod
+    def dependency_graph(cls):
+        """Returns {field: fields reported by the rules that read it}.
+        """
+        graph = {}
+        for reads, reports in cls.rule_dependencies:
+            for field in reads:
+                graph.setdefault(field, set()).add(reports)
+        return graph
+
+    @classmethod
+    def affected_fields(cls, changed_fields):
+        """Returns the fields whose rules read any of `changed_fields`,
+        in table order.
+        """
+        changed_fields = set(changed_fields)
+        fields = []
+        for reads, reports in cls.rule_dependencies:
+            if reads & changed_fields and reports not in fields:
+                fields.append(reports)
+        return fields
+
+    @classmethod
+    def rule_table_fields(cls):
+        """Returns the fields read by the rule table, in table order.
+        """
+        fields = []
+        for rule in cls.rules:
+            fields.extend(field for field in rule.fields if field not in fields)
+        return fields
+
+    def validate_range(self, *responses, field=None, field_range=None,
+                       min=None, max=None, exclusive_min=False,
+                       exclusive_max=False, message=None):
+        if field and self.cleaned_data.get(field) not in responses:
+            return
+        value = self.cleaned_data.get(field_range)
+        if value is None:
+            return
+        if ((min is not None and (value <= min if exclusive_min else value < min))
+                or (max is not None and (value >= max if exclusive_max else value > max))):
+            message = {field_range: message or 'Value is out of range.'}
+            self._errors.update(message)
+            raise ValidationError(message)
+
+    validate_rule_table = rule_table_validator(PURE)
+
+    def validate_fields(self, changed_fields):
+        """Runs only the rule table rows that read any of
+        `changed_fields`, for instant feedback as a form is filled in.
+
+        The rules in `clean` run when the form is saved. Errors for
+        every affected field are collected and raised together.
+        """
+        changed_fields = set(changed_fields)
+        collected = {}
+        for (function, args, kwargs), (reads, _) in zip(
+                self.compiled_rules, self.rule_dependencies):
+            if not reads & changed_fields:
+                continue
+            try:
+                function(self, *args, **kwargs)
+            except ValidationError as e:
+                if not hasattr(e, 'error_dict'):
+                    raise
+                for field, errors in e.error_dict.items():
+                    collected.setdefault(field, errors)
+        if collected:
+            raise ValidationError(collected)
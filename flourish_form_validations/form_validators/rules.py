@@ -0,0 +1,40 @@
+PREREQUISITE = 'prerequisite'
+PURE = 'pure'
+IO = 'io'
+
+SCHEDULE_ORDER = {PREREQUISITE: 0, PURE: 1, IO: 2}
+
+
+def prerequisite_rule(rule):
+    """Marks a rule as checking that the forms this one depends on are
+    complete, so that it is scheduled before all other rules.
+    """
+    rule.rule_cost = PREREQUISITE
+    return rule
+
+
+def pure_rule(rule):
+    """Marks a rule as reading only `cleaned_data`, so that it is
+    scheduled before the rules that query the database.
+    """
+    rule.rule_cost = PURE
+    return rule
+
+
+def io_rule(rule):
+    """Marks a rule as querying the database or another service.
+    Untagged rules are treated as I/O bound.
+    """
+    rule.rule_cost = IO
+    return rule
+
+
+def rule_cost(rule):
+    return getattr(rule, 'rule_cost', IO)
+
+
+def schedule(rules):
+    """Returns the prerequisite rules, then the pure rules, then the rest,
+    otherwise keeping their given order.
+    """
+    return sorted(rules, key=lambda rule: SCHEDULE_ORDER[rule_cost(rule)])
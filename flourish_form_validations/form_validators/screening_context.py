@@ -0,0 +1,38 @@
+from django.utils.functional import cached_property
+
+
+class ScreeningContext:
+    """The screening records of one screening identifier that the
+    SubjectConsentFormValidator eligibility rules compare the consent
+    against: the pregnant women screening, the prior BHP participant
+    screening and, if the validator names a locator model, the
+    caregiver locator. A record that does not exist is kept as None,
+    so each table is read at most once.
+    """
+
+    def __init__(self, validator=None, screening_identifier=None):
+        self.validator = validator
+        self.screening_identifier = screening_identifier
+
+    @cached_property
+    def preg_women_screening(self):
+        return self.get_or_none(self.validator.preg_women_screening_cls)
+
+    @cached_property
+    def bhp_prior_screening(self):
+        return self.get_or_none(self.validator.bhp_prior_screening_cls)
+
+    @cached_property
+    def caregiver_locator(self):
+        if self.validator.caregiver_locator_cls:
+            return self.get_or_none(self.validator.caregiver_locator_cls)
+        return None
+
+    def get_or_none(self, model_cls):
+        try:
+            model_obj = model_cls.objects.get(
+                screening_identifier=self.screening_identifier)
+        except model_cls.DoesNotExist:
+            return None
+        else:
+            return model_obj
@@ -1,8 +1,8 @@
 from tkinter.messagebox import YES
-from django.apps import apps as django_apps
 from edc_form_validators import FormValidator
 
 from .crf_form_validator import FormValidatorMixin
+from .model_cls_resolver import model_cls_resolver
 
 
 class SocioDemographicDataFormValidator(FormValidatorMixin, FormValidator):
@@ -15,19 +15,19 @@ class SocioDemographicDataFormValidator(FormValidatorMixin, FormValidator):
 
     @property
     def maternal_dataset_cls(self):
-        return django_apps.get_model(self.maternal_dataset_model)
+        return model_cls_resolver.get_model(self, self.maternal_dataset_model)
     
     @property
     def antenatal_enrollment_cls(self):
-        return django_apps.get_model(self.antenatal_enrollment_model)
+        return model_cls_resolver.get_model(self, self.antenatal_enrollment_model)
 
     @property
     def preg_screening_cls(self):
-        return django_apps.get_model(self.preg_women_screening_model)
+        return model_cls_resolver.get_model(self, self.preg_women_screening_model)
 
     @property
     def delivery_model_cls(self):
-        return django_apps.get_model(self.delivery_model)
+        return model_cls_resolver.get_model(self, self.delivery_model)
 
     def clean(self):
         self.subject_identifier = self.cleaned_data.get(
@@ -1,16 +1,23 @@
-import re
 from django import forms
-from django.apps import apps as django_apps
 from django.core.exceptions import ValidationError
+from django.db.models import CharField
+from django.db.models.functions import Cast
+from django.utils.encoding import force_str
 from edc_base.utils import relativedelta
 from edc_constants.constants import FEMALE, MALE, NO, YES, NOT_APPLICABLE
 from edc_form_validators import FormValidator
 
+from .collect_errors import CollectErrorsMixin
 from .consents_form_validator_mixin import ConsentsFormValidatorMixin
+from .model_cls_resolver import model_cls_resolver
+from .patterns import FIRST_NAME_PATTERN, IDENTITY_PATTERN, LAST_NAME_PATTERN
+from .rules import pure_rule
+from .screening_context import ScreeningContext
 from .subject_consent_eligibilty import SubjectConsentEligibility
+from .validation_context import context_property
 
 
-class SubjectConsentFormValidator(ConsentsFormValidatorMixin,
+class SubjectConsentFormValidator(CollectErrorsMixin, ConsentsFormValidatorMixin,
                                   SubjectConsentEligibility, FormValidator):
 
     prior_screening_model = 'flourish_caregiver.screeningpriorbhpparticipants'
@@ -23,25 +30,34 @@ class SubjectConsentFormValidator(ConsentsFormValidatorMixin,
 
     delivery_model = 'flourish_caregiver.maternaldelivery'
 
+    reconsent_fields = [
+        'first_name', 'last_name', 'dob', 'recruit_source',
+        'recruit_source_other', 'recruitment_clinic',
+        'recruitment_clinic_other', 'is_literate', 'identity',
+        'identity_type']
+
+    screening_context = context_property(
+        ScreeningContext, 'screening_identifier')
+
     @property
     def bhp_prior_screening_cls(self):
-        return django_apps.get_model(self.prior_screening_model)
+        return model_cls_resolver.get_model(self, self.prior_screening_model)
 
     @property
     def subject_consent_cls(self):
-        return django_apps.get_model(self.subject_consent_model)
+        return model_cls_resolver.get_model(self, self.subject_consent_model)
 
     @property
     def caregiver_locator_cls(self):
-        return django_apps.get_model(self.caregiver_locator_model)
+        return model_cls_resolver.get_model(self, self.caregiver_locator_model)
 
     @property
     def preg_women_screening_cls(self):
-        return django_apps.get_model(self.preg_women_screening_model)
+        return model_cls_resolver.get_model(self, self.preg_women_screening_model)
 
     @property
     def delivery_cls(self):
-        return django_apps.get_model(self.delivery_model)
+        return model_cls_resolver.get_model(self, self.delivery_model)
 
     def clean(self):
         cleaned_data = self.cleaned_data
@@ -49,54 +65,89 @@ class SubjectConsentFormValidator(ConsentsFormValidatorMixin,
         self.screening_identifier = cleaned_data.get('screening_identifier')
         super().clean()
 
-        self.clean_gender()
-        self.clean_full_name_syntax()
-        self.validate_prior_participant_names()
-        self.clean_initials_with_full_name()
-        self.validate_recruit_source()
-        self.validate_recruitment_clinic()
-        self.validate_is_literate()
-        self.validate_dob(cleaned_data=self.cleaned_data)
-        self.validate_identity_number(cleaned_data=self.cleaned_data)
-        self.validate_breastfeed_intent()
-        self.validate_child_consent()
-        self.validate_reconsent()
+        self.run_rules(
+            self.clean_gender,
+            self.clean_full_name_syntax,
+            self.validate_prior_participant_names,
+            self.clean_initials_with_full_name,
+            self.validate_recruit_source,
+            self.validate_recruitment_clinic,
+            self.validate_is_literate,
+            lambda: self.validate_dob(cleaned_data=self.cleaned_data),
+            pure_rule(lambda: self.validate_identity_number(
+                cleaned_data=self.cleaned_data)),
+            self.validate_breastfeed_intent,
+            self.validate_child_consent,
+            self.validate_reconsent)
 
     def validate_reconsent(self):
+        """Compares the re-consent against the consent previously given
+        for this version.
+
+        Encrypted fields are compared on their stored hashes, so the
+        previous consent is only decrypted for a field that differs.
+        """
+        consent_cls = self.subject_consent_cls
+        # raises FieldDoesNotExist for a misnamed reconsent field
+        model_fields = {
+            field: consent_cls._meta.get_field(field)
+            for field in self.reconsent_fields}
+        reconsent_fields = self.reconsent_fields
+        encrypted_fields = [
+            field for field in reconsent_fields
+            if hasattr(model_fields[field], 'field_cryptor')]
+        stored_values = {
+            f'{field}_stored': Cast(field, output_field=CharField())
+            for field in encrypted_fields}
         try:
-            consent_obj = self.subject_consent_cls.objects.get(
-                subject_identifier=self.cleaned_data.get('subject_identifier'),
-                version=self.cleaned_data.get('version'))
-        except self.subject_consent_cls.DoesNotExist:
+            consent_values = consent_cls.objects.values(
+                'pk', *[field for field in reconsent_fields
+                        if field not in encrypted_fields],
+                **stored_values).get(
+                    subject_identifier=self.cleaned_data.get('subject_identifier'),
+                    version=self.cleaned_data.get('version'))
+        except consent_cls.DoesNotExist:
             pass
         else:
-            consent_dict = consent_obj.__dict__
-            consent_fields = [
-                'first_name', 'last_name', 'dob', 'recruit_source',
-                'recruit_source_other', 'recruitment_clinic',
-                'recruitment_clinic_other', 'is_literate', 'identity',
-                'identity_type']
-            for field in consent_fields:
-                if self.cleaned_data.get(field) != consent_dict[field]:
+            for field in reconsent_fields:
+                value = self.cleaned_data.get(field)
+                if field in encrypted_fields:
+                    changed = not self.encrypted_value_matches(
+                        model_fields[field], consent_values[f'{field}_stored'], value)
+                else:
+                    changed = value != consent_values[field]
+                if changed:
+                    previous = consent_cls.objects.values_list(
+                        field, flat=True).get(pk=consent_values['pk'])
                     message = {field:
                                f'{field} was previously reported as, '
-                               f'{consent_dict[field]}, please correct.'}
+                               f'{previous}, please correct.'}
                     self._errors.update(message)
                     raise ValidationError(message)
 
+    def encrypted_value_matches(self, field, stored_value, value):
+        """Returns True if `value` hashes to the hash held in the raw
+        `stored_value` of the encrypted `field`.
+        """
+        if value in [None, ''] or stored_value in [None, '']:
+            return value == stored_value
+        query_value = force_str(field.field_cryptor.get_query_value(value))
+        return force_str(stored_value).startswith(query_value)
+
+    @pure_rule
     def clean_full_name_syntax(self):
         cleaned_data = self.cleaned_data
         first_name = cleaned_data.get("first_name")
         last_name = cleaned_data.get("last_name")
 
-        if first_name and not re.match(r'^[A-Z]+$|^([A-Z]+[ ][A-Z]+)$', first_name):
+        if first_name and not FIRST_NAME_PATTERN.match(first_name):
             message = {'first_name': 'Ensure first name is letters (A-Z) in '
                        'upper case, no special characters, except spaces. Maximum 2 first '
                        'names allowed.'}
             self._errors.update(message)
             raise ValidationError(message)
 
-        if last_name and not re.match(r'^[A-Z-]+$', last_name):
+        if last_name and not LAST_NAME_PATTERN.match(last_name):
             message = {'last_name': 'Ensure last name is letters (A-Z) in '
                        'upper case, no special characters, except hyphens.'}
             self._errors.update(message)
@@ -119,6 +170,7 @@ class SubjectConsentFormValidator(ConsentsFormValidatorMixin,
             self._errors.update(message)
             raise ValidationError(message)
 
+    @pure_rule
     def clean_initials_with_full_name(self):
         cleaned_data = self.cleaned_data
         first_name = cleaned_data.get("first_name")
@@ -192,7 +244,7 @@ class SubjectConsentFormValidator(ConsentsFormValidatorMixin,
     def validate_identity_number(self, cleaned_data=None):
         identity = cleaned_data.get('identity')
         if identity:
-            if not re.match('[0-9]+$', identity):
+            if not IDENTITY_PATTERN.match(identity):
                 message = {'identity': 'Identity number must be digits.'}
                 self._errors.update(message)
                 raise ValidationError(message)
@@ -253,6 +305,7 @@ class SubjectConsentFormValidator(ConsentsFormValidatorMixin,
                     self._errors.update(message)
                     raise ValidationError(message)
 
+    @pure_rule
     def validate_recruit_source(self):
         self.validate_other_specify(
             field='recruit_source',
@@ -278,6 +331,7 @@ class SubjectConsentFormValidator(ConsentsFormValidatorMixin,
             self._errors.update(message)
             raise ValidationError(message)
 
+    @pure_rule
     def validate_is_literate(self):
         self.required_if(
             NO,
@@ -304,35 +358,15 @@ class SubjectConsentFormValidator(ConsentsFormValidatorMixin,
 
     @property
     def bhp_prior_screening(self):
-
-        try:
-            bhp_prior_screening = self.bhp_prior_screening_cls.objects.get(
-                screening_identifier=self.screening_identifier)
-        except self.bhp_prior_screening_cls.DoesNotExist:
-            return None
-        else:
-            return bhp_prior_screening
+        return self.screening_context.bhp_prior_screening
 
     @property
     def caregiver_locator(self):
-        if self.caregiver_locator_cls:
-            try:
-                caregiver_locator = self.caregiver_locator_cls.objects.get(
-                    screening_identifier=self.screening_identifier)
-            except self.caregiver_locator_cls.DoesNotExist:
-                return None
-            else:
-                return caregiver_locator
+        return self.screening_context.caregiver_locator
 
     @property
     def preg_women_screening(self):
-        try:
-            preg_women_screening = self.preg_women_screening_cls.objects.get(
-                screening_identifier=self.screening_identifier)
-        except self.preg_women_screening_cls.DoesNotExist:
-            return None
-        else:
-            return preg_women_screening
+        return self.screening_context.preg_women_screening
 
     @property
     def preg_delivery(self):
@@ -0,0 +1,67 @@
+from django.utils.functional import cached_property
+
+from .offstudy_status import offstudy_status
+
+
+class SubjectContext:
+    """The subject's latest consent, its consent version, off study
+    status and visit, as checked by FormValidatorMixin before every
+    CRF. Batch validation fills these in for many subjects at once
+    with `seed()`.
+
+    Model classes are read from the validator so that any `*_model`
+    overrides on the validator class are honoured.
+    """
+
+    consent_fields = ['subject_identifier', 'consent_datetime',
+                      'screening_identifier', 'dob', 'version']
+
+    def __init__(self, validator=None, subject_identifier=None):
+        self.validator = validator
+        self.subject_identifier = subject_identifier
+
+    def seed(self, **values):
+        """Sets already resolved values, e.g. `latest_consent`, so that
+        the matching cached properties do not query.
+        """
+        for name, value in values.items():
+            if not isinstance(getattr(type(self), name, None), cached_property):
+                raise AttributeError(f'{name} is not a SubjectContext lookup.')
+            self.__dict__[name] = value
+
+    @cached_property
+    def latest_consent(self):
+        """Returns the latest consent for the subject in a single query,
+        loading only the columns used by the validators so that the
+        encrypted identity columns are not decrypted.
+        """
+        subject_consent_cls = self.validator.subject_consent_cls
+        return subject_consent_cls.objects.filter(
+            subject_identifier=self.subject_identifier).only(
+                *self.consent_fields).order_by('-consent_datetime').first()
+
+    @cached_property
+    def consent_version(self):
+        if not self.latest_consent:
+            return None
+
+        consent_version_cls = self.validator.consent_version_cls
+        try:
+            consent_version = consent_version_cls.objects.get(
+                screening_identifier=self.latest_consent.screening_identifier)
+        except consent_version_cls.DoesNotExist:
+            return None
+        else:
+            return consent_version
+
+    @cached_property
+    def offstudy_status(self):
+        """Returns one of ON_STUDY, OFF_STUDY or PENDING_OFF_STUDY.
+        """
+        return offstudy_status.status(
+            caregiver_offstudy_cls=self.validator.caregiver_offstudy_cls,
+            subject_identifier=self.subject_identifier)
+
+    @cached_property
+    def visit(self):
+        return self.validator.cleaned_data.get('maternal_visit')
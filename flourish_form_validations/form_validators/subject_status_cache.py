@@ -0,0 +1,128 @@
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models.signals import post_save, post_delete
+
+# cache backends whose entries are not shared between processes
+LOCAL_CACHE_BACKENDS = [
+    'django.core.cache.backends.dummy.DummyCache',
+    'django.core.cache.backends.locmem.LocMemCache',
+]
+
+
+class SubjectStatusCache:
+    """Caches values derived from a subject's records in the Django
+    cache, one cache entry per subject.
+
+    The entry for a subject is dropped whenever an instance of a
+    watched model is saved or deleted for that subject. The receivers
+    for `watched_models` are connected by `watch_models()`, called from
+    AppConfig.ready(), so that every process invalidates on save, not
+    only the processes that have read a value.
+
+    Set the timeout setting to 0 to disable caching. If it is not set,
+    caching is disabled unless the default cache backend is shared
+    between processes; with a per process cache a save in one process
+    cannot drop the entries cached by the others.
+    """
+
+    cache_prefix = None
+    timeout_setting = None
+    default_timeout = 300
+    watched_models = []
+
+    def __init__(self):
+        self.watched = set()
+
+    @property
+    def timeout(self):
+        try:
+            return getattr(settings, self.timeout_setting)
+        except AttributeError:
+            backend = settings.CACHES.get('default', {}).get('BACKEND')
+            if backend in LOCAL_CACHE_BACKENDS:
+                return 0
+            return self.default_timeout
+
+    def cache_key(self, subject_identifier):
+        return f'{self.cache_prefix}:{subject_identifier}'
+
+    def get(self, subject_identifier, key, resolve):
+        """Returns the cached value for `key` or calls `resolve` and
+        caches the result.
+        """
+        if not self.timeout:
+            return resolve()
+        cache_key = self.cache_key(subject_identifier)
+        values = cache.get(cache_key) or {}
+        try:
+            return values[key]
+        except KeyError:
+            values[key] = resolve()
+            cache.set(cache_key, values, self.timeout)
+            return values[key]
+
+    def get_many(self, subject_identifiers, key, resolve_many):
+        """Returns a dict of {subject_identifier: value} for `key`,
+        calling `resolve_many` once with the subject identifiers that
+        are not cached. `resolve_many` must return a dict keyed by
+        subject identifier.
+        """
+        subject_identifiers = set(subject_identifiers)
+        if not self.timeout:
+            return resolve_many(subject_identifiers)
+        cache_keys = {self.cache_key(subject_identifier): subject_identifier
+                      for subject_identifier in subject_identifiers}
+        cached = cache.get_many(list(cache_keys))
+        values, missing = {}, {}
+        for cache_key, subject_identifier in cache_keys.items():
+            entry = cached.get(cache_key) or {}
+            if key in entry:
+                values[subject_identifier] = entry[key]
+            else:
+                missing[cache_key] = entry
+        if missing:
+            resolved = resolve_many([cache_keys[k] for k in missing])
+            for cache_key, entry in missing.items():
+                entry[key] = resolved[cache_keys[cache_key]]
+            cache.set_many(missing, self.timeout)
+            values.update(resolved)
+        return values
+
+    def invalidate(self, subject_identifier):
+        cache.delete(self.cache_key(subject_identifier))
+
+    def watch_models(self):
+        """Watches each installed model in `watched_models`.
+        """
+        for label in self.watched_models:
+            try:
+                model_cls = django_apps.get_model(label)
+            except LookupError:
+                continue
+            self.watch(model_cls)
+
+    def watch(self, *model_clss):
+        """Connects the post_save and post_delete receivers for each
+        model class, once per model.
+        """
+        for model_cls in model_clss:
+            label = model_cls._meta.label_lower
+            if label in self.watched:
+                continue
+            for signal in [post_save, post_delete]:
+                signal.connect(
+                    self.invalidate_on_change, sender=model_cls, weak=False,
+                    dispatch_uid=f'{self.cache_prefix}.{label}.{id(signal)}')
+            self.watched.add(label)
+
+    def invalidate_on_change(self, sender, instance, **kwargs):
+        subject_identifier = self.subject_identifier_for(instance)
+        if subject_identifier:
+            self.invalidate(subject_identifier)
+
+    def subject_identifier_for(self, instance):
+        subject_identifier = getattr(instance, 'subject_identifier', None)
+        if not subject_identifier and getattr(instance, 'maternal_visit', None):
+            subject_identifier = instance.maternal_visit.subject_identifier
+        return subject_identifier
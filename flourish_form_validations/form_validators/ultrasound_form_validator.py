@@ -2,17 +2,35 @@ from dateutil.relativedelta import relativedelta
 from django.core.exceptions import ValidationError
 from edc_form_validators.form_validator import FormValidator
 from .crf_form_validator import FormValidatorMixin
+from .rule_tables import Range, RuleTableMixin
+from .rules import pure_rule
 
 
-class UltrasoundFormValidator(FormValidatorMixin, FormValidator):
+class UltrasoundFormValidator(RuleTableMixin, FormValidatorMixin, FormValidator):
+
+    rules = [
+        Range(field_range='ga_by_ultrasound_wks', max=40,
+              message='GA by ultrasound cannot be greater than 40 weeks.'),
+        Range(field_range='ga_by_ultrasound_days', max=7,
+              message='GA by ultrasound days cannot be greater than 7 days.'),
+    ]
 
     def clean(self):
 
         cleaned_data = self.cleaned_data
         self.subject_identifier = cleaned_data.get(
             'maternal_visit').subject_identifier
-        super().clean()
 
+        self.run_rules(
+            super().clean,
+            self.validate_est_edd_ultrasound,
+            self.validate_rule_table,
+            self.validate_edd_report_datetime,
+            self.validate_est_edd_matches_ga)
+
+    @pure_rule
+    def validate_est_edd_ultrasound(self):
+        cleaned_data = self.cleaned_data
         if cleaned_data.get('est_edd_ultrasound') and (
                 cleaned_data.get('est_edd_ultrasound') >
                 cleaned_data.get('report_datetime').date() +
@@ -22,26 +40,12 @@ class UltrasoundFormValidator(FormValidatorMixin, FormValidator):
             self._errors.update(msg)
             raise ValidationError(msg)
 
-        if cleaned_data.get('ga_by_ultrasound_wks') and(
-                cleaned_data.get('ga_by_ultrasound_wks') > 40):
-            msg = {'ga_by_ultrasound_wks':
-                   ('GA by ultrasound cannot be greater than 40 weeks.')}
-
-            self._errors.update(msg)
-            raise ValidationError(msg)
-
-        if cleaned_data.get('ga_by_ultrasound_days') and(
-                cleaned_data.get('ga_by_ultrasound_days') > 7):
-            msg = {'ga_by_ultrasound_days':
-                   ('GA by ultrasound days cannot be greater than 7 days.')}
-
-            self._errors.update(msg)
-            raise ValidationError(msg)
-
+    @pure_rule
+    def validate_est_edd_matches_ga(self):
+        cleaned_data = self.cleaned_data
         ga_by_ultrasound = cleaned_data.get('ga_by_ultrasound_wks')
         est_edd_ultrasound = cleaned_data.get('est_edd_ultrasound')
         report_datetime = cleaned_data.get('report_datetime')
-        self.validate_edd_report_datetime()
 
         if cleaned_data.get('ga_by_ultrasound_wks'):
 
@@ -60,6 +64,7 @@ class UltrasoundFormValidator(FormValidatorMixin, FormValidator):
                         self._errors.update(msg)
                         raise ValidationError(msg)
 
+    @pure_rule
     def validate_edd_report_datetime(self):
         if (self.cleaned_data.get('est_edd_ultrasound') and
                 self.cleaned_data.get('est_edd_ultrasound') <
@@ -0,0 +1,30 @@
+class context_property:
+    """Returns a context object of `context_cls` for the validator,
+    built on first access and rebuilt when the validator's `key`
+    attribute changes, e.g. when `clean` sets the subject identifier.
+
+        class FormValidatorMixin:
+            subject_context = context_property(
+                SubjectContext, 'subject_identifier')
+
+    The context is stored on the instance as `_<name>`, where a caller
+    that has already built it may set it, see `batch_validation`.
+    """
+
+    def __init__(self, context_cls, key):
+        self.context_cls = context_cls
+        self.key = key
+        self.attname = None
+
+    def __set_name__(self, owner, name):
+        self.attname = f'_{name}'
+
+    def __get__(self, validator, owner=None):
+        if validator is None:
+            return self
+        value = getattr(validator, self.key, None)
+        context = validator.__dict__.get(self.attname)
+        if context is None or getattr(context, self.key) != value:
+            context = self.context_cls(validator=validator, **{self.key: value})
+            validator.__dict__[self.attname] = context
+        return context
@@ -0,0 +1,27 @@
+from django.apps import apps as django_apps
+from django.core.management.base import BaseCommand, CommandError
+
+from ...form_validators.caregiver_child_consent_form_validator import \
+    CaregiverChildConsentFormValidator
+from ...form_validators.child_dataset_index import child_dataset_index
+
+
+class Command(BaseCommand):
+
+    help = ('Rebuilds the child dataset index used by the caregiver child '
+            'consent validator. Run after importing the child dataset.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--model', default=CaregiverChildConsentFormValidator.child_dataset_model,
+            help='child dataset model label')
+
+    def handle(self, *args, **options):
+        try:
+            model_cls = django_apps.get_model(options['model'])
+        except (LookupError, ValueError) as e:
+            raise CommandError(e)
+        index = child_dataset_index.rebuild(model_cls)
+        self.stdout.write(self.style.SUCCESS(
+            f'Indexed {len(index.children)} children, '
+            f'{len(index.identifiers)} child identifiers.'))
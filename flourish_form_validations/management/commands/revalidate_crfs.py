@@ -0,0 +1,69 @@
+import os
+
+from django.apps import apps as django_apps
+from django.core.management.base import BaseCommand, CommandError
+
+from ...form_validators.registry import site_validators
+from ...revalidation import Checkpoint, Report, sweep, tasks_for
+
+
+class Command(BaseCommand):
+
+    help = ('Re-runs the current form validators over stored caregiver CRFs '
+            'and reports the records that no longer validate.')
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'models', nargs='*',
+            help='model labels to re-validate, defaults to all mapped models')
+        parser.add_argument(
+            '--processes', type=int, default=os.cpu_count(),
+            help='number of worker processes')
+        parser.add_argument(
+            '--report', default='revalidation.csv',
+            help='report file, written as JSONL if it ends in .jsonl')
+        parser.add_argument(
+            '--checkpoint', default='revalidation.checkpoint',
+            help='file recording completed model/subject pairs')
+        parser.add_argument(
+            '--resume', action='store_true',
+            help='skip the pairs recorded in the checkpoint file')
+
+    def handle(self, *args, **options):
+        labels = options['models'] or site_validators.labels
+        unknown = [label for label in labels if label not in site_validators]
+        if unknown:
+            raise CommandError(f'No validator mapped for {", ".join(unknown)}.')
+
+        installed = []
+        for label in labels:
+            try:
+                django_apps.get_model(label)
+            except LookupError:
+                self.stderr.write(f'Skipping {label}, model not installed.')
+            else:
+                installed.append(label)
+
+        if not options['resume'] and os.path.exists(options['checkpoint']):
+            os.remove(options['checkpoint'])
+        checkpoint = Checkpoint(options['checkpoint'])
+        tasks = [task for task in tasks_for(installed) if task not in checkpoint]
+        report = Report(options['report'], append=options['resume'])
+
+        failed = 0
+        try:
+            for index, (task, failures) in enumerate(
+                    sweep(tasks, processes=options['processes']), start=1):
+                for failure in failures:
+                    report.write(failure)
+                failed += len(failures)
+                checkpoint.add(task)
+                self.stdout.write(
+                    f'\r[{index}/{len(tasks)}] {task.model} '
+                    f'{task.subject_identifier}: {failed} failing records',
+                    ending='')
+                self.stdout.flush()
+        finally:
+            report.close()
+        self.stdout.write(self.style.SUCCESS(
+            f'\nDone. {failed} failing records written to {options["report"]}.'))
@@ -0,0 +1,2 @@
+from .profiler import ValidationTiming, install, uninstall, profiled_classes
+from .sinks import LoggingSink, RingBufferSink, PrometheusTextfileSink
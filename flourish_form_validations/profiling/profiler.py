@@ -0,0 +1,134 @@
+import functools
+import inspect
+import time
+import types
+from collections import namedtuple
+
+from django.conf import settings
+from django.db import connection
+from django.utils.module_loading import import_string
+from edc_form_validators import FormValidator
+
+ValidationTiming = namedtuple(
+    'ValidationTiming',
+    ['validator', 'method', 'wall_time', 'queries', 'duplicate_queries'])
+
+profiled_classes = {}
+
+
+class QueryCounter:
+    """Database execute wrapper that records the SQL and params of each
+    query run through it.
+    """
+
+    def __init__(self):
+        self.queries = []
+
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append((sql, repr(params)))
+        return execute(sql, params, many, context)
+
+    @property
+    def duplicate_queries(self):
+        return len(self.queries) - len(set(self.queries))
+
+
+def profiled(method, validator_name, sink):
+    """Returns `method` wrapped to record its wall time, query count
+    and duplicate query count to `sink`.
+    """
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        query_counter = QueryCounter()
+        start = time.perf_counter()
+        try:
+            with connection.execute_wrapper(query_counter):
+                return method(self, *args, **kwargs)
+        finally:
+            sink.record(ValidationTiming(
+                validator=validator_name,
+                method=method.__name__,
+                wall_time=time.perf_counter() - start,
+                queries=len(query_counter.queries),
+                duplicate_queries=query_counter.duplicate_queries))
+
+    wrapper.profiled_method = method
+    return wrapper
+
+
+def defining_class(validator_cls, name):
+    return next(cls for cls in validator_cls.__mro__ if name in vars(cls))
+
+
+def profiled_method_names(validator_cls):
+    """Returns the names of `clean` and of the `validate_*` methods of
+    `validator_cls`, including those inherited from the validators and
+    mixins of this package but not the edc FormValidator helpers.
+    """
+    package = __name__.split('.')[0]
+    names = []
+    for name, _ in inspect.getmembers(validator_cls, inspect.isfunction):
+        cls = defining_class(validator_cls, name)
+        if not isinstance(vars(cls)[name], types.FunctionType):
+            continue
+        if name == 'clean' or (name.startswith('validate_')
+                               and cls.__module__.split('.')[0] == package):
+            names.append(name)
+    return names
+
+
+def default_sink():
+    """Returns the sink named by the FORM_VALIDATOR_PROFILING_SINK
+    setting, a dotted path to a sink class. Defaults to LoggingSink.
+    """
+    sink_cls = import_string(getattr(
+        settings, 'FORM_VALIDATOR_PROFILING_SINK',
+        'flourish_form_validations.profiling.LoggingSink'))
+    return sink_cls(**getattr(settings, 'FORM_VALIDATOR_PROFILING_SINK_OPTIONS', {}))
+
+
+def validator_classes():
+    """Returns the form validators exported from
+    `flourish_form_validations.form_validators`, not the mixins.
+    """
+    from .. import form_validators
+
+    exports = [getattr(form_validators, name) for name in form_validators.__all__]
+    return [attr for attr in exports
+            if isinstance(attr, type) and issubclass(attr, FormValidator)]
+
+
+def install(sink=None, classes=None):
+    """Wraps `clean` and each `validate_*` method of the given validator
+    classes, by default every class exported from
+    `flourish_form_validations.form_validators`.
+
+    Nothing is wrapped until this is called, so profiling costs
+    nothing when disabled.
+    """
+    sink = sink or default_sink()
+    for validator_cls in (classes or validator_classes()):
+        if validator_cls in profiled_classes:
+            continue
+        originals = {}
+        for name in profiled_method_names(validator_cls):
+            originals[name] = vars(validator_cls).get(name)
+            method = getattr(validator_cls, name)
+            method = getattr(method, 'profiled_method', method)
+            setattr(validator_cls, name,
+                    profiled(method, validator_cls.__name__, sink))
+        profiled_classes[validator_cls] = originals
+    return sink
+
+
+def uninstall():
+    """Restores the original methods on all profiled classes.
+    """
+    for validator_cls, originals in list(profiled_classes.items()):
+        for name, method in originals.items():
+            if method is None:
+                delattr(validator_cls, name)
+            else:
+                setattr(validator_cls, name, method)
+        del profiled_classes[validator_cls]
@@ -0,0 +1,105 @@
+import logging
+import os
+import tempfile
+import time
+from collections import deque, defaultdict
+from threading import Lock
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+
+class LoggingSink:
+    """Writes each ValidationTiming to the Python logger.
+    """
+
+    def __init__(self, logger_name=None, level=None):
+        self.logger = logging.getLogger(
+            logger_name or 'flourish_form_validations.profiling')
+        self.level = level or logging.INFO
+
+    def record(self, timing):
+        self.logger.log(
+            self.level,
+            '%s.%s wall_time=%.6fs queries=%s duplicate_queries=%s',
+            timing.validator, timing.method, timing.wall_time,
+            timing.queries, timing.duplicate_queries)
+
+
+class RingBufferSink:
+    """Keeps the most recent ValidationTimings in process memory.
+    """
+
+    def __init__(self, maxlen=None):
+        self.buffer = deque(maxlen=maxlen or 1000)
+
+    def record(self, timing):
+        self.buffer.append(timing)
+
+    def records(self):
+        return list(self.buffer)
+
+    def clear(self):
+        self.buffer.clear()
+
+
+class PrometheusTextfileSink:
+    """Aggregates ValidationTimings per validator method and writes them
+    in the Prometheus text exposition format, e.g. for the node
+    exporter textfile collector.
+
+    The file is rewritten at most once every `flush_interval` seconds.
+    `path` defaults to the FORM_VALIDATOR_PROFILING_TEXTFILE setting.
+    """
+
+    metric_prefix = 'flourish_form_validator'
+
+    def __init__(self, path=None, flush_interval=None):
+        self.path = path or getattr(
+            settings, 'FORM_VALIDATOR_PROFILING_TEXTFILE', None)
+        if not self.path:
+            raise ImproperlyConfigured(
+                'PrometheusTextfileSink requires a path. Pass `path` or set '
+                'FORM_VALIDATOR_PROFILING_TEXTFILE.')
+        self.flush_interval = 15 if flush_interval is None else flush_interval
+        self.last_flush = 0
+        self.lock = Lock()
+        self.totals = defaultdict(lambda: [0, 0.0, 0, 0])
+
+    def record(self, timing):
+        with self.lock:
+            totals = self.totals[(timing.validator, timing.method)]
+            totals[0] += 1
+            totals[1] += timing.wall_time
+            totals[2] += timing.queries
+            totals[3] += timing.duplicate_queries
+            if time.monotonic() - self.last_flush >= self.flush_interval:
+                self.write()
+
+    def render(self):
+        metrics = [
+            ('calls_total', 'counter', 'Number of calls.', 0),
+            ('seconds_total', 'counter', 'Total wall time in seconds.', 1),
+            ('queries_total', 'counter', 'Total database queries.', 2),
+            ('duplicate_queries_total', 'counter',
+             'Total duplicated database queries.', 3)]
+        lines = []
+        for name, metric_type, help_text, index in metrics:
+            metric = f'{self.metric_prefix}_{name}'
+            lines.append(f'# HELP {metric} {help_text}')
+            lines.append(f'# TYPE {metric} {metric_type}')
+            for (validator, method), totals in sorted(self.totals.items()):
+                lines.append(
+                    f'{metric}{{validator="{validator}",method="{method}"}} '
+                    f'{totals[index]}')
+        return '\n'.join(lines) + '\n'
+
+    def write(self):
+        """Atomically replaces the metrics file.
+        """
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+        with os.fdopen(fd, 'w') as f:
+            f.write(self.render())
+        os.replace(tmp_path, self.path)
+        self.last_flush = time.monotonic()
@@ -0,0 +1,167 @@
+import csv
+import json
+import multiprocessing
+import os
+from collections import namedtuple
+
+from django.apps import apps as django_apps
+from django.db import connections
+
+from . import form_validators
+from .form_validators.registry import site_validators
+
+Failure = namedtuple(
+    'Failure', ['model', 'pk', 'subject_identifier', 'errors'])
+
+Task = namedtuple('Task', ['model', 'subject_identifier'])
+
+
+def validator_cls_for(label, validators=None):
+    return (validators or site_validators).get(label)
+
+
+def subject_lookup(model_cls):
+    field_names = [field.name for field in model_cls._meta.get_fields()]
+    if 'maternal_visit' in field_names:
+        return 'maternal_visit__subject_identifier'
+    return 'subject_identifier'
+
+
+def cleaned_data_for(instance):
+    """Returns a cleaned_data dict for a stored instance, as the model
+    form would build it: concrete field values, related instances for
+    foreign keys and a queryset for each many to many field.
+    """
+    cleaned_data = {}
+    for field in instance._meta.concrete_fields:
+        cleaned_data[field.name] = getattr(instance, field.name)
+    for field in instance._meta.many_to_many:
+        cleaned_data[field.name] = getattr(instance, field.name).all()
+    return cleaned_data
+
+
+def instances_for(model_cls, subject_identifier):
+    """Returns the stored instances of `model_cls` for a subject with
+    their foreign keys and many to many fields loaded, so that
+    building their cleaned_data runs no further queries.
+    """
+    foreign_keys = [field.name for field in model_cls._meta.concrete_fields
+                    if field.is_relation]
+    many_to_many = [field.name for field in model_cls._meta.many_to_many]
+    return list(model_cls.objects.select_related(*foreign_keys).prefetch_related(
+        *many_to_many).filter(
+            **{subject_lookup(model_cls): subject_identifier}).order_by('pk'))
+
+
+def revalidate_subject(task, validators=None):
+    """Re-validates the stored instances of one model for one subject
+    and returns a Failure for each instance that no longer validates.
+    """
+    model_cls = django_apps.get_model(task.model)
+    instances = instances_for(model_cls, task.subject_identifier)
+    # stored records are not held to the off study rule, it only blocks
+    # new data capture
+    try:
+        results = form_validators.validate_many(
+            validator_cls_for(task.model, validators),
+            [cleaned_data_for(instance) for instance in instances],
+            with_offstudy_status=False)
+    except Exception as e:
+        return [Failure(model=task.model, pk=None,
+                        subject_identifier=task.subject_identifier,
+                        errors={'__exception__': repr(e)})]
+    return [Failure(model=task.model,
+                    pk=str(instance.pk),
+                    subject_identifier=task.subject_identifier,
+                    errors=errors)
+            for instance, errors in zip(instances, results) if errors]
+
+
+def run_task(task):
+    return task, revalidate_subject(task)
+
+
+class Checkpoint:
+    """Append-only record of completed tasks, one JSON line per task,
+    so that an interrupted sweep can resume where it stopped.
+    """
+
+    def __init__(self, path=None):
+        self.path = path
+        self.done = set()
+        if path and os.path.exists(path):
+            with open(path) as f:
+                for line in f:
+                    if line.strip():
+                        self.done.add(Task(*json.loads(line)))
+
+    def __contains__(self, task):
+        return task in self.done
+
+    def add(self, task):
+        self.done.add(task)
+        if self.path:
+            with open(self.path, 'a') as f:
+                f.write(json.dumps(list(task)) + '\n')
+
+
+class Report:
+    """Writes failures as CSV or JSONL depending on the file extension.
+    Appends to an existing report when resuming.
+    """
+
+    fieldnames = ['model', 'pk', 'subject_identifier', 'errors']
+
+    def __init__(self, path=None, append=False):
+        self.path = path
+        self.jsonl = path.endswith('.jsonl')
+        write_header = not (append and os.path.exists(path))
+        self.file = open(path, 'a' if append else 'w', newline='')
+        if not self.jsonl:
+            self.writer = csv.DictWriter(self.file, fieldnames=self.fieldnames)
+            if write_header:
+                self.writer.writeheader()
+
+    def write(self, failure):
+        row = failure._asdict()
+        if self.jsonl:
+            self.file.write(json.dumps(row) + '\n')
+        else:
+            self.writer.writerow(dict(row, errors=json.dumps(row['errors'])))
+        self.file.flush()
+
+    def close(self):
+        self.file.close()
+
+
+def tasks_for(labels):
+    """Returns a Task per (model, subject) for the given model labels.
+    """
+    tasks = []
+    for label in labels:
+        model_cls = django_apps.get_model(label)
+        subject_identifiers = model_cls.objects.order_by().values_list(
+            subject_lookup(model_cls), flat=True).distinct()
+        tasks.extend(Task(label, subject_identifier)
+                     for subject_identifier in sorted(subject_identifiers))
+    return tasks
+
+
+def close_connections():
+    connections.close_all()
+
+
+def sweep(tasks, processes=None):
+    """Yields (task, failures) as tasks complete. Tasks are spread over
+    a pool of `processes` worker processes, or run in this process if
+    `processes` is 1.
+    """
+    if processes == 1:
+        for task in tasks:
+            yield run_task(task)
+        return
+    # workers must not share the parent's database connections
+    close_connections()
+    with multiprocessing.Pool(
+            processes=processes, initializer=close_connections) as pool:
+        yield from pool.imap_unordered(run_task, tasks)
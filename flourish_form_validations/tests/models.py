@@ -1,6 +1,6 @@
 from django.db import models
 from django.db.models.deletion import PROTECT
-from django_crypto_fields.fields import FirstnameField, LastnameField
+from django_crypto_fields.fields import FirstnameField, IdentityField, LastnameField
 from edc_base.model_mixins import BaseUuidModel, ListModelMixin
 from edc_base.utils import get_utcnow
 from edc_constants.choices import GENDER, YES_NO, YES_NO_NA
@@ -44,6 +44,25 @@ class SubjectConsent(UpdatesOrCreatesRegistrationModelMixin, BaseUuidModel):
 
     dob = models.DateField()
 
+    first_name = FirstnameField(null=True, blank=True)
+
+    last_name = LastnameField(null=True, blank=True)
+
+    initials = models.CharField(max_length=3, null=True, blank=True)
+
+    identity = IdentityField(null=True, blank=True)
+
+    identity_type = models.CharField(max_length=25, null=True, blank=True)
+
+    recruit_source = models.CharField(max_length=25, null=True, blank=True)
+
+    recruit_source_other = models.CharField(max_length=25, null=True, blank=True)
+
+    recruitment_clinic = models.CharField(max_length=25, null=True, blank=True)
+
+    recruitment_clinic_other = models.CharField(
+        max_length=25, null=True, blank=True)
+
     consent_datetime = models.DateTimeField()
 
     version = models.CharField(
@@ -51,6 +70,21 @@ class SubjectConsent(UpdatesOrCreatesRegistrationModelMixin, BaseUuidModel):
         editable=False)
 
 
+class CaregiverChildConsent(BaseUuidModel):
+    subject_consent = models.ForeignKey(SubjectConsent, on_delete=PROTECT)
+
+    subject_identifier = models.CharField(max_length=25, null=True, blank=True)
+
+    is_eligible = models.BooleanField(default=False)
+
+    child_age_at_enrollment = models.DecimalField(
+        decimal_places=2, max_digits=4, null=True, blank=True)
+
+
+class ChildAssent(BaseUuidModel):
+    subject_identifier = models.CharField(max_length=25, null=True, blank=True)
+
+
 class ScreeningPregWomen(UpdatesOrCreatesRegistrationModelMixin, BaseUuidModel):
     screening_identifier = models.CharField(max_length=50)
 
@@ -196,10 +230,34 @@ class UltraSound(models.Model):
 
     ga_confirmed = models.IntegerField()
 
+    ga_by_ultrasound_wks = models.IntegerField(null=True, blank=True)
+
+    ga_by_ultrasound_days = models.IntegerField(null=True, blank=True)
+
+
+class TbPresenceHouseholdMembers(models.Model):
+    maternal_visit = models.OneToOneField(MaternalVisit, on_delete=PROTECT)
+
+    tb_diagnosed = models.CharField(max_length=3, choices=YES_NO)
+
+    tb_ind_rel = models.CharField(max_length=25, null=True, blank=True)
+
+    tb_ind_other = models.CharField(max_length=25, null=True, blank=True)
+
+    fever_signs = models.CharField(max_length=3, choices=YES_NO)
+
+    fever_ind_rel = models.CharField(max_length=25, null=True, blank=True)
+
+    fever_ind_other = models.CharField(max_length=25, null=True, blank=True)
+
 
 class MaternalDataset(BaseUuidModel):
     screening_identifier = models.CharField(max_length=36)
 
+    subject_identifier = models.CharField(max_length=25, null=True, blank=True)
+
+    mom_hivstatus = models.CharField(max_length=25, null=True, blank=True)
+
     study_child_identifier = models.CharField(max_length=36)
 
     study_maternal_identifier = models.CharField(max_length=36)
@@ -233,6 +291,20 @@ class OffStudy(BaseUuidModel):
     subject_identifier = models.CharField(max_length=25)
 
 
+class ActionType(BaseUuidModel):
+
+    name = models.CharField(max_length=50)
+
+
+class ActionItem(BaseUuidModel):
+
+    subject_identifier = models.CharField(max_length=25)
+
+    action_type = models.ForeignKey(ActionType, on_delete=PROTECT)
+
+    status = models.CharField(max_length=25)
+
+
 class CaregiverContact(BaseUuidModel):
     consent_model = SubjectConsent
 
@@ -263,6 +335,8 @@ class ScreeningPriorBhpParticipants(BaseUuidModel):
 
     screening_identifier = models.CharField(max_length=7)
 
+    subject_identifier = models.CharField(max_length=25, null=True, blank=True)
+
     report_datetime = models.DateTimeField()
 
     study_maternal_identifier = models.CharField(max_length=7)
@@ -0,0 +1,67 @@
+from collections import Counter
+
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+
+# maximum number of queries run by validate() on each validator's happy
+# path. Lower a budget when a change removes queries, never raise one
+# to make a test pass without a reason in the commit message.
+QUERY_BUDGETS = {
+    'CaregiverClinicalMeasurementsFormValidator': 2,
+    'CaregiverPrevEnrolledFormValidator': 4,
+    'MaternalArvDuringPregFormValidator': 3,
+    'ObstericalHistoryFormValidator': 4,
+    'SubjectConsentFormValidator': 4,
+    'UltrasoundFormValidator': 2,
+}
+
+
+def duplicated_queries(captured_queries):
+    """Returns a list of (count, sql) for each statement run more than
+    once, most repeated first.
+    """
+    counter = Counter(query['sql'] for query in captured_queries)
+    return [(count, sql) for sql, count in counter.most_common() if count > 1]
+
+
+class QueryBudgetContext(CaptureQueriesContext):
+
+    def __init__(self, test_case, budget, label=None, connection=None):
+        self.test_case = test_case
+        self.budget = budget
+        self.label = label
+        super().__init__(connection)
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        super().__exit__(exc_type, exc_value, traceback)
+        if exc_type is not None or len(self) <= self.budget:
+            return
+        lines = [f'{self.label or "Block"} ran {len(self)} queries, '
+                 f'budget is {self.budget}.']
+        duplicates = duplicated_queries(self.captured_queries)
+        if duplicates:
+            lines.append('Duplicated queries:')
+            lines.extend(f'  {count} x {sql}' for count, sql in duplicates)
+        lines.append('Queries:')
+        lines.extend(f'  {index}. {query["sql"]}' for index, query in
+                     enumerate(self.captured_queries, start=1))
+        self.test_case.fail('\n'.join(lines))
+
+
+class QueryBudgetMixin:
+    """TestCase mixin that fails a test when a block of code runs more
+    queries than its budget, listing the duplicated SQL.
+    """
+
+    query_budgets = QUERY_BUDGETS
+
+    def assertQueryBudget(self, budget, label=None):
+        return QueryBudgetContext(self, budget, label=label, connection=connection)
+
+    def assertValidatorWithinBudget(self, form_validator):
+        """Runs validate() on `form_validator` within the budget declared
+        for its class in `query_budgets`.
+        """
+        name = form_validator.__class__.__name__
+        with self.assertQueryBudget(self.query_budgets[name], label=name):
+            form_validator.validate()
@@ -0,0 +1,140 @@
+from dateutil.relativedelta import relativedelta
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+
+from ..form_validators import UltrasoundFormValidator, validate_many
+from ..form_validators.offstudy_status import offstudy_status
+from .models import SubjectConsent, Appointment, MaternalVisit
+from .models import FlourishConsentVersion, OffStudy
+from .test_model_mixin import TestModeMixin
+from .test_offstudy_status import OffstudyActions
+
+
+class OffstudyUltrasoundFormValidator(UltrasoundFormValidator):
+
+    def clean(self):
+        self.subject_identifier = self.cleaned_data.get(
+            'maternal_visit').subject_identifier
+        self.validate_offstudy_model()
+        super().clean()
+
+
+class LateOffstudyUltrasoundFormValidator(UltrasoundFormValidator):
+
+    def clean(self):
+        try:
+            super().clean()
+        finally:
+            self.validate_offstudy_model()
+
+
+@tag('vm')
+class TestValidateMany(TestModeMixin, TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(UltrasoundFormValidator, *args, **kwargs)
+
+    def setUp(self):
+        self.maternal_visits = []
+        for index in range(3):
+            subject_identifier = f'1111111{index}'
+            screening_identifier = f'ABC1234{index}'
+            FlourishConsentVersion.objects.create(
+                screening_identifier=screening_identifier)
+            SubjectConsent.objects.create(
+                subject_identifier=subject_identifier,
+                screening_identifier=screening_identifier,
+                gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+                consent_datetime=get_utcnow() - relativedelta(days=10),
+                version='1')
+            appointment = Appointment.objects.create(
+                subject_identifier=subject_identifier,
+                appt_datetime=get_utcnow(),
+                visit_code='1000')
+            self.maternal_visits.append(MaternalVisit.objects.create(
+                appointment=appointment,
+                report_datetime=get_utcnow() - relativedelta(days=1)))
+
+    def cleaned_data(self, maternal_visit, ga_by_ultrasound_wks=35):
+        return {
+            'maternal_visit': maternal_visit,
+            'report_datetime': get_utcnow(),
+            'ga_by_ultrasound_wks': ga_by_ultrasound_wks}
+
+    def test_errors_per_record(self):
+        results = validate_many(UltrasoundFormValidator, [
+            self.cleaned_data(self.maternal_visits[0]),
+            self.cleaned_data(self.maternal_visits[1], ga_by_ultrasound_wks=41),
+            self.cleaned_data(self.maternal_visits[2])],
+            with_offstudy_status=False)
+        self.assertEqual(results[0], {})
+        self.assertEqual(results[1], {'ga_by_ultrasound_wks': [
+            'GA by ultrasound cannot be greater than 40 weeks.']})
+        self.assertEqual(results[2], {})
+
+    def test_with_offstudy_status(self):
+        actions = offstudy_status.actions
+        self.addCleanup(setattr, offstudy_status, 'actions', actions)
+        offstudy_status.actions = OffstudyActions()
+        OffStudy.objects.create(subject_identifier='11111110')
+        with self.assertNumQueries(4):
+            results = validate_many(OffstudyUltrasoundFormValidator, [
+                self.cleaned_data(self.maternal_visits[0]),
+                self.cleaned_data(self.maternal_visits[1], ga_by_ultrasound_wks=41),
+                self.cleaned_data(self.maternal_visits[2])],
+                with_offstudy_status=True)
+        self.assertEqual(results[0], {'__all__': [
+            'Participant has been taken offstudy. Cannot capture any new data.']})
+        self.assertEqual(results[1], {'ga_by_ultrasound_wks': [
+            'GA by ultrasound cannot be greater than 40 weeks.']})
+        self.assertEqual(results[2], {})
+
+    def test_batch_prefetched(self):
+        cleaned_data_list = [
+            self.cleaned_data(maternal_visit)
+            for maternal_visit in self.maternal_visits * 10]
+        with self.assertNumQueries(2):
+            results = validate_many(
+                UltrasoundFormValidator, cleaned_data_list,
+                with_offstudy_status=False)
+        self.assertEqual(results, [{}] * 30)
+
+    def test_visits_resolved_from_pks(self):
+        cleaned_data_list = [
+            self.cleaned_data(maternal_visit.pk)
+            for maternal_visit in self.maternal_visits]
+        with self.assertNumQueries(3):
+            results = validate_many(
+                UltrasoundFormValidator, cleaned_data_list,
+                with_offstudy_status=False)
+        self.assertEqual(results, [{}] * 3)
+
+    def test_missing_consent(self):
+        SubjectConsent.objects.filter(subject_identifier='11111110').delete()
+        with self.assertNumQueries(1):
+            results = validate_many(
+                UltrasoundFormValidator,
+                [self.cleaned_data(self.maternal_visits[0])],
+                with_offstudy_status=False)
+        self.assertEqual(results, [{}])
+
+    def test_field_and_prerequisite_errors_merged(self):
+        actions = offstudy_status.actions
+        self.addCleanup(setattr, offstudy_status, 'actions', actions)
+        offstudy_status.actions = OffstudyActions()
+        OffStudy.objects.create(subject_identifier='11111110')
+        results = validate_many(
+            LateOffstudyUltrasoundFormValidator,
+            [self.cleaned_data(self.maternal_visits[0], ga_by_ultrasound_wks=41)],
+            with_offstudy_status=True)
+        self.assertEqual(results[0], {
+            'ga_by_ultrasound_wks': [
+                'GA by ultrasound cannot be greater than 40 weeks.'],
+            '__all__': [
+                'Participant has been taken offstudy. Cannot capture any new data.']})
+
+    def test_offstudy_status_not_prefetched_by_default(self):
+        with self.assertNumQueries(2):
+            validate_many(UltrasoundFormValidator, [
+                self.cleaned_data(maternal_visit)
+                for maternal_visit in self.maternal_visits])
@@ -0,0 +1,74 @@
+from dateutil.relativedelta import relativedelta
+from django.core.exceptions import ValidationError
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+
+from ..form_validators import CaregiverPrevEnrolledFormValidator
+from .models import CaregiverChildConsent, ChildAssent, SubjectConsent
+from .test_model_mixin import TestModeMixin
+
+
+@tag('prev_enrolled')
+class TestCaregiverPrevEnrolledChildAssent(TestModeMixin, TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(CaregiverPrevEnrolledFormValidator, *args, **kwargs)
+
+    def setUp(self):
+        CaregiverPrevEnrolledFormValidator.child_assent_model = \
+            'flourish_form_validations.childassent'
+
+        self.subject_consent = SubjectConsent.objects.create(
+            subject_identifier='11111111', screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow(), version='1')
+
+    def child_consent(self, subject_identifier, age=10, is_eligible=True):
+        return CaregiverChildConsent.objects.create(
+            subject_consent=self.subject_consent,
+            subject_identifier=subject_identifier,
+            is_eligible=is_eligible,
+            child_age_at_enrollment=age)
+
+    def check_child_assent(self):
+        form_validator = CaregiverPrevEnrolledFormValidator(cleaned_data={})
+        form_validator.check_child_assent(
+            self.subject_consent.subject_identifier)
+
+    def test_all_assented(self):
+        self.child_consent('11111111-10')
+        self.child_consent('11111111-25')
+        ChildAssent.objects.create(subject_identifier='11111111-10')
+        ChildAssent.objects.create(subject_identifier='11111111-25')
+        try:
+            self.check_child_assent()
+        except ValidationError as e:
+            self.fail(f'ValidationError unexpectedly raised. Got{e}')
+
+    def test_missing_assent(self):
+        self.child_consent('11111111-10')
+        self.child_consent('11111111-25')
+        ChildAssent.objects.create(subject_identifier='11111111-10')
+        self.assertRaises(ValidationError, self.check_child_assent)
+
+    def test_child_without_subject_identifier_missing_assent(self):
+        self.child_consent(None)
+        ChildAssent.objects.create(subject_identifier='11111111-10')
+        self.assertRaises(ValidationError, self.check_child_assent)
+
+    def test_unassented_assent_without_subject_identifier(self):
+        """Assert an assent without a subject identifier does not hide
+        the missing assents of the other children.
+        """
+        self.child_consent('11111111-10')
+        ChildAssent.objects.create(subject_identifier=None)
+        self.assertRaises(ValidationError, self.check_child_assent)
+
+    def test_children_not_requiring_assent_ignored(self):
+        self.child_consent('11111111-10', age=5)
+        self.child_consent('11111111-25', age=18)
+        self.child_consent('11111111-35', is_eligible=False)
+        try:
+            self.check_child_assent()
+        except ValidationError as e:
+            self.fail(f'ValidationError unexpectedly raised. Got{e}')
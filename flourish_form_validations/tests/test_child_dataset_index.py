@@ -0,0 +1,90 @@
+from dateutil.relativedelta import relativedelta
+from django.test import TestCase, tag
+from django.test.utils import override_settings
+from edc_base.utils import get_utcnow
+
+from ..form_validators.child_dataset_index import ChildDatasetIndex
+from ..form_validators.child_dataset_index import child_dataset_index
+from .models import ChildDataset
+
+
+@tag('cdi')
+@override_settings(CHILD_DATASET_INDEX=True)
+class TestChildDatasetIndex(TestCase):
+
+    def setUp(self):
+        child_dataset_index.watch(ChildDataset)
+        child_dataset_index.clear()
+        self.addCleanup(child_dataset_index.clear)
+        self.dob = (get_utcnow() - relativedelta(years=5)).date()
+        self.child = ChildDataset.objects.create(
+            study_child_identifier='1234', infant_sex='Male', dob=self.dob)
+        child_dataset_index.rebuild(ChildDataset)
+
+    def test_lookup_from_index(self):
+        with self.assertNumQueries(0):
+            self.assertTrue(child_dataset_index.exists(
+                ChildDataset, '1234', infant_sex='Male', dob=self.dob))
+            self.assertTrue(child_dataset_index.exists(ChildDataset, '1234'))
+
+    def test_missing(self):
+        self.assertFalse(child_dataset_index.exists(
+            ChildDataset, '1234', infant_sex='Female', dob=self.dob))
+        self.assertFalse(child_dataset_index.exists(ChildDataset, '5678'))
+
+    def test_invalidated_on_save(self):
+        ChildDataset.objects.create(
+            study_child_identifier='5678', infant_sex='Female', dob=self.dob)
+        self.assertTrue(child_dataset_index.exists(ChildDataset, '5678'))
+        with self.assertNumQueries(0):
+            self.assertTrue(child_dataset_index.exists(ChildDataset, '5678'))
+
+    def test_invalidated_on_update(self):
+        dob = self.dob - relativedelta(days=1)
+        self.child.dob = dob
+        self.child.save()
+        self.assertFalse(child_dataset_index.exists(
+            ChildDataset, '1234', infant_sex='Male', dob=self.dob))
+        self.assertTrue(child_dataset_index.exists(
+            ChildDataset, '1234', infant_sex='Male', dob=dob))
+
+    def test_invalidated_on_delete(self):
+        self.child.delete()
+        self.assertFalse(child_dataset_index.exists(
+            ChildDataset, '1234', infant_sex='Male', dob=self.dob))
+        self.assertFalse(child_dataset_index.exists(ChildDataset, '1234'))
+
+    def test_read_through_on_miss(self):
+        ChildDataset.objects.bulk_create([ChildDataset(
+            study_child_identifier='5678', infant_sex='Female', dob=self.dob)])
+        self.assertTrue(child_dataset_index.exists(
+            ChildDataset, '5678', infant_sex='Female', dob=self.dob))
+
+    def test_watch_models_without_a_lookup(self):
+        index = ChildDatasetIndex()
+        index.watched_models = ['flourish_form_validations.childdataset']
+        index.watch_models()
+        self.assertIn('flourish_form_validations.childdataset', index.watched)
+        version = index.version
+        ChildDataset.objects.create(
+            study_child_identifier='5678', infant_sex='Female', dob=self.dob)
+        self.assertGreater(index.version, version)
+
+
+@tag('cdi')
+class TestChildDatasetIndexLocalCache(TestCase):
+
+    def setUp(self):
+        child_dataset_index.clear()
+        self.addCleanup(child_dataset_index.clear)
+        self.dob = (get_utcnow() - relativedelta(years=5)).date()
+        ChildDataset.objects.create(
+            study_child_identifier='1234', infant_sex='Male', dob=self.dob)
+
+    def test_disabled_with_local_cache(self):
+        self.assertFalse(child_dataset_index.enabled)
+        for _ in range(2):
+            with self.assertNumQueries(1):
+                self.assertTrue(child_dataset_index.exists(
+                    ChildDataset, '1234', infant_sex='Male', dob=self.dob))
+        self.assertEqual(child_dataset_index.indexes, {})
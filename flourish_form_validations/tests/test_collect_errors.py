@@ -0,0 +1,91 @@
+from dateutil.relativedelta import relativedelta
+from django.core.exceptions import ValidationError
+from django.test import TestCase, tag
+from django.test.utils import override_settings
+from edc_base.utils import get_utcnow
+
+from ..form_validators import UltrasoundFormValidator
+from .models import SubjectConsent, Appointment, MaternalVisit
+from .models import FlourishConsentVersion
+from .test_model_mixin import TestModeMixin
+
+
+@tag('collect')
+class TestCollectErrors(TestModeMixin, TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(UltrasoundFormValidator, *args, **kwargs)
+
+    def setUp(self):
+        FlourishConsentVersion.objects.create(
+            screening_identifier='ABC12345')
+
+        self.subject_consent = SubjectConsent.objects.create(
+            subject_identifier='11111111', screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow() - relativedelta(days=10),
+            version='1')
+
+        appointment = Appointment.objects.create(
+            subject_identifier=self.subject_consent.subject_identifier,
+            appt_datetime=get_utcnow(),
+            visit_code='1000')
+
+        self.maternal_visit = MaternalVisit.objects.create(
+            appointment=appointment,
+            report_datetime=get_utcnow() - relativedelta(days=1))
+
+        self.cleaned_data = {
+            'maternal_visit': self.maternal_visit,
+            'report_datetime': get_utcnow(),
+            'ga_by_ultrasound_wks': 41,
+            'ga_by_ultrasound_days': 8}
+
+    def test_first_error_raised_by_default(self):
+        form_validator = UltrasoundFormValidator(cleaned_data=self.cleaned_data)
+        self.assertRaises(ValidationError, form_validator.validate)
+        self.assertIn('ga_by_ultrasound_wks', form_validator._errors)
+        self.assertNotIn('ga_by_ultrasound_days', form_validator._errors)
+
+    def test_field_errors_collected(self):
+        form_validator = UltrasoundFormValidator(
+            cleaned_data=self.cleaned_data, collect_errors=True)
+        self.assertRaises(ValidationError, form_validator.validate)
+        self.assertIn('ga_by_ultrasound_wks', form_validator._errors)
+        self.assertIn('ga_by_ultrasound_days', form_validator._errors)
+
+    @override_settings(FORM_VALIDATOR_COLLECT_ERRORS=True)
+    def test_collect_errors_setting(self):
+        form_validator = UltrasoundFormValidator(cleaned_data=self.cleaned_data)
+        self.assertRaises(ValidationError, form_validator.validate)
+        self.assertIn('ga_by_ultrasound_days', form_validator._errors)
+
+    def test_prerequisite_errors_short_circuit(self):
+        SubjectConsent.objects.all().delete()
+        FlourishConsentVersion.objects.all().delete()
+        SubjectConsent.objects.create(
+            subject_identifier='11111111', screening_identifier='XYZ12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow() - relativedelta(days=10),
+            version='1')
+        form_validator = UltrasoundFormValidator(
+            cleaned_data=self.cleaned_data, collect_errors=True)
+        self.assertRaises(ValidationError, form_validator.validate)
+        self.assertNotIn('ga_by_ultrasound_wks', form_validator._errors)
+
+    def test_prerequisite_error_drops_collected_errors(self):
+        form_validator = UltrasoundFormValidator(
+            cleaned_data=self.cleaned_data, collect_errors=True)
+
+        def field_rule():
+            message = {'ga_by_ultrasound_wks': 'Value is out of range.'}
+            form_validator._errors.update(message)
+            raise ValidationError(message)
+
+        def prerequisite():
+            raise ValidationError('Please complete the consent form first.')
+
+        with self.assertRaises(ValidationError) as cm:
+            form_validator.run_rules(field_rule, prerequisite)
+        self.assertFalse(hasattr(cm.exception, 'error_dict'))
+        self.assertNotIn('ga_by_ultrasound_wks', form_validator._errors)
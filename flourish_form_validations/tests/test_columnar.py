@@ -0,0 +1,81 @@
+from unittest import skipIf
+
+from django.core.exceptions import ValidationError
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+from edc_constants.constants import YES, NO, OTHER
+
+from ..form_validators import HivViralLoadCd4FormValidator
+from ..form_validators import TbPresenceHouseholdMembersFormValidator
+from ..form_validators import UltrasoundFormValidator
+from ..form_validators.columnar import ColumnarValidator, np
+from .models import Appointment, MaternalVisit
+
+
+@tag('col')
+@skipIf(np is None, 'numpy is not installed')
+class TestColumnarValidator(TestCase):
+
+    def test_range_rules(self):
+        errors = ColumnarValidator(UltrasoundFormValidator).validate({
+            'ga_by_ultrasound_wks': [12, 41, None, 40],
+            'ga_by_ultrasound_days': [3, 2, 9, 7]})
+        self.assertEqual(errors.n_rows, 4)
+        self.assertEqual(errors.errors_for(0), {})
+        self.assertEqual(
+            errors.errors_for(1),
+            {'ga_by_ultrasound_wks': 'GA by ultrasound cannot be greater than 40 weeks.'})
+        self.assertEqual(list(errors.errors_for(2)), ['ga_by_ultrasound_days'])
+        self.assertEqual(errors.errors_for(3), {})
+        self.assertEqual(list(errors.invalid_rows), [1, 2])
+
+    def test_conditional_range_rules(self):
+        errors = ColumnarValidator(HivViralLoadCd4FormValidator).validate({
+            'vl_detectable': [YES, YES, NO, NO],
+            'recent_vl_results': [400, 1000, 400, 350]})
+        self.assertIn('recent_vl_results', errors.errors_for(0))
+        self.assertEqual(errors.errors_for(1), {})
+        self.assertEqual(errors.errors_for(2), {})
+        self.assertIn('recent_vl_results', errors.errors_for(3))
+
+    def test_missing_columns_skipped(self):
+        errors = ColumnarValidator(HivViralLoadCd4FormValidator).validate({
+            'last_cd4_count_known': [YES, NO],
+            'cd4_count': [None, None]})
+        self.assertEqual(errors.fields, ['cd4_count'])
+        self.assertEqual(errors.errors_for(0), {'cd4_count': 'This field is required.'})
+        self.assertEqual(errors.errors_for(1), {})
+
+    def test_to_dense(self):
+        errors = ColumnarValidator(UltrasoundFormValidator).validate({
+            'ga_by_ultrasound_wks': [41, 12],
+            'ga_by_ultrasound_days': [2, 3]})
+        dense = errors.to_dense()
+        self.assertEqual(dense.shape, (2, 1))
+        self.assertIsNone(dense[1, 0])
+
+    def test_matches_form_validator(self):
+        appointment = Appointment.objects.create(
+            subject_identifier='11111111',
+            appt_datetime=get_utcnow(),
+            visit_code='1000M')
+        maternal_visit = MaternalVisit.objects.create(appointment=appointment)
+        rows = [
+            {'tb_diagnosed': YES, 'tb_ind_rel': None},
+            {'tb_diagnosed': NO, 'tb_ind_rel': 'partner'},
+            {'tb_diagnosed': YES, 'tb_ind_rel': OTHER, 'tb_ind_other': None},
+            {'tb_diagnosed': YES, 'tb_ind_rel': 'partner', 'tb_ind_other': None},
+        ]
+        fields = TbPresenceHouseholdMembersFormValidator.rule_table_fields()
+        errors = ColumnarValidator(TbPresenceHouseholdMembersFormValidator).validate(
+            {field: [row.get(field) for row in rows] for field in fields})
+        for index, row in enumerate(rows):
+            form_validator = TbPresenceHouseholdMembersFormValidator(
+                cleaned_data=dict(row, maternal_visit=maternal_visit),
+                collect_errors=True)
+            try:
+                form_validator.validate()
+            except ValidationError:
+                pass
+            self.assertEqual(
+                set(errors.errors_for(index)), set(form_validator._errors))
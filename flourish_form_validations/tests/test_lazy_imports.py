@@ -0,0 +1,18 @@
+from django.test import SimpleTestCase, tag
+
+from .. import form_validators
+
+
+@tag('lazy')
+class TestLazyImports(SimpleTestCase):
+
+    def test_exports_resolve(self):
+        for name in form_validators.__all__:
+            self.assertEqual(getattr(form_validators, name).__name__, name)
+
+    def test_dir_lists_exports(self):
+        self.assertIn('UltrasoundFormValidator', dir(form_validators))
+
+    def test_unknown_name(self):
+        with self.assertRaises(AttributeError):
+            form_validators.UnknownFormValidator
@@ -0,0 +1,120 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase, tag
+from edc_constants.constants import NOT_APPLICABLE, OTHER
+from edc_form_validators import FormValidator
+
+from ..form_validators import MedicalHistoryFormValidator
+from ..form_validators.list_model_cache import list_model_cache
+from .models import ListModel
+
+
+@tag('lmc')
+class TestListModelCache(TestCase):
+
+    def setUp(self):
+        list_model_cache.clear()
+        ListModel.objects.create(name=NOT_APPLICABLE, short_name='mhist_na')
+        ListModel.objects.create(name=OTHER, short_name='mhist_other')
+
+    def test_selected(self):
+        self.assertEqual(
+            list_model_cache.selected(ListModel.objects.filter(name=OTHER)),
+            {'mhist_other': OTHER})
+        self.assertEqual(list_model_cache.selected(None), {})
+        self.assertEqual(list_model_cache.selected(ListModel.objects.none()), {})
+
+    def test_choices_cached_per_process(self):
+        list_model_cache.selected(ListModel.objects.all())
+        with self.assertNumQueries(1):
+            list_model_cache.selected(ListModel.objects.all())
+
+    def test_new_rows_reloaded(self):
+        list_model_cache.selected(ListModel.objects.all())
+        ListModel.objects.create(name='Asthma', short_name='asthma')
+        self.assertIn(
+            'asthma', list_model_cache.selected(ListModel.objects.all()))
+
+    def test_selections_resolved_once_per_validation(self):
+        form_validator = MedicalHistoryFormValidator(cleaned_data={
+            'caregiver_chronic': ListModel.objects.all()})
+        form_validator.m2m_selected('caregiver_chronic')
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                form_validator.m2m_selected('caregiver_chronic'),
+                frozenset(['mhist_na', 'mhist_other']))
+            self.assertRaises(
+                ValidationError, form_validator.m2m_single_selection_if,
+                'mhist_na', m2m_field='caregiver_chronic')
+            self.assertRaises(
+                ValidationError, form_validator.m2m_other_specify,
+                'mhist_other', m2m_field='caregiver_chronic',
+                field_other='caregiver_chronic_other')
+
+
+@tag('lmc')
+class TestM2MSelectionsMixin(TestCase):
+    """Compares the mixin's m2m helpers with the FormValidator ones.
+    """
+
+    def setUp(self):
+        list_model_cache.clear()
+        ListModel.objects.create(name=NOT_APPLICABLE, short_name='mhist_na')
+        ListModel.objects.create(name=OTHER, short_name=OTHER)
+
+    def outcome(self, validator_cls, method, cleaned_data, *args, **kwargs):
+        form_validator = validator_cls(cleaned_data=dict(cleaned_data))
+        try:
+            getattr(form_validator, method)(*args, **kwargs)
+        except ValidationError as e:
+            return {field: [(error.message, error.code) for error in errors]
+                    for field, errors in e.error_dict.items()}
+        return None
+
+    def assertSameOutcome(self, method, cleaned_data, *args, **kwargs):
+        expected = self.outcome(
+            FormValidator, method, cleaned_data, *args, **kwargs)
+        self.assertEqual(
+            self.outcome(MedicalHistoryFormValidator, method, cleaned_data,
+                         *args, **kwargs),
+            expected)
+        return expected
+
+    def test_single_selection_if(self):
+        self.assertIsNotNone(self.assertSameOutcome(
+            'm2m_single_selection_if', {'who': ListModel.objects.all()},
+            'mhist_na', m2m_field='who'))
+        self.assertIsNone(self.assertSameOutcome(
+            'm2m_single_selection_if',
+            {'who': ListModel.objects.filter(short_name='mhist_na')},
+            'mhist_na', m2m_field='who'))
+
+    def test_other_specify(self):
+        for cleaned_data in [
+                {'who': ListModel.objects.filter(short_name=OTHER)},
+                {'who': ListModel.objects.filter(short_name='mhist_na'),
+                 'who_other': 'other'},
+                {'who': ListModel.objects.none(), 'who_other': 'other'},
+                {'who': None, 'who_other': 'other'}]:
+            with self.subTest(cleaned_data=cleaned_data):
+                self.assertSameOutcome(
+                    'm2m_other_specify', cleaned_data, OTHER,
+                    m2m_field='who', field_other='who_other')
+
+    def test_other_specify_default_responses(self):
+        self.assertSameOutcome(
+            'm2m_other_specify', {'who': ListModel.objects.filter(short_name=OTHER)},
+            m2m_field='who', field_other='who_other')
+
+    def test_required(self):
+        for value in [None, ListModel.objects.none(), ListModel.objects.all()]:
+            with self.subTest(value=value):
+                self.assertSameOutcome(
+                    'm2m_required', {'who': value}, m2m_field='who')
+
+    def test_cleaned_data_restored(self):
+        value = ListModel.objects.all()
+        form_validator = MedicalHistoryFormValidator(cleaned_data={'who': value})
+        self.assertRaises(
+            ValidationError, form_validator.m2m_other_specify,
+            'mhist_na', m2m_field='who', field_other='who_other')
+        self.assertIs(form_validator.cleaned_data['who'], value)
@@ -0,0 +1,118 @@
+from django.core.cache import cache
+from django.test import TestCase, tag
+from django.test.utils import override_settings
+from edc_base.utils import get_utcnow
+from edc_constants.constants import NEG, POS
+
+from ..form_validators.maternal_hiv_status import CachedMaternalStatusHelper
+from ..form_validators.maternal_hiv_status import MaternalHivStatus
+from ..form_validators.maternal_hiv_status import maternal_hiv_status
+from .models import Appointment, MaternalDataset, MaternalVisit
+
+
+class MaternalStatusHelper:
+
+    maternal_dataset_model = 'flourish_form_validations.maternaldataset'
+
+    def __init__(self, maternal_visit=None):
+        self.maternal_visit = maternal_visit
+
+    @property
+    def hiv_status(self):
+        if MaternalDataset.objects.filter(
+                subject_identifier=self.maternal_visit.subject_identifier,
+                mom_hivstatus='HIV-infected').exists():
+            return POS
+        return NEG
+
+
+@tag('hiv_status')
+@override_settings(MATERNAL_HIV_STATUS_CACHE_TIMEOUT=300)
+class TestMaternalHivStatus(TestCase):
+
+    def setUp(self):
+        self.hiv_status_cache = MaternalHivStatus()
+        self.hiv_status_cache.helper_cls = MaternalStatusHelper
+        self.hiv_status_cache.watched_models = [
+            'flourish_form_validations.maternaldataset']
+        self.hiv_status_cache.watch_models()
+        self.hiv_status_cache.invalidate('11111111')
+
+        appointment = Appointment.objects.create(
+            subject_identifier='11111111', appt_datetime=get_utcnow(),
+            visit_code='1000M')
+        self.maternal_visit = MaternalVisit.objects.create(
+            appointment=appointment, subject_identifier='11111111',
+            report_datetime=get_utcnow())
+
+    def test_watched_models(self):
+        self.assertIn('flourish_form_validations.maternaldataset',
+                      self.hiv_status_cache.watched)
+
+    def test_hiv_status(self):
+        self.assertEqual(
+            self.hiv_status_cache.hiv_status(self.maternal_visit), NEG)
+
+    def test_hiv_status_cached(self):
+        self.hiv_status_cache.hiv_status(self.maternal_visit)
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                self.hiv_status_cache.hiv_status(self.maternal_visit), NEG)
+
+    def test_invalidated_on_save(self):
+        self.assertEqual(
+            self.hiv_status_cache.hiv_status(self.maternal_visit), NEG)
+        maternal_dataset = MaternalDataset.objects.create(
+            screening_identifier='ABC12345', subject_identifier='11111111',
+            mom_hivstatus='HIV-infected', study_child_identifier='B123-4',
+            study_maternal_identifier='B123', delivdt=get_utcnow().date())
+        self.assertEqual(
+            self.hiv_status_cache.hiv_status(self.maternal_visit), POS)
+        maternal_dataset.delete()
+        self.assertEqual(
+            self.hiv_status_cache.hiv_status(self.maternal_visit), NEG)
+
+    def test_invalidated_without_a_prior_read(self):
+        cache_key = self.hiv_status_cache.cache_key('11111111')
+        cache.set(cache_key, {str(self.maternal_visit.pk): NEG})
+        MaternalDataset.objects.create(
+            screening_identifier='ABC12345', subject_identifier='11111111',
+            mom_hivstatus='HIV-infected', study_child_identifier='B123-4',
+            study_maternal_identifier='B123', delivdt=get_utcnow().date())
+        self.assertIsNone(cache.get(cache_key))
+
+
+@tag('hiv_status')
+@override_settings(MATERNAL_HIV_STATUS_CACHE_TIMEOUT=300)
+class TestCachedMaternalStatusHelper(TestCase):
+
+    def setUp(self):
+        helper_cls = maternal_hiv_status.helper_cls
+        self.addCleanup(setattr, maternal_hiv_status, 'helper_cls', helper_cls)
+        maternal_hiv_status.helper_cls = MaternalStatusHelper
+        maternal_hiv_status.watch(MaternalDataset)
+        maternal_hiv_status.invalidate('11111111')
+
+        appointment = Appointment.objects.create(
+            subject_identifier='11111111', appt_datetime=get_utcnow(),
+            visit_code='1000M')
+        self.maternal_visit = MaternalVisit.objects.create(
+            appointment=appointment, subject_identifier='11111111',
+            report_datetime=get_utcnow())
+
+    def test_helpers_share_cached_status(self):
+        self.assertEqual(
+            CachedMaternalStatusHelper(self.maternal_visit).hiv_status, NEG)
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                CachedMaternalStatusHelper(self.maternal_visit).hiv_status, NEG)
+
+    def test_helper_invalidated_on_save(self):
+        self.assertEqual(
+            CachedMaternalStatusHelper(self.maternal_visit).hiv_status, NEG)
+        MaternalDataset.objects.create(
+            screening_identifier='ABC12345', subject_identifier='11111111',
+            mom_hivstatus='HIV-infected', study_child_identifier='B123-4',
+            study_maternal_identifier='B123', delivdt=get_utcnow().date())
+        self.assertEqual(
+            CachedMaternalStatusHelper(self.maternal_visit).hiv_status, POS)
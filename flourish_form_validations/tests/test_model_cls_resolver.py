@@ -0,0 +1,34 @@
+from django.test import TestCase, tag
+
+from ..form_validators import UltrasoundFormValidator
+from ..form_validators.model_cls_resolver import model_cls_resolver
+from .models import SubjectConsent, OffStudy
+
+
+@tag('mcr')
+class TestModelClsResolver(TestCase):
+
+    def setUp(self):
+        model_cls_resolver.clear()
+
+    def test_resolves_and_caches_model_cls(self):
+        label = 'flourish_form_validations.subjectconsent'
+        self.assertEqual(
+            model_cls_resolver.get_model(UltrasoundFormValidator, label),
+            SubjectConsent)
+        self.assertIn(
+            (UltrasoundFormValidator, label), model_cls_resolver.registry)
+
+    def test_honours_reassigned_model_label(self):
+        form_validator = UltrasoundFormValidator(cleaned_data={})
+        original = UltrasoundFormValidator.caregiver_offstudy_model
+        try:
+            UltrasoundFormValidator.caregiver_offstudy_model = \
+                'flourish_form_validations.subjectconsent'
+            self.assertEqual(form_validator.caregiver_offstudy_cls, SubjectConsent)
+
+            UltrasoundFormValidator.caregiver_offstudy_model = \
+                'flourish_form_validations.offstudy'
+            self.assertEqual(form_validator.caregiver_offstudy_cls, OffStudy)
+        finally:
+            UltrasoundFormValidator.caregiver_offstudy_model = original
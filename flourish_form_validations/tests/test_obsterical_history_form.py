@@ -320,3 +320,32 @@ class TestObstericalHistoryForm(TestModeMixin, TestCase):
         self.assertIn('live_children', form_validator._errors)
         
         
+
+    @tag('obga')
+    def test_ga_context_resolved_once(self):
+        AntenatalEnrollment.objects.create(
+            subject_identifier='11111111',)
+
+        UltraSound.objects.create(
+            maternal_visit=self.maternal_visit, ga_confirmed=20)
+
+        cleaned_data = {
+            'maternal_visit': self.maternal_visit,
+            'prev_pregnancies': 1,
+            'pregs_24wks_or_more': 0,
+            'lost_before_24wks': 0,
+            'lost_after_24wks': 0,
+            'live_children': 0,
+            'children_died_b4_5yrs': 0,
+            'children_died_aft_5yrs': 0,
+            'children_deliv_before_37wks': 0,
+            'children_deliv_aftr_37wks': 0}
+        form_validator = ObstericalHistoryFormValidator(
+            cleaned_data=cleaned_data)
+        form_validator.subject_identifier = '11111111'
+        with self.assertNumQueries(2):
+            form_validator.validate_ultrasound(cleaned_data=cleaned_data)
+        with self.assertNumQueries(0):
+            form_validator.validate_prev_pregnancies(cleaned_data=cleaned_data)
+            form_validator.validate_children_delivery(cleaned_data=cleaned_data)
+        self.assertEqual(form_validator.ga_context.ga_confirmed, 20)
@@ -0,0 +1,80 @@
+from django.core.cache import cache
+from django.test import TestCase, tag
+from django.test.utils import override_settings
+from edc_constants.constants import CLOSED, NEW
+
+from ..form_validators.offstudy_status import OffstudyStatus
+from ..form_validators.offstudy_status import ON_STUDY, OFF_STUDY, PENDING_OFF_STUDY
+from .models import ActionItem, ActionType, OffStudy
+
+
+class OffstudyActions:
+
+    action_name = 'submit-caregiveroff-study'
+
+    def action_item_model_cls(self, caregiver_offstudy_cls):
+        return ActionItem
+
+
+@tag('offstudy')
+@override_settings(OFFSTUDY_STATUS_CACHE_TIMEOUT=300)
+class TestOffstudyStatus(TestCase):
+
+    def setUp(self):
+        self.offstudy_status = OffstudyStatus()
+        self.offstudy_status.actions = OffstudyActions()
+        self.offstudy_status.invalidate('11111111')
+        self.action_type = ActionType.objects.create(
+            name=OffstudyActions.action_name)
+
+    def status(self):
+        return self.offstudy_status.status(
+            caregiver_offstudy_cls=OffStudy, subject_identifier='11111111')
+
+    def test_on_study(self):
+        self.assertEqual(self.status(), ON_STUDY)
+
+    def test_pending_off_study(self):
+        ActionItem.objects.create(
+            subject_identifier='11111111', action_type=self.action_type,
+            status=NEW)
+        self.assertEqual(self.status(), PENDING_OFF_STUDY)
+
+    def test_closed_action_item_not_pending(self):
+        ActionItem.objects.create(
+            subject_identifier='11111111', action_type=self.action_type,
+            status=CLOSED)
+        self.assertEqual(self.status(), ON_STUDY)
+
+    def test_off_study(self):
+        OffStudy.objects.create(subject_identifier='11111111')
+        self.assertEqual(self.status(), OFF_STUDY)
+
+    def test_status_cached(self):
+        self.status()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.status(), ON_STUDY)
+
+    def test_invalidated_on_save(self):
+        self.assertEqual(self.status(), ON_STUDY)
+        action_item = ActionItem.objects.create(
+            subject_identifier='11111111', action_type=self.action_type,
+            status=NEW)
+        self.assertEqual(self.status(), PENDING_OFF_STUDY)
+        action_item.delete()
+        offstudy = OffStudy.objects.create(subject_identifier='11111111')
+        self.assertEqual(self.status(), OFF_STUDY)
+        offstudy.delete()
+        self.assertEqual(self.status(), ON_STUDY)
+
+    def test_invalidated_without_a_prior_read(self):
+        """A process that has never read a status still drops the
+        cached entries when the models are watched at startup.
+        """
+        offstudy_status = OffstudyStatus()
+        offstudy_status.watched_models = ['flourish_form_validations.offstudy']
+        offstudy_status.watch_models()
+        cache_key = offstudy_status.cache_key('11111111')
+        cache.set(cache_key, {'flourish_form_validations.offstudy': ON_STUDY})
+        OffStudy.objects.create(subject_identifier='11111111')
+        self.assertIsNone(cache.get(cache_key))
@@ -0,0 +1,103 @@
+import os
+import tempfile
+
+from django.core.exceptions import ImproperlyConfigured, ValidationError
+from django.test import TestCase, tag
+from django.test.utils import override_settings
+from edc_constants.constants import OTHER
+
+from ..form_validators import FormValidatorMixin
+from ..form_validators import InPersonContactAttemptFormValidator
+from ..profiling import PrometheusTextfileSink, RingBufferSink
+from ..profiling import install, uninstall
+from ..profiling.profiler import profiled_method_names, validator_classes
+from ..profiling.profiler import ValidationTiming
+
+
+class ContactMixin:
+
+    def validate_contact(self):
+        self.validate_other_specify(field='contact_person_unsuc')
+
+
+class ContactAttemptFormValidator(ContactMixin, InPersonContactAttemptFormValidator):
+
+    def clean(self):
+        self.validate_contact()
+
+
+@tag('prof')
+class TestProfiling(TestCase):
+
+    def setUp(self):
+        self.sink = RingBufferSink()
+        install(sink=self.sink, classes=[InPersonContactAttemptFormValidator])
+
+    def tearDown(self):
+        uninstall()
+
+    def test_clean_recorded(self):
+        form_validator = InPersonContactAttemptFormValidator(
+            cleaned_data={'phy_addr_unsuc': 'no_one_home'})
+        form_validator.validate()
+        timings = self.sink.records()
+        self.assertEqual(len(timings), 1)
+        self.assertEqual(timings[0].validator, 'InPersonContactAttemptFormValidator')
+        self.assertEqual(timings[0].method, 'clean')
+        self.assertEqual(timings[0].queries, 0)
+
+    def test_recorded_when_invalid(self):
+        form_validator = InPersonContactAttemptFormValidator(
+            cleaned_data={'phy_addr_unsuc': OTHER})
+        self.assertRaises(ValidationError, form_validator.validate)
+        self.assertEqual(len(self.sink.records()), 1)
+
+    def test_uninstall_restores_methods(self):
+        uninstall()
+        self.assertFalse(
+            hasattr(InPersonContactAttemptFormValidator.clean, 'profiled_method'))
+
+    def test_inherited_methods_profiled(self):
+        self.assertEqual(
+            profiled_method_names(ContactAttemptFormValidator),
+            ['clean', 'validate_contact'])
+        install(sink=self.sink, classes=[ContactAttemptFormValidator])
+        ContactAttemptFormValidator(cleaned_data={}).validate()
+        self.assertEqual(
+            [timing.method for timing in self.sink.records()],
+            ['validate_contact', 'clean'])
+        self.assertEqual(
+            {timing.validator for timing in self.sink.records()},
+            {'ContactAttemptFormValidator'})
+
+    def test_mixins_not_profiled(self):
+        classes = validator_classes()
+        self.assertIn(InPersonContactAttemptFormValidator, classes)
+        self.assertNotIn(FormValidatorMixin, classes)
+
+    def test_uninstall_restores_inherited_methods(self):
+        install(sink=self.sink, classes=[ContactAttemptFormValidator])
+        uninstall()
+        self.assertNotIn('validate_contact', vars(ContactAttemptFormValidator))
+        self.assertFalse(
+            hasattr(ContactAttemptFormValidator.clean, 'profiled_method'))
+
+
+@tag('prof')
+class TestPrometheusTextfileSink(TestCase):
+
+    def test_path_required(self):
+        self.assertRaises(ImproperlyConfigured, PrometheusTextfileSink)
+
+    def test_path_from_settings(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'validators.prom')
+            with override_settings(FORM_VALIDATOR_PROFILING_TEXTFILE=path):
+                sink = PrometheusTextfileSink(flush_interval=0)
+            sink.record(ValidationTiming(
+                validator='UltrasoundFormValidator', method='clean',
+                wall_time=0.5, queries=2, duplicate_queries=1))
+            with open(path) as f:
+                self.assertIn(
+                    'flourish_form_validator_calls_total{validator='
+                    '"UltrasoundFormValidator",method="clean"} 1', f.read())
@@ -0,0 +1,158 @@
+from dateutil.relativedelta import relativedelta
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+from edc_constants.constants import YES, NO, NOT_APPLICABLE
+
+from ..form_validators import CaregiverClinicalMeasurementsFormValidator
+from ..form_validators import CaregiverPrevEnrolledFormValidator
+from ..form_validators import MaternalArvDuringPregFormValidator
+from ..form_validators import ObstericalHistoryFormValidator
+from ..form_validators import SubjectConsentFormValidator
+from ..form_validators import UltrasoundFormValidator
+from .models import AntenatalEnrollment, Appointment, ArvsPrePregnancy
+from .models import CaregiverChildConsent, ChildAssent
+from .models import FlourishConsentVersion, MaternalVisit, SubjectConsent
+from .models import UltraSound
+from .query_budget import QueryBudgetMixin, duplicated_queries
+from .test_model_mixin import TestModeMixin
+
+
+@tag('qb')
+class TestQueryBudgets(QueryBudgetMixin, TestCase):
+
+    def setUp(self):
+        for validator_cls in [CaregiverClinicalMeasurementsFormValidator,
+                              CaregiverPrevEnrolledFormValidator,
+                              MaternalArvDuringPregFormValidator,
+                              ObstericalHistoryFormValidator,
+                              SubjectConsentFormValidator,
+                              UltrasoundFormValidator]:
+            TestModeMixin(validator_cls)
+
+        CaregiverPrevEnrolledFormValidator.bhp_prior_screening_model = \
+            'flourish_form_validations.screeningpriorbhpparticipants'
+        CaregiverPrevEnrolledFormValidator.child_assent_model = \
+            'flourish_form_validations.childassent'
+        MaternalArvDuringPregFormValidator.arvs_pre_preg_model = \
+            'flourish_form_validations.arvsprepregnancy'
+        SubjectConsentFormValidator.prior_screening_model = \
+            'flourish_form_validations.screeningpriorbhpparticipants'
+        SubjectConsentFormValidator.preg_women_screening_model = \
+            'flourish_form_validations.screeningpregwomen'
+
+        FlourishConsentVersion.objects.create(
+            screening_identifier='ABC12345')
+
+        self.subject_consent = SubjectConsent.objects.create(
+            subject_identifier='11111111', screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow() - relativedelta(days=1),
+            version='1')
+
+        appointment = Appointment.objects.create(
+            subject_identifier=self.subject_consent.subject_identifier,
+            appt_datetime=get_utcnow(),
+            visit_code='1000M')
+
+        self.maternal_visit = MaternalVisit.objects.create(
+            appointment=appointment,
+            subject_identifier=self.subject_consent.subject_identifier,
+            report_datetime=get_utcnow())
+        self.maternal_visit.schedule_name = 'a_birth1_schedule1'
+
+    def test_caregiver_clinical_measurements_budget(self):
+        form_validator = CaregiverClinicalMeasurementsFormValidator(
+            cleaned_data={
+                'maternal_visit': self.maternal_visit,
+                'report_datetime': get_utcnow(),
+                'height': 164.0,
+                'weight_kg': 65.0,
+                'systolic_bp': 120,
+                'diastolic_bp': 80,
+                'all_measurements': YES,
+                'confirm_values': YES})
+        self.assertValidatorWithinBudget(form_validator)
+
+    def test_caregiver_prev_enrolled_budget(self):
+        CaregiverChildConsent.objects.create(
+            subject_consent=self.subject_consent,
+            subject_identifier='11111111-10', is_eligible=True,
+            child_age_at_enrollment=10)
+        ChildAssent.objects.create(subject_identifier='11111111-10')
+        form_validator = CaregiverPrevEnrolledFormValidator(
+            cleaned_data={
+                'subject_identifier': self.subject_consent.subject_identifier,
+                'report_datetime': get_utcnow(),
+                'maternal_prev_enroll': NO,
+                'sex': 'female',
+                'relation_to_child': 'biological_mother'})
+        self.assertValidatorWithinBudget(form_validator)
+
+    def test_maternal_arv_during_preg_budget(self):
+        ArvsPrePregnancy.objects.create(
+            maternal_visit=self.maternal_visit, preg_on_art=NO)
+        form_validator = MaternalArvDuringPregFormValidator(
+            cleaned_data={
+                'maternal_visit': self.maternal_visit,
+                'report_datetime': get_utcnow(),
+                'took_arv': NO,
+                'is_interrupt': NOT_APPLICABLE,
+                'interrupt': NOT_APPLICABLE})
+        self.assertValidatorWithinBudget(form_validator)
+
+    def test_obsterical_history_budget(self):
+        AntenatalEnrollment.objects.create(
+            subject_identifier=self.subject_consent.subject_identifier)
+        UltraSound.objects.create(
+            maternal_visit=self.maternal_visit, ga_confirmed=20)
+        form_validator = ObstericalHistoryFormValidator(
+            cleaned_data={
+                'maternal_visit': self.maternal_visit,
+                'prev_pregnancies': 1,
+                'pregs_24wks_or_more': 0,
+                'lost_before_24wks': 0,
+                'lost_after_24wks': 0,
+                'live_children': 0,
+                'children_died_b4_5yrs': 0,
+                'children_died_aft_5yrs': 0,
+                'children_deliv_before_37wks': 0,
+                'children_deliv_aftr_37wks': 0})
+        self.assertValidatorWithinBudget(form_validator)
+
+    def test_subject_consent_budget(self):
+        form_validator = SubjectConsentFormValidator(
+            cleaned_data={
+                'screening_identifier': 'XYZ12345',
+                'consent_datetime': get_utcnow(),
+                'version': '1',
+                'dob': (get_utcnow() - relativedelta(years=25)).date(),
+                'first_name': 'TEST ONE',
+                'last_name': 'TEST',
+                'initials': 'TOT',
+                'identity': '123425678',
+                'confirm_identity': '123425678',
+                'citizen': YES})
+        self.assertValidatorWithinBudget(form_validator)
+
+    def test_ultrasound_budget(self):
+        form_validator = UltrasoundFormValidator(
+            cleaned_data={
+                'maternal_visit': self.maternal_visit,
+                'report_datetime': get_utcnow(),
+                'ga_by_ultrasound_wks': 35,
+                'est_edd_ultrasound': get_utcnow().date() + relativedelta(days=50)})
+        self.assertValidatorWithinBudget(form_validator)
+
+    def test_over_budget_lists_duplicated_sql(self):
+        with self.assertRaises(AssertionError) as cm:
+            with self.assertQueryBudget(1, label='lookup'):
+                for _ in range(2):
+                    SubjectConsent.objects.filter(
+                        subject_identifier='11111111').exists()
+        self.assertIn('lookup ran 2 queries, budget is 1.', str(cm.exception))
+        self.assertIn('2 x SELECT', str(cm.exception))
+
+    def test_duplicated_queries(self):
+        captured_queries = [{'sql': 'SELECT 1'}, {'sql': 'SELECT 2'},
+                            {'sql': 'SELECT 1'}]
+        self.assertEqual(duplicated_queries(captured_queries), [(2, 'SELECT 1')])
@@ -0,0 +1,86 @@
+import os
+import tempfile
+
+from dateutil.relativedelta import relativedelta
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+
+from ..form_validators import MaternalArvDuringPregFormValidator
+from ..form_validators.registry import ValidatorRegistry
+from ..revalidation import Checkpoint, Task, cleaned_data_for, instances_for
+from ..revalidation import revalidate_subject
+from .models import Appointment, ArvsPrePregnancy, FlourishConsentVersion
+from .models import MaternalArvDuringPreg, MaternalVisit, SubjectConsent
+from .test_model_mixin import TestModeMixin
+
+
+@tag('reval')
+class TestRevalidation(TestModeMixin, TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(MaternalArvDuringPregFormValidator, *args, **kwargs)
+
+    def setUp(self):
+        MaternalArvDuringPregFormValidator.arvs_pre_preg_model = \
+            'flourish_form_validations.arvsprepregnancy'
+
+        FlourishConsentVersion.objects.create(
+            screening_identifier='ABC12345')
+        SubjectConsent.objects.create(
+            subject_identifier='11111111', screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow() - relativedelta(days=10),
+            version='1')
+        self.maternal_visits = []
+        for visit_code in ['1000M', '2000M']:
+            appointment = Appointment.objects.create(
+                subject_identifier='11111111',
+                appt_datetime=get_utcnow(),
+                visit_code=visit_code)
+            self.maternal_visits.append(MaternalVisit.objects.create(
+                appointment=appointment))
+        ArvsPrePregnancy.objects.create(
+            maternal_visit=self.maternal_visits[0], preg_on_art='Yes')
+
+        self.validators = ValidatorRegistry(lazy={
+            'flourish_form_validations.maternalarvduringpreg':
+                'MaternalArvDuringPregFormValidator'})
+
+    def test_cleaned_data_for(self):
+        arv_during_preg = MaternalArvDuringPreg.objects.create(
+            maternal_visit=self.maternal_visits[0], took_arv='Yes')
+        cleaned_data = cleaned_data_for(arv_during_preg)
+        self.assertEqual(cleaned_data['maternal_visit'], self.maternal_visits[0])
+        self.assertEqual(cleaned_data['took_arv'], 'Yes')
+
+    def test_instances_loaded_with_related(self):
+        for maternal_visit in self.maternal_visits:
+            MaternalArvDuringPreg.objects.create(
+                maternal_visit=maternal_visit, took_arv='Yes')
+        with self.assertNumQueries(1):
+            instances = instances_for(MaternalArvDuringPreg, '11111111')
+        with self.assertNumQueries(0):
+            cleaned_data_list = [
+                cleaned_data_for(instance) for instance in instances]
+        self.assertEqual(
+            [cleaned_data['maternal_visit'] for cleaned_data in cleaned_data_list],
+            self.maternal_visits)
+
+    def test_revalidate_subject_reports_failures(self):
+        failing = MaternalArvDuringPreg.objects.create(
+            maternal_visit=self.maternal_visits[1], took_arv='No')
+        failures = revalidate_subject(
+            Task('flourish_form_validations.maternalarvduringpreg', '11111111'),
+            validators=self.validators)
+        self.assertEqual([failure.pk for failure in failures], [str(failing.pk)])
+        self.assertIn('took_arv', failures[0].errors)
+        self.assertTrue(all(isinstance(messages, list)
+                            for messages in failures[0].errors.values()))
+
+    def test_checkpoint_resumes(self):
+        path = os.path.join(tempfile.mkdtemp(), 'revalidation.checkpoint')
+        task = Task('flourish_form_validations.maternalarvduringpreg', '11111111')
+        Checkpoint(path).add(task)
+        self.assertIn(task, Checkpoint(path))
+        self.assertNotIn(task._replace(subject_identifier='22222222'),
+                         Checkpoint(path))
@@ -0,0 +1,81 @@
+from dateutil.relativedelta import relativedelta
+from django.core.exceptions import ValidationError
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+
+from ..form_validators import UltrasoundFormValidator
+from ..form_validators.rules import IO, PURE, io_rule, pure_rule, rule_cost, schedule
+from ..form_validators.rules import prerequisite_rule
+from .models import SubjectConsent, Appointment, MaternalVisit
+from .models import FlourishConsentVersion
+from .test_model_mixin import TestModeMixin
+
+
+@tag('rules')
+class TestRuleScheduling(TestModeMixin, TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(UltrasoundFormValidator, *args, **kwargs)
+
+    def setUp(self):
+        FlourishConsentVersion.objects.create(
+            screening_identifier='ABC12345')
+
+        SubjectConsent.objects.create(
+            subject_identifier='11111111', screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow() - relativedelta(days=10),
+            version='1')
+
+        appointment = Appointment.objects.create(
+            subject_identifier='11111111',
+            appt_datetime=get_utcnow(),
+            visit_code='1000')
+
+        self.maternal_visit = MaternalVisit.objects.create(
+            appointment=appointment,
+            report_datetime=get_utcnow() - relativedelta(days=1))
+
+    def test_pure_rules_scheduled_first(self):
+        first_io = io_rule(lambda: None)
+        first_pure = pure_rule(lambda: None)
+        untagged = lambda: None  # noqa
+        second_pure = pure_rule(lambda: None)
+        self.assertEqual(
+            schedule([first_io, first_pure, untagged, second_pure]),
+            [first_pure, second_pure, first_io, untagged])
+
+    def test_prerequisite_rules_scheduled_before_pure_rules(self):
+        pure = pure_rule(lambda: None)
+        untagged = lambda: None  # noqa
+        prerequisite = prerequisite_rule(lambda: None)
+        self.assertEqual(
+            schedule([pure, untagged, prerequisite]),
+            [prerequisite, pure, untagged])
+
+    def test_rule_cost(self):
+        self.assertEqual(rule_cost(pure_rule(lambda: None)), PURE)
+        self.assertEqual(rule_cost(lambda: None), IO)
+        form_validator = UltrasoundFormValidator(cleaned_data={})
+        self.assertEqual(
+            rule_cost(form_validator.validate_rule_table), PURE)
+
+    def test_invalid_payload_fails_before_io_rules(self):
+        """Assert only the consent prerequisite queries run before the
+        pure rules reject the payload.
+        """
+        form_validator = UltrasoundFormValidator(cleaned_data={
+            'maternal_visit': self.maternal_visit,
+            'report_datetime': get_utcnow(),
+            'ga_by_ultrasound_wks': 41})
+        with self.assertNumQueries(2):
+            self.assertRaises(ValidationError, form_validator.validate)
+        self.assertIn('ga_by_ultrasound_wks', form_validator._errors)
+
+    def test_valid_payload_runs_io_rules(self):
+        form_validator = UltrasoundFormValidator(cleaned_data={
+            'maternal_visit': self.maternal_visit,
+            'report_datetime': get_utcnow(),
+            'ga_by_ultrasound_wks': 35})
+        with self.assertNumQueries(2):
+            form_validator.validate()
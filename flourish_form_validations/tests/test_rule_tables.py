@@ -0,0 +1,96 @@
+from django.core.exceptions import ValidationError
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+from edc_constants.constants import YES, NO, POS
+
+from ..form_validators import BreastFeedingQuestionnaireFormValidator
+from ..form_validators import Covid19FormValidator
+from ..form_validators import SubstanceUsePriorFormValidator
+from ..form_validators import TbVisitScreeningWomenFormValidator
+from ..form_validators.rule_tables import RequiredIf
+from ..form_validators.rules import IO, PURE, rule_cost
+from .models import Appointment, MaternalVisit
+
+
+@tag('rt')
+class TestRuleTables(TestCase):
+
+    def setUp(self):
+        appointment = Appointment.objects.create(
+            subject_identifier='11111111',
+            appt_datetime=get_utcnow(),
+            visit_code='1000M')
+        self.maternal_visit = MaternalVisit.objects.create(
+            appointment=appointment)
+
+    def test_rules_compiled_per_class(self):
+        self.assertEqual(len(SubstanceUsePriorFormValidator.compiled_rules), 4)
+        function, args, kwargs = SubstanceUsePriorFormValidator.compiled_rules[0]
+        self.assertEqual(function.__name__, 'required_if')
+        self.assertEqual(args, (YES, ))
+        self.assertEqual(kwargs, {'field': 'smoked_prior_to_preg',
+                                  'field_required': 'smoking_prior_preg_freq'})
+
+    def test_dependent_fields_flattened(self):
+        rule = RequiredIf(YES, field='cough_illness',
+                          field_required=['cough_illness_times',
+                                          'cough_illness_preg'])
+        self.assertEqual(
+            [kwargs['field_required'] for _, _, kwargs in rule.compile()],
+            ['cough_illness_times', 'cough_illness_preg'])
+        self.assertEqual(
+            len(TbVisitScreeningWomenFormValidator.compiled_rules), 27)
+
+    def test_rule_table_cost(self):
+        self.assertEqual(
+            rule_cost(SubstanceUsePriorFormValidator.validate_rule_table), PURE)
+        self.assertEqual(
+            rule_cost(Covid19FormValidator.validate_rule_table), IO)
+        self.assertEqual(
+            rule_cost(BreastFeedingQuestionnaireFormValidator.validate_rule_table),
+            IO)
+
+    def test_breastfeeding_rules_in_original_order(self):
+        form_validator = BreastFeedingQuestionnaireFormValidator(cleaned_data={
+            'influenced_during_preg': YES,
+            'influenced_after_delivery': YES,
+            'feeding_hiv_status': NO,
+            'hiv_status_during_preg': POS})
+        self.assertRaises(ValidationError, form_validator.validate)
+        self.assertIn('hiv_status_aware', form_validator._errors)
+        self.assertNotIn('training_outcome', form_validator._errors)
+
+    def test_rule_table_fields(self):
+        self.assertEqual(
+            SubstanceUsePriorFormValidator.rule_table_fields()[:2],
+            ['smoked_prior_to_preg', 'smoking_prior_preg_freq'])
+
+    def test_required_if_row(self):
+        form_validator = Covid19FormValidator(cleaned_data={
+            'maternal_visit': self.maternal_visit,
+            'test_for_covid': YES,
+            'date_of_test': None})
+        self.assertRaises(ValidationError, form_validator.validate)
+        self.assertIn('date_of_test', form_validator._errors)
+
+    def test_required_if_row_valid(self):
+        form_validator = Covid19FormValidator(cleaned_data={
+            'maternal_visit': self.maternal_visit,
+            'test_for_covid': NO,
+            'fully_vaccinated': NO})
+        try:
+            form_validator.validate()
+        except ValidationError as e:
+            self.fail(f'ValidationError unexpectedly raised. Got{e}')
+
+    def test_rows_collected(self):
+        form_validator = Covid19FormValidator(
+            cleaned_data={
+                'maternal_visit': self.maternal_visit,
+                'test_for_covid': NO,
+                'has_tested_positive': YES,
+                'result_of_test': POS},
+            collect_errors=True)
+        self.assertRaises(ValidationError, form_validator.validate)
+        self.assertIn('date_of_test_member', form_validator._errors)
+        self.assertIn('isolation_location', form_validator._errors)
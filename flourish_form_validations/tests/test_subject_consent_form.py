@@ -1,4 +1,4 @@
-from django.core.exceptions import ValidationError
+from django.core.exceptions import FieldDoesNotExist, ValidationError
 from django.test import TestCase, tag
 from edc_base.utils import get_utcnow, relativedelta
 from edc_constants.constants import YES, OTHER
@@ -204,3 +204,78 @@ class TestSubjectConsentForm(TestModeMixin, TestCase):
             cleaned_data=self.consent_options)
         self.assertRaises(ValidationError, form_validator.validate)
         self.assertIn('first_name', form_validator._errors)
+
+    def test_screening_lookups_memoized(self):
+        ScreeningPregWomen.objects.create(
+            screening_identifier=self.screening_identifier)
+        form_validator = SubjectConsentFormValidator(
+            cleaned_data=self.consent_options)
+        form_validator.screening_identifier = self.screening_identifier
+        self.assertIsNotNone(form_validator.preg_women_screening)
+        self.assertIsNone(form_validator.bhp_prior_screening)
+        with self.assertNumQueries(0):
+            form_validator.preg_women_screening
+            form_validator.bhp_prior_screening
+            form_validator.validate_breastfeed_intent()
+
+
+@tag('sc')
+class TestSubjectReconsent(TestModeMixin, TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(SubjectConsentFormValidator, *args, **kwargs)
+
+    def setUp(self):
+        SubjectConsentFormValidator.subject_consent_model = \
+            'flourish_form_validations.subjectconsent'
+
+        self.consent_options = {
+            'subject_identifier': '11111111',
+            'screening_identifier': 'ABC12345',
+            'version': '1',
+            'dob': (get_utcnow() - relativedelta(years=25)).date(),
+            'first_name': 'TEST ONE',
+            'last_name': 'TEST',
+            'identity': '123425678',
+            'identity_type': 'country_id',
+            'recruit_source': 'bhp',
+            'recruit_source_other': None,
+            'recruitment_clinic': 'PMH',
+            'recruitment_clinic_other': None,
+            'is_literate': YES}
+        SubjectConsent.objects.create(
+            consent_datetime=get_utcnow() - relativedelta(days=1),
+            **self.consent_options)
+
+    def test_reconsent_unchanged(self):
+        form_validator = SubjectConsentFormValidator(
+            cleaned_data=dict(self.consent_options))
+        try:
+            form_validator.validate_reconsent()
+        except ValidationError as e:
+            self.fail(f'ValidationError unexpectedly raised. Got{e}')
+
+    def test_reconsent_encrypted_field_changed(self):
+        form_validator = SubjectConsentFormValidator(
+            cleaned_data=dict(self.consent_options, first_name='TEST TWO'))
+        self.assertRaises(ValidationError, form_validator.validate_reconsent)
+        self.assertIn('first_name', form_validator._errors)
+        self.assertIn('TEST ONE', str(form_validator._errors['first_name']))
+
+    def test_reconsent_identity_changed(self):
+        form_validator = SubjectConsentFormValidator(
+            cleaned_data=dict(self.consent_options, identity='987654321'))
+        self.assertRaises(ValidationError, form_validator.validate_reconsent)
+        self.assertIn('identity', form_validator._errors)
+
+    def test_reconsent_field_changed(self):
+        form_validator = SubjectConsentFormValidator(
+            cleaned_data=dict(self.consent_options, recruit_source='other'))
+        self.assertRaises(ValidationError, form_validator.validate_reconsent)
+        self.assertIn('recruit_source', form_validator._errors)
+
+    def test_unknown_reconsent_field(self):
+        form_validator = SubjectConsentFormValidator(
+            cleaned_data=dict(self.consent_options))
+        form_validator.reconsent_fields = ['first_nam']
+        self.assertRaises(FieldDoesNotExist, form_validator.validate_reconsent)
@@ -0,0 +1,69 @@
+from dateutil.relativedelta import relativedelta
+from django.test import TestCase, tag
+from edc_base.utils import get_utcnow
+
+from ..form_validators import UltrasoundFormValidator
+from .models import SubjectConsent, Appointment, MaternalVisit
+from .models import FlourishConsentVersion
+from .test_model_mixin import TestModeMixin
+
+
+@tag('sctx')
+class TestSubjectContext(TestModeMixin, TestCase):
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(UltrasoundFormValidator, *args, **kwargs)
+
+    def setUp(self):
+        FlourishConsentVersion.objects.create(
+            screening_identifier='ABC12345')
+
+        self.subject_consent = SubjectConsent.objects.create(
+            subject_identifier='11111111', screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow() - relativedelta(days=10),
+            version='1')
+
+        appointment = Appointment.objects.create(
+            subject_identifier=self.subject_consent.subject_identifier,
+            appt_datetime=get_utcnow(),
+            visit_code='1000')
+        self.maternal_visit = MaternalVisit.objects.create(
+            appointment=appointment)
+
+        self.form_validator = UltrasoundFormValidator(
+            cleaned_data={'maternal_visit': self.maternal_visit})
+        self.form_validator.subject_identifier = '11111111'
+
+    def test_latest_consent_memoized(self):
+        latest_consent = self.form_validator.latest_consent_obj
+        self.assertEqual(latest_consent.pk, self.subject_consent.pk)
+        with self.assertNumQueries(0):
+            self.form_validator.latest_consent_obj
+            self.form_validator.validate_against_consent_datetime(get_utcnow())
+            self.form_validator.validate_consent_version_obj()
+
+    def test_latest_consent_is_latest_version(self):
+        reconsent = SubjectConsent.objects.create(
+            subject_identifier='11111111', screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow() - relativedelta(days=1),
+            version='2')
+        self.assertEqual(
+            self.form_validator.latest_consent_obj.pk, reconsent.pk)
+
+    def test_latest_consent_single_query(self):
+        SubjectConsent.objects.create(
+            subject_identifier='11111111', screening_identifier='ABC12345',
+            gender='F', dob=(get_utcnow() - relativedelta(years=25)).date(),
+            consent_datetime=get_utcnow() - relativedelta(days=1),
+            version='2')
+        with self.assertNumQueries(1):
+            latest_consent = self.form_validator.latest_consent_obj
+        self.assertEqual(latest_consent.version, '2')
+        self.assertIn('gender', latest_consent.get_deferred_fields())
+
+    def test_context_reset_on_subject_change(self):
+        self.assertIsNotNone(self.form_validator.latest_consent_obj)
+        self.form_validator.subject_identifier = '22222222'
+        self.assertIsNone(self.form_validator.latest_consent_obj)
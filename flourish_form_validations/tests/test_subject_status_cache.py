@@ -0,0 +1,61 @@
+from django.test import TestCase, tag
+from django.test.utils import override_settings
+
+from ..form_validators.subject_status_cache import SubjectStatusCache
+from .models import OffStudy
+
+
+class OffStudyExistsCache(SubjectStatusCache):
+
+    cache_prefix = 'flourish_form_validations.tests.offstudy_exists'
+    timeout_setting = 'TEST_OFFSTUDY_EXISTS_CACHE_TIMEOUT'
+
+    def exists(self, subject_identifier):
+        self.watch(OffStudy)
+        return self.get(
+            subject_identifier, 'exists',
+            lambda: OffStudy.objects.filter(
+                subject_identifier=subject_identifier).exists())
+
+
+@tag('ssc')
+@override_settings(TEST_OFFSTUDY_EXISTS_CACHE_TIMEOUT=300)
+class TestSubjectStatusCache(TestCase):
+
+    def setUp(self):
+        self.status_cache = OffStudyExistsCache()
+        self.status_cache.invalidate('11111111')
+
+    def test_value_cached(self):
+        self.assertFalse(self.status_cache.exists('11111111'))
+        with self.assertNumQueries(0):
+            self.assertFalse(self.status_cache.exists('11111111'))
+
+    def test_invalidated_on_save(self):
+        self.assertFalse(self.status_cache.exists('11111111'))
+        offstudy = OffStudy.objects.create(subject_identifier='11111111')
+        self.assertTrue(self.status_cache.exists('11111111'))
+        offstudy.delete()
+        self.assertFalse(self.status_cache.exists('11111111'))
+
+    @override_settings(TEST_OFFSTUDY_EXISTS_CACHE_TIMEOUT=0)
+    def test_cache_disabled(self):
+        self.assertFalse(self.status_cache.exists('11111111'))
+        with self.assertNumQueries(1):
+            self.status_cache.exists('11111111')
+
+
+@tag('ssc')
+class TestSubjectStatusCacheTimeout(TestCase):
+
+    def test_disabled_by_default_with_local_cache(self):
+        with override_settings(CACHES={'default': {
+                'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}):
+            self.assertEqual(OffStudyExistsCache().timeout, 0)
+
+    def test_enabled_by_default_with_shared_cache(self):
+        with override_settings(CACHES={'default': {
+                'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+                'LOCATION': 'cache_table'}}):
+            self.assertEqual(
+                OffStudyExistsCache().timeout, OffStudyExistsCache.default_timeout)
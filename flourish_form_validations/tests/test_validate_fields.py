@@ -0,0 +1,136 @@
+import json
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.http import Http404
+from django.test import RequestFactory, TestCase, tag
+from edc_constants.constants import YES, NO, OTHER
+
+from ..form_validators import HivViralLoadCd4FormValidator
+from ..form_validators import TbPresenceHouseholdMembersFormValidator
+from ..form_validators.registry import ValidatorRegistry
+from ..views import ValidateFieldsView
+
+
+@tag('vf')
+class TestValidateFields(TestCase):
+
+    def test_dependency_graph(self):
+        graph = TbPresenceHouseholdMembersFormValidator.dependency_graph()
+        self.assertEqual(graph['tb_diagnosed'], {'tb_ind_rel'})
+        self.assertEqual(graph['tb_ind_rel'], {'tb_ind_rel', 'tb_ind_other'})
+
+    def test_affected_fields(self):
+        self.assertEqual(
+            HivViralLoadCd4FormValidator.affected_fields(['vl_detectable']),
+            ['vl_detectable', 'hiv_results_quantifier', 'recent_vl_results'])
+
+    def test_required_checked_before_quantifier(self):
+        form_validator = HivViralLoadCd4FormValidator(cleaned_data={
+            'last_vl_known': YES,
+            'vl_detectable': YES,
+            'recent_vl_results': 1000,
+            'hiv_results_quantifier': None,
+            'last_vl_date': '2020-01-01'})
+        with self.assertRaises(ValidationError) as cm:
+            form_validator.validate_rule_table()
+        self.assertEqual(
+            cm.exception.error_dict['hiv_results_quantifier'][0].message,
+            'This field is required.')
+
+    def test_only_affected_rules_run(self):
+        form_validator = TbPresenceHouseholdMembersFormValidator(cleaned_data={
+            'tb_diagnosed': YES,
+            'tb_ind_rel': None,
+            'fever_signs': YES,
+            'fever_ind_rel': None})
+        with self.assertNumQueries(0):
+            self.assertRaises(
+                ValidationError, form_validator.validate_fields, ['tb_diagnosed'])
+        self.assertIn('tb_ind_rel', form_validator._errors)
+        self.assertNotIn('fever_ind_rel', form_validator._errors)
+
+    def test_errors_collected_for_all_affected_fields(self):
+        form_validator = TbPresenceHouseholdMembersFormValidator(cleaned_data={
+            'tb_diagnosed': NO,
+            'tb_ind_rel': OTHER,
+            'tb_ind_other': None})
+        with self.assertRaises(ValidationError) as cm:
+            form_validator.validate_fields(['tb_ind_rel'])
+        self.assertEqual(
+            set(cm.exception.error_dict), {'tb_ind_rel', 'tb_ind_other'})
+
+    def test_valid(self):
+        form_validator = TbPresenceHouseholdMembersFormValidator(cleaned_data={
+            'tb_diagnosed': YES,
+            'tb_ind_rel': 'partner'})
+        try:
+            form_validator.validate_fields(['tb_diagnosed', 'tb_ind_rel'])
+        except ValidationError as e:
+            self.fail(f'ValidationError unexpectedly raised. Got{e}')
+
+
+@tag('vf')
+class TestValidateFieldsView(TestCase):
+
+    def setUp(self):
+        self.user = User.objects.create(username='staff', is_staff=True)
+        self.validators = ValidatorRegistry(lazy={
+            'flourish_form_validations.tbpresencehouseholdmembers':
+                'TbPresenceHouseholdMembersFormValidator',
+            'flourish_form_validations.ultrasound': 'UltrasoundFormValidator'})
+
+    def post(self, validator_name, data):
+        request = RequestFactory().post(
+            '/', data=json.dumps(data), content_type='application/json')
+        request.user = self.user
+        return ValidateFieldsView.as_view(validators=self.validators)(
+            request, validator_name=validator_name)
+
+    def test_errors(self):
+        response = self.post('TbPresenceHouseholdMembersFormValidator', {
+            'cleaned_data': {'tb_diagnosed': YES, 'tb_ind_rel': None},
+            'changed_fields': ['tb_diagnosed']})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content), {
+            'checked': ['tb_ind_rel'],
+            'errors': {'tb_ind_rel': ['This field is required.']}})
+
+    def test_unknown_validator(self):
+        self.assertRaises(Http404, self.post, 'SubjectConsentFormValidator', {
+            'cleaned_data': {}, 'changed_fields': []})
+
+    def test_bad_request(self):
+        response = self.post('TbPresenceHouseholdMembersFormValidator', {})
+        self.assertEqual(response.status_code, 400)
+
+    def test_values_cleaned_by_form_fields(self):
+        response = self.post('UltrasoundFormValidator', {
+            'cleaned_data': {'ga_by_ultrasound_wks': '41'},
+            'changed_fields': ['ga_by_ultrasound_wks']})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['errors'], {
+            'ga_by_ultrasound_wks': [
+                'GA by ultrasound cannot be greater than 40 weeks.']})
+
+    def test_value_not_cleaned_reported(self):
+        response = self.post('UltrasoundFormValidator', {
+            'cleaned_data': {'ga_by_ultrasound_wks': 'forty'},
+            'changed_fields': ['ga_by_ultrasound_wks']})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            list(json.loads(response.content)['errors']),
+            ['ga_by_ultrasound_wks'])
+
+    def test_invalid_choice_reported(self):
+        response = self.post('TbPresenceHouseholdMembersFormValidator', {
+            'cleaned_data': {'tb_diagnosed': 'maybe'},
+            'changed_fields': ['tb_diagnosed']})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('tb_diagnosed', json.loads(response.content)['errors'])
+
+    def test_unknown_field(self):
+        response = self.post('TbPresenceHouseholdMembersFormValidator', {
+            'cleaned_data': {'tb_diagnosed': YES, 'not_a_field': YES},
+            'changed_fields': ['tb_diagnosed']})
+        self.assertEqual(response.status_code, 400)
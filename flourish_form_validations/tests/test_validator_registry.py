@@ -0,0 +1,55 @@
+from django.test import SimpleTestCase, tag
+
+from ..form_validators import UltrasoundFormValidator
+from ..form_validators.registry import AlreadyRegistered, NotRegistered
+from ..form_validators.registry import ValidatorRegistry, site_validators
+
+
+@tag('reg')
+class TestValidatorRegistry(SimpleTestCase):
+
+    def test_lazy_lookup(self):
+        registry = ValidatorRegistry(lazy={
+            'flourish_caregiver.ultrasound': 'UltrasoundFormValidator'})
+        self.assertIn('flourish_caregiver.ultrasound', registry)
+        self.assertNotIn('flourish_caregiver.ultrasound', registry.registry)
+        self.assertEqual(
+            registry.get('flourish_caregiver.ultrasound'), UltrasoundFormValidator)
+        self.assertIn('flourish_caregiver.ultrasound', registry.registry)
+
+    def test_dotted_path(self):
+        registry = ValidatorRegistry()
+        registry.register_lazy(
+            'flourish_caregiver.ultrasound',
+            'flourish_form_validations.form_validators.ultrasound_form_validator.'
+            'UltrasoundFormValidator')
+        self.assertEqual(
+            registry.get('flourish_caregiver.ultrasound'), UltrasoundFormValidator)
+
+    def test_register_decorator(self):
+        registry = ValidatorRegistry()
+        registry.register('flourish_caregiver.ultrasound')(UltrasoundFormValidator)
+        self.assertEqual(registry.labels, ['flourish_caregiver.ultrasound'])
+        with self.assertRaises(AlreadyRegistered):
+            registry.register_lazy(
+                'flourish_caregiver.ultrasound', 'UltrasoundFormValidator')
+
+    def test_labels_for(self):
+        registry = ValidatorRegistry(lazy={
+            'flourish_caregiver.ultrasound': 'UltrasoundFormValidator',
+            'flourish_caregiver.covid19': 'Covid19FormValidator'})
+        registry.register('flourish_form_validations.ultrasound')(
+            UltrasoundFormValidator)
+        self.assertEqual(
+            registry.labels_for(UltrasoundFormValidator),
+            ['flourish_caregiver.ultrasound',
+             'flourish_form_validations.ultrasound'])
+        self.assertIn('flourish_caregiver.covid19', registry.lazy)
+
+    def test_not_registered(self):
+        self.assertRaises(
+            NotRegistered, ValidatorRegistry().get, 'flourish_caregiver.ultrasound')
+
+    def test_site_validators_resolve(self):
+        for label in site_validators.labels:
+            self.assertTrue(hasattr(site_validators.get(label), 'clean'))
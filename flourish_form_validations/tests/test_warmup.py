@@ -0,0 +1,27 @@
+from django.test import TestCase, tag
+
+from ..form_validators import UltrasoundFormValidator
+from ..form_validators.model_cls_resolver import model_cls_resolver
+from ..warmup import model_labels, warmup
+
+
+@tag('warmup')
+class TestWarmup(TestCase):
+
+    def setUp(self):
+        model_cls_resolver.clear()
+
+    def test_model_labels(self):
+        self.assertIn(
+            UltrasoundFormValidator.caregiver_offstudy_model,
+            model_labels(UltrasoundFormValidator))
+
+    def test_warmup_resolves_labels(self):
+        result = warmup(['UltrasoundFormValidator'])
+        self.assertEqual(result.validators, 1)
+        self.assertEqual(
+            sorted(result.models + result.missing),
+            sorted(set(model_labels(UltrasoundFormValidator))))
+        for label in result.models:
+            self.assertIn(
+                (UltrasoundFormValidator, label), model_cls_resolver.registry)
@@ -16,6 +16,10 @@ Including another URLconf
 from django.contrib import admin
 from django.urls import path
 
+from .views import ValidateFieldsView
+
 urlpatterns = [
     path('admin/', admin.site.urls),
+    path('validate-fields/<str:validator_name>/',
+         ValidateFieldsView.as_view(), name='validate_fields'),
 ]
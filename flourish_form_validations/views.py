@@ -0,0 +1,87 @@
+import json
+
+from django.apps import apps as django_apps
+from django.contrib.admin.views.decorators import staff_member_required
+from django.core.exceptions import NON_FIELD_ERRORS, ValidationError
+from django.forms import modelform_factory
+from django.http import Http404, HttpResponseBadRequest, JsonResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+
+from . import form_validators
+from .form_validators.registry import site_validators
+from .form_validators.rule_tables import RuleTableMixin
+
+
+@method_decorator(staff_member_required, name='dispatch')
+class ValidateFieldsView(View):
+    """Validates the fields changed on an admin form without a full
+    form POST.
+
+    POST a JSON body of {"cleaned_data": {...}, "changed_fields": [...]}
+    and receive {"checked": [...], "errors": {field: [message, ...]}}.
+    Fields in `checked` that are not in `errors` are valid. Only the
+    rule table is run, see `RuleTableMixin.validate_fields`.
+
+    The posted values are cleaned by the fields of a model form for the
+    model the validator is registered for, so the rules see the same
+    types as on a full form POST. A value that does not clean is
+    reported as an error on its field.
+    """
+
+    http_method_names = ['post']
+    validators = site_validators
+
+    def get_validator_cls(self, validator_name):
+        validator_cls = getattr(form_validators, validator_name, None)
+        if not (isinstance(validator_cls, type)
+                and issubclass(validator_cls, RuleTableMixin)):
+            raise Http404(f'No rule table validator named {validator_name}.')
+        return validator_cls
+
+    def get_form_fields(self, validator_cls):
+        """Returns the form fields of a model form for the first installed
+        model `validator_cls` is registered for.
+        """
+        for label in self.validators.labels_for(validator_cls):
+            try:
+                model_cls = django_apps.get_model(label)
+            except LookupError:
+                continue
+            return modelform_factory(model_cls, fields='__all__')().fields
+        raise Http404(f'No model installed for {validator_cls.__name__}.')
+
+    def clean(self, form_fields, data):
+        """Returns (cleaned_data, errors) for the posted values. Raises
+        KeyError for a field not on the form.
+        """
+        cleaned_data, errors = {}, {}
+        for name, value in data.items():
+            field = form_fields[name]
+            try:
+                cleaned_data[name] = field.clean(value)
+            except ValidationError as e:
+                errors[name] = e.messages
+        return cleaned_data, errors
+
+    def post(self, request, validator_name=None):
+        validator_cls = self.get_validator_cls(validator_name)
+        form_fields = self.get_form_fields(validator_cls)
+        try:
+            data = json.loads(request.body)
+            changed_fields = list(data['changed_fields'])
+            cleaned_data, errors = self.clean(
+                form_fields, dict(data['cleaned_data']))
+        except (ValueError, TypeError, KeyError) as e:
+            return HttpResponseBadRequest(f'Invalid request. Got {e}.')
+        form_validator = validator_cls(cleaned_data=cleaned_data)
+        try:
+            form_validator.validate_fields(changed_fields)
+        except ValidationError as e:
+            message_dict = (e.message_dict if hasattr(e, 'error_dict')
+                            else {NON_FIELD_ERRORS: e.messages})
+            for field, messages in message_dict.items():
+                errors.setdefault(field, messages)
+        return JsonResponse({
+            'checked': validator_cls.affected_fields(changed_fields),
+            'errors': errors})
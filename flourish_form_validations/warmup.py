@@ -0,0 +1,43 @@
+from collections import namedtuple
+
+from . import form_validators
+from .form_validators.model_cls_resolver import model_cls_resolver
+
+WarmupResult = namedtuple('WarmupResult', ['validators', 'models', 'missing'])
+
+
+def model_labels(validator_cls):
+    """Returns the `*_model` labels declared on a validator class.
+    """
+    labels = []
+    for name in dir(validator_cls):
+        value = getattr(validator_cls, name, None)
+        if name.endswith('_model') and isinstance(value, str) and '.' in value:
+            labels.append(value)
+    return labels
+
+
+def warmup(names=None):
+    """Imports the exported validators and resolves their `*_model`
+    labels so a fresh worker does not pay for either on its first
+    request.
+
+    Importing a validator module compiles its rule tables and regex
+    patterns. Labels of models that are not installed are returned in
+    `missing` and otherwise ignored; they fail on use as before.
+    """
+    validators, models, missing = 0, set(), set()
+    for name in (names or form_validators.__all__):
+        validator_cls = getattr(form_validators, name)
+        if not isinstance(validator_cls, type):
+            continue
+        validators += 1
+        for label in model_labels(validator_cls):
+            try:
+                model_cls_resolver.get_model(validator_cls, label)
+            except LookupError:
+                missing.add(label)
+            else:
+                models.add(label)
+    return WarmupResult(validators=validators, models=sorted(models),
+                        missing=sorted(missing))
@@ -22,6 +22,7 @@ setup(
     description='flourish form validations.',
     long_description=README,
     zip_safe=False,
+    extras_require={'columnar': ['numpy']},
     keywords='django flourish',
     classifiers=[
         'Environment :: Web Environment',